@@ -0,0 +1 @@
+"""Benchmarks for the Elimity Insights client distribution."""
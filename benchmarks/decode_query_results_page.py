@@ -0,0 +1,61 @@
+"""Benchmark decoding a page of 2k results with nested link pages, reading only entity identifiers."""
+
+from timeit import timeit
+from typing import Callable, List
+
+from elimity_insights_client.api._decode_query_results_page import (
+    QueryResultDict,
+    QueryResultsPageDict,
+    decode_lazy_query_results_page,
+    decode_query_results_page,
+)
+from elimity_insights_client.api.query_results_page import QueryResultsPage
+
+_size = 2000
+
+
+def main() -> None:
+    """Print the time needed to decode the page eagerly and lazily and collect its entity identifiers."""
+    page = _page(_size, 2)
+    eager_seconds = _time(decode_query_results_page, page)
+    print(f"eager: {eager_seconds:.3f}s")
+    lazy_seconds = _time(decode_lazy_query_results_page, page)
+    print(f"lazy: {lazy_seconds:.3f}s")
+
+
+def _ids(
+    decode: Callable[[QueryResultsPageDict], QueryResultsPage],
+    dict: QueryResultsPageDict,
+) -> List[str]:
+    page = decode(dict)
+    return [result.entity.id for result in page.results]
+
+
+def _time(
+    decode: Callable[[QueryResultsPageDict], QueryResultsPage],
+    dict: QueryResultsPageDict,
+) -> float:
+    return timeit(lambda: _ids(decode, dict), number=5) / 5
+
+
+def _page(size: int, depth: int) -> QueryResultsPageDict:
+    results = [_result(index, depth) for index in range(size)]
+    return {"count": size, "results": results}
+
+
+def _result(index: int, depth: int) -> QueryResultDict:
+    link_pages = [] if depth == 0 else [_page(5, depth - 1)]
+    return {
+        "entity": {"active": True, "id": str(index), "name": f"entity {index}"},
+        "inclusions": [
+            {"type": "dateTime", "value": "2006-05-04T03:02:01Z"},
+            {"type": "number", "value": "42"},
+            {"type": "string", "value": "foo"},
+        ],
+        "linkGroupByPages": [],
+        "linkPages": link_pages,
+    }
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark encoding wide and deep 100k-node expression trees."""
+
+from timeit import timeit
+from typing import List
+
+from elimity_insights_client._util import encoder
+from elimity_insights_client.api._encode_expression import encode_boolean_expression
+from elimity_insights_client.api.expression import (
+    AllBooleanExpression,
+    AnyBooleanExpression,
+    AttributeNumberExpression,
+    BooleanExpression,
+    CmpOperator,
+    LiteralNumberExpression,
+    NotBooleanExpression,
+    NumberCmpBooleanExpression,
+)
+
+_size = 100000
+
+
+def main() -> None:
+    """Print the time needed to encode a wide and a deep tree of 100k nodes to JSON text."""
+    wide = _wide()
+    wide_seconds = timeit(lambda: _encode(wide), number=5) / 5
+    print(f"wide: {wide_seconds:.3f}s")
+    deep = _deep()
+    deep_seconds = timeit(lambda: _encode(deep), number=5) / 5
+    print(f"deep: {deep_seconds:.3f}s")
+
+
+def _encode(expression: BooleanExpression) -> str:
+    json = encode_boolean_expression(expression)
+    return encoder.encode(json)
+
+
+def _deep() -> BooleanExpression:
+    expr: BooleanExpression = _leaf(0)
+    for index in range(_size // 5):
+        exprs = [expr, _leaf(index)]
+        expr = NotBooleanExpression(AllBooleanExpression(exprs))
+    return expr
+
+
+def _leaf(index: int) -> BooleanExpression:
+    lhs = AttributeNumberExpression("foo", "")
+    rhs = LiteralNumberExpression(index)
+    return NumberCmpBooleanExpression(lhs, CmpOperator.GT, rhs)
+
+
+def _wide() -> BooleanExpression:
+    exprs: List[BooleanExpression] = []
+    for index in range(_size // 31):
+        leaves = [_leaf(index) for _ in range(10)]
+        exprs.append(AnyBooleanExpression(leaves))
+    return AllBooleanExpression(exprs)
+
+
+if __name__ == "__main__":
+    main()
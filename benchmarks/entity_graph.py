@@ -0,0 +1,101 @@
+"""Benchmark reachability over 50k users and their groups and roles, using entity links and a compact graph."""
+
+from collections import deque
+from random import Random
+from timeit import timeit
+from tracemalloc import get_traced_memory, start, stop
+from typing import Deque, Dict, List, Mapping, Set, Tuple
+
+from elimity_insights_client.api.entities._entity import Entity, EntityType, Link
+from elimity_insights_client.api.entities._graph import entity_graph
+from elimity_insights_client.api.query_results_page import Value
+
+_group_count = 5000
+_group_type = EntityType("group", 0)
+_role_count = 500
+_role_type = EntityType("role", 0)
+_user_count = 50000
+_user_type = EntityType("user", 0)
+
+_Key = Tuple[EntityType, str]
+
+
+def main() -> None:
+    """Print the memory needed for each adjacency and the time needed for reachability from 2 users."""
+    entities = _entities()
+    start()
+    adjacency = _adjacency(entities)
+    adjacency_peak, _ = get_traced_memory()
+    stop()
+    start()
+    graph = entity_graph(entities)
+    graph_peak, _ = get_traced_memory()
+    stop()
+    print(f"dicts: {adjacency_peak / 2 ** 20:.0f} MiB")
+    print(f"graph: {graph_peak / 2 ** 20:.0f} MiB")
+
+    user_ids = [str(user) for user in range(0, _user_count, _user_count // 2)]
+    keys = [(_user_type, id) for id in user_ids]
+    nodes = [graph.node(_user_type, id) for id in user_ids]
+    dict_seconds = timeit(
+        lambda: [_reachable(adjacency, key) for key in keys], number=5
+    )
+    print(f"dicts: {dict_seconds / 5:.3f}s")
+    graph_seconds = timeit(lambda: [graph.reachable(node) for node in nodes], number=5)
+    print(f"graph: {graph_seconds / 5:.3f}s")
+
+
+def _adjacency(entities: Mapping[EntityType, List[Entity]]) -> Dict[_Key, List[_Key]]:
+    return {
+        (entity_type, entity.id): [
+            (link_type, link.id)
+            for link_type, links in entity.links.items()
+            for link in links
+        ]
+        for entity_type, ents in entities.items()
+        for entity in ents
+    }
+
+
+def _entities() -> Dict[EntityType, List[Entity]]:
+    random = Random(42)
+    assignments: Dict[str, Value] = {}
+    group_users: List[List[Link]] = [[] for _ in range(_group_count)]
+    users: List[Entity] = []
+    for user in range(_user_count):
+        user_link = Link(assignments, str(user), "")
+        group_links: List[Link] = []
+        for _ in range(20):
+            group = random.randrange(_group_count)
+            group_users[group].append(user_link)
+            group_link = Link(assignments, str(group), "")
+            group_links.append(group_link)
+        user_links = {_group_type: group_links}
+        user_entity = Entity(assignments, str(user), user_links, "")
+        users.append(user_entity)
+
+    groups: List[Entity] = []
+    for group, group_user_links in enumerate(group_users):
+        role_links = [
+            Link(assignments, str(random.randrange(_role_count)), "") for _ in range(5)
+        ]
+        links = {_role_type: role_links, _user_type: group_user_links}
+        group_entity = Entity(assignments, str(group), links, "")
+        groups.append(group_entity)
+    return {_user_type: users, _group_type: groups}
+
+
+def _reachable(adjacency: Dict[_Key, List[_Key]], key: _Key) -> Set[_Key]:
+    reached = {key}
+    queue: Deque[_Key] = deque([key])
+    while queue:
+        current = queue.popleft()
+        for target in adjacency.get(current, []):
+            if target not in reached:
+                reached.add(target)
+                queue.append(target)
+    return reached
+
+
+if __name__ == "__main__":
+    main()
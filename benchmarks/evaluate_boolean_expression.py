@@ -0,0 +1,67 @@
+"""Benchmark evaluating a compiled condition over columns of 100k entities."""
+
+from timeit import timeit
+from typing import Dict, List
+
+from elimity_insights_client.api._evaluate import compile_boolean_expression
+from elimity_insights_client.api.entities._columns import entities_columns
+from elimity_insights_client.api.entities._entity import Entity
+from elimity_insights_client.api.expression import (
+    AllBooleanExpression,
+    AssignedBooleanExpression,
+    AttributeNumberExpression,
+    AttributeStringExpression,
+    CmpOperator,
+    LiteralNumberExpression,
+    LiteralStringExpression,
+    MatchBooleanExpression,
+    MatchMode,
+    MatchOperator,
+    NotBooleanExpression,
+    NumberCmpBooleanExpression,
+)
+from elimity_insights_client.api.query_results_page import (
+    NumberValue,
+    StringValue,
+    Value,
+)
+
+_size = 100000
+
+
+def main() -> None:
+    """Print the time needed to evaluate a conjunction of a comparison, a match and a negation."""
+    columns = entities_columns(_entities())
+    age = AttributeNumberExpression("age", "")
+    forty = LiteralNumberExpression(40)
+    old = NumberCmpBooleanExpression(age, CmpOperator.GTE, forty)
+    email = AttributeStringExpression("email", "")
+    domain = LiteralStringExpression("@example.com")
+    example = MatchBooleanExpression(
+        email, MatchMode.CASE_INSENSITIVE, MatchOperator.ENDS_WITH, domain
+    )
+    admin = AssignedBooleanExpression("admin", "")
+    not_admin = NotBooleanExpression(admin)
+    expression = AllBooleanExpression([old, example, not_admin])
+    condition = compile_boolean_expression(expression)
+    seconds = timeit(lambda: condition(columns), number=5) / 5
+    print(f"evaluate: {seconds:.3f}s")
+
+
+def _entities() -> List[Entity]:
+    entities: List[Entity] = []
+    for index in range(_size):
+        domain = "example.com" if index % 3 else "example.org"
+        assignments: Dict[str, Value] = {
+            "age": NumberValue(index % 80),
+            "email": StringValue(f"user{index}@{domain}"),
+        }
+        if index % 10 == 0:
+            assignments["admin"] = NumberValue(1)
+        entity = Entity(assignments, str(index), {}, f"user {index}")
+        entities.append(entity)
+    return entities
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark parsing 5k entities that all link to the same 50 groups, with and without interning links."""
+
+from timeit import timeit
+from tracemalloc import get_traced_memory, start, stop
+from typing import Callable, List
+
+from elimity_insights_client._domain_graph_schema import (
+    AttributeType,
+    DomainGraphSchema,
+    EntityType,
+    Type,
+)
+from elimity_insights_client._schema_index import schema_index
+from elimity_insights_client.api._decode_query_results_page import (
+    QueryResultDict,
+    QueryResultsPageDict,
+    ValueDict,
+    decode_lazy_query_results_page,
+    decode_query_results_page,
+)
+from elimity_insights_client.api.entities._entity import Entity
+from elimity_insights_client.api.entities._entity import EntityType as KeyEntityType
+from elimity_insights_client.api.entities._parse_query_results_page import (
+    parse_query_results_page,
+)
+
+_attribute_count = 10
+_group_count = 50
+_size = 5000
+
+
+def main() -> None:
+    """Print the time and peak memory needed to decode and parse the page in both modes."""
+    page = _page()
+    schemas = {0: _schema()}
+    index = schema_index(schemas)
+    entity_type = KeyEntityType("user", 0)
+
+    def parse() -> List[Entity]:
+        decoded_page = decode_query_results_page(page)
+        return parse_query_results_page(entity_type, decoded_page, index)
+
+    def parse_interned() -> List[Entity]:
+        decoded_page = decode_lazy_query_results_page(page)
+        return parse_query_results_page(entity_type, decoded_page, index, True)
+
+    _report("default", parse)
+    _report("interned", parse_interned)
+
+
+def _attribute_types(entity_type: str) -> List[AttributeType]:
+    return [
+        AttributeType(False, "", entity_type, str(attribute), "", Type.NUMBER)
+        for attribute in range(_attribute_count)
+    ]
+
+
+def _inclusions() -> List[ValueDict]:
+    inclusions: List[ValueDict] = []
+    for attribute in range(_attribute_count):
+        inclusions.append({"type": "boolean", "value": "true"})
+        inclusions.append({"type": "number", "value": str(attribute)})
+    return inclusions
+
+
+def _page() -> QueryResultsPageDict:
+    groups: List[QueryResultDict] = [
+        {
+            "entity": {"active": True, "id": str(group), "name": f"group {group}"},
+            "inclusions": _inclusions(),
+            "linkGroupByPages": [],
+            "linkPages": [],
+        }
+        for group in range(_group_count)
+    ]
+    results: List[QueryResultDict] = [
+        {
+            "entity": {"active": True, "id": str(user), "name": f"user {user}"},
+            "inclusions": _inclusions(),
+            "linkGroupByPages": [],
+            "linkPages": [{"count": _group_count, "results": groups}],
+        }
+        for user in range(_size)
+    ]
+    return {"count": _size, "results": results}
+
+
+def _report(name: str, parse: Callable[[], List[Entity]]) -> None:
+    seconds = timeit(parse, number=5) / 5
+    start()
+    entities = parse()
+    _, peak = get_traced_memory()
+    stop()
+    del entities
+    print(f"{name}: {seconds:.3f}s, {peak / 2 ** 20:.0f} MiB")
+
+
+def _schema() -> DomainGraphSchema:
+    user_type = EntityType(False, "", "user", "", "")
+    group_type = EntityType(False, "", "group", "", "")
+    entity_types = [user_type, group_type]
+    attribute_types = _attribute_types("user") + _attribute_types("group")
+    return DomainGraphSchema(attribute_types, entity_types, [])
+
+
+if __name__ == "__main__":
+    main()
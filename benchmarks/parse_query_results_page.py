@@ -0,0 +1,78 @@
+"""Benchmark parsing a page of 10k results to entities, for a schema of 100 entity types with 10 attributes each."""
+
+from timeit import timeit
+from typing import Dict, List
+
+from elimity_insights_client._domain_graph_schema import (
+    AttributeType,
+    DomainGraphSchema,
+    EntityType,
+    Type,
+)
+from elimity_insights_client._schema_index import schema_index
+from elimity_insights_client.api.entities._entity import EntityType as KeyEntityType
+from elimity_insights_client.api.entities._parse_query_results_page import (
+    parse_query_results_page,
+)
+from elimity_insights_client.api.query_results_page import (
+    BooleanValue,
+    Entity,
+    GroupByQueryResultsPage,
+    NumberValue,
+    QueryResult,
+    QueryResultsPage,
+    Value,
+)
+
+_attribute_count = 10
+_entity_type_count = 100
+_size = 10000
+
+
+def main() -> None:
+    """Print the time needed to parse the page, including building the schema index."""
+    schemas = _schemas()
+    page = _page()
+    entity_type = KeyEntityType("0", 0)
+
+    def parse() -> None:
+        index = schema_index(schemas)
+        parse_query_results_page(entity_type, page, index)
+
+    seconds = timeit(parse, number=5) / 5
+    print(f"parse: {seconds:.3f}s")
+
+
+def _page() -> QueryResultsPage:
+    empty_page = QueryResultsPage(0, [])
+    group_by_pages: List[GroupByQueryResultsPage] = []
+    inclusions: List[Value] = []
+    for attribute in range(_attribute_count):
+        inclusions.extend([BooleanValue(True), NumberValue(attribute)])
+    link_pages = [empty_page] * (_entity_type_count - 1)
+    results = [
+        QueryResult(
+            Entity(True, str(index), str(index)), inclusions, group_by_pages, link_pages
+        )
+        for index in range(_size)
+    ]
+    return QueryResultsPage(_size, results)
+
+
+def _schemas() -> Dict[int, DomainGraphSchema]:
+    attribute_types: List[AttributeType] = []
+    entity_types: List[EntityType] = []
+    for entity_type in range(_entity_type_count):
+        id = str(entity_type)
+        entity_types.append(EntityType(False, "", id, "", ""))
+        for attribute in range(_attribute_count):
+            attribute_type = AttributeType(
+                False, "", id, str(attribute), "", Type.NUMBER
+            )
+            attribute_types.append(attribute_type)
+    schema = DomainGraphSchema(attribute_types, entity_types, [])
+    return {0: schema}
+
+
+if __name__ == "__main__":
+    main()
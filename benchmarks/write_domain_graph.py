@@ -0,0 +1,115 @@
+"""Benchmark writing 20k entities and 20k relationships to CSV shards, for 80 entity types with 25 attributes each."""
+
+from json import dumps
+from os.path import join
+from tempfile import TemporaryDirectory
+from timeit import timeit
+from typing import List, Optional
+
+from elimity_insights_client._elimity_insights_client import (
+    AttributeAssignment,
+    DomainGraph,
+    Entity,
+    NumberValue,
+    Relationship,
+    StringValue,
+)
+from elimity_insights_client.csv import write_domain_graph
+
+_attribute_count = 25
+_entity_type_count = 80
+_size = 20000
+
+
+def main() -> None:
+    """Print the time needed to write the graph with and without compression and worker threads."""
+    entities = _entities()
+    relationships = _relationships()
+    graph = DomainGraph(entities, relationships)
+    schema_json = _schema_json()
+    _report("plain", graph, schema_json, False, None)
+    _report("gzip", graph, schema_json, True, None)
+    _report("gzip, 4 workers", graph, schema_json, True, 4)
+
+
+def _entities() -> List[Entity]:
+    entities: List[Entity] = []
+    for number in range(_size):
+        entity_type = str(number % _entity_type_count)
+        assignments = [
+            AttributeAssignment(str(attribute), NumberValue(attribute))
+            for attribute in range(0, _attribute_count - 1, 3)
+        ]
+        name = AttributeAssignment("name", StringValue(f'entity "{number}", wide'))
+        assignments.append(name)
+        entity = Entity(assignments, str(number), f"entity {number}", entity_type)
+        entities.append(entity)
+    return entities
+
+
+def _relationships() -> List[Relationship]:
+    return [
+        Relationship(
+            [],
+            str(entity),
+            str(entity % _entity_type_count),
+            str(entity + 1),
+            str((entity + 1) % _entity_type_count),
+        )
+        for entity in range(_size)
+    ]
+
+
+def _report(
+    name: str,
+    graph: DomainGraph,
+    schema_json: str,
+    compress: bool,
+    max_workers: Optional[int],
+) -> None:
+    with TemporaryDirectory() as dir:
+        filename = join(dir, "graph.csv")
+
+        def write() -> None:
+            write_domain_graph(
+                filename, graph, schema_json, compress, max_workers, shard_size=5000
+            )
+
+        seconds = timeit(write, number=5) / 5
+    print(f"{name}: {seconds:.3f}s")
+
+
+def _schema_json() -> str:
+    attribute_types = [
+        {
+            "archived": False,
+            "description": "",
+            "entityTypeId": str(entity_type),
+            "id": attribute,
+            "name": attribute,
+            "type": "number",
+        }
+        for entity_type in range(_entity_type_count)
+        for attribute in [str(attribute) for attribute in range(_attribute_count - 1)]
+        + ["name"]
+    ]
+    entity_types = [
+        {
+            "anonymized": False,
+            "icon": "",
+            "id": str(entity_type),
+            "plural": "",
+            "singular": "",
+        }
+        for entity_type in range(_entity_type_count)
+    ]
+    schema = {
+        "entityAttributeTypes": attribute_types,
+        "entityTypes": entity_types,
+        "relationshipAttributeTypes": [],
+    }
+    return dumps(schema)
+
+
+if __name__ == "__main__":
+    main()
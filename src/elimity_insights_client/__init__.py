@@ -13,6 +13,8 @@ from elimity_insights_client._domain_graph_schema import (
     Type,
 )
 from elimity_insights_client._elimity_insights_client import (
+    AsyncClient,
+    AsyncDomainGraph,
     AttributeAssignment,
     BooleanValue,
     Certificate,
@@ -33,6 +35,8 @@ from elimity_insights_client._elimity_insights_client import (
 )
 
 __all__ = [
+    "AsyncClient",
+    "AsyncDomainGraph",
     "AttributeAssignment",
     "AttributeType",
     "BooleanValue",
@@ -0,0 +1,253 @@
+from asyncio import (
+    IncompleteReadError,
+    Semaphore,
+    StreamReader,
+    StreamWriter,
+    TimeoutError,
+    open_connection,
+    wait_for,
+)
+from base64 import b64encode
+from ssl import CERT_NONE, SSLContext, create_default_context
+from typing import AsyncIterable, Awaitable, Dict, List, Optional, Tuple, TypeVar, Union
+from urllib.parse import urlsplit
+from zlib import MAX_WBITS, decompress
+
+from requests import ConnectionError, ConnectTimeout, HTTPError, ReadTimeout
+
+_Connection = Tuple[StreamReader, StreamWriter]
+_Data = Union[None, bytes, AsyncIterable[bytes]]
+_T = TypeVar("_T")
+
+
+class ConnectionPool:
+    """Pool of keep-alive HTTP/1.1 connections to a single server, shared by concurrent asyncio tasks."""
+
+    def __init__(
+        self,
+        url: str,
+        max_connections: int,
+        verify_ssl: bool,
+        certificate: Optional[Tuple[str, str]] = None,
+        connect_timeout: float = 10,
+        read_timeout: float = 300,
+    ) -> None:
+        """
+        Return a new pool without open connections for the server at the given URL.
+
+        At most max_connections requests are performed concurrently, each using its own connection. If a
+        certificate is given as a pair of paths to a certificate and a private key, it is presented to the server.
+        Opening a connection raises a requests.ConnectTimeout after connect_timeout seconds, and waiting for data
+        from the server raises a requests.ReadTimeout after read_timeout seconds.
+        """
+        split = urlsplit(url)
+        tls = split.scheme == "https"
+        default_port = 443 if tls else 80
+        _, _, self._authority = split.netloc.rpartition("@")
+        self._connect_timeout = connect_timeout
+        self._host = split.hostname or ""
+        self._idle: List[_Connection] = []
+        self._max_connections = max_connections
+        self._path = split.path.rstrip("/")
+        self._port = split.port or default_port
+        self._read_timeout = read_timeout
+        self._semaphore: Optional[Semaphore] = None
+        self._ssl = _ssl_context(verify_ssl, certificate) if tls else None
+        self._url = url.rstrip("/")
+
+    async def close(self) -> None:
+        """Close all idle connections of this pool."""
+        idle = self._idle
+        self._idle = []
+        for _, writer in idle:
+            writer.close()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        auth: Tuple[str, str],
+        headers: Dict[str, str],
+        data: _Data,
+    ) -> bytes:
+        """
+        Perform a request with the given properties and return the body of the response.
+
+        If the given data is an async iterable, its chunks are sent as they are generated using chunked transfer
+        encoding, over a new connection. If the response indicates an error, a requests.HTTPError is raised. If the
+        calling task is cancelled, the connection used by the request is closed instead of being returned to the
+        pool.
+        """
+        if self._semaphore is None:
+            self._semaphore = Semaphore(self._max_connections)
+        full_path = self._path + path
+        head = _encode_head(method, full_path, self._authority, auth, headers, data)
+        async with self._semaphore:
+            status, reason, body = await self._exchange(head, data)
+        if status >= 400:
+            kind = "Client" if status < 500 else "Server"
+            message = f"{status} {kind} Error: {reason} for url: {self._url}{path}"
+            raise HTTPError(message)
+        return body
+
+    async def _exchange(self, head: bytes, data: _Data) -> Tuple[int, str, bytes]:
+        while self._idle and (data is None or isinstance(data, bytes)):
+            connection = self._idle.pop()
+            try:
+                return await self._send(connection, head, data)
+            except _StaleConnectionError:
+                continue
+
+        opening = open_connection(self._host, self._port, ssl=self._ssl)
+        try:
+            connection = await wait_for(opening, self._connect_timeout)
+        except TimeoutError as error:
+            raise ConnectTimeout(f"Connecting to {self._url} timed out") from error
+        try:
+            return await self._send(connection, head, data)
+        except _StaleConnectionError as error:
+            raise ConnectionError("Connection closed by server") from error
+
+    async def _send(
+        self, connection: _Connection, head: bytes, data: _Data
+    ) -> Tuple[int, str, bytes]:
+        reader, writer = connection
+        keep_alive = False
+        try:
+            try:
+                writer.write(head)
+                await _write_body(writer, data)
+                reading = reader.readuntil(b"\r\n\r\n")
+                response_head = await self._read(reading)
+            except IncompleteReadError as error:
+                if error.partial:
+                    raise
+                raise _StaleConnectionError() from error
+            except (BrokenPipeError, ConnectionResetError) as error:
+                raise _StaleConnectionError() from error
+
+            status, reason, headers = _decode_head(response_head)
+            body, keep_alive = await self._read(_read_body(reader, status, headers))
+            return status, reason, body
+        finally:
+            if keep_alive:
+                self._idle.append(connection)
+            else:
+                writer.close()
+
+    async def _read(self, reading: Awaitable[_T]) -> _T:
+        try:
+            return await wait_for(reading, self._read_timeout)
+        except TimeoutError as error:
+            raise ReadTimeout(f"Reading from {self._url} timed out") from error
+
+
+class _StaleConnectionError(Exception):
+    pass
+
+
+def _decode_body(body: bytes, headers: Dict[str, str]) -> bytes:
+    encoding = headers.get("content-encoding", "identity")
+    if encoding == "gzip":
+        return decompress(body, 16 + MAX_WBITS)
+    if encoding == "deflate":
+        return decompress(body)
+    return body
+
+
+def _decode_head(head: bytes) -> Tuple[int, str, Dict[str, str]]:
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    _, status, *reason = status_line.split(" ", 2)
+    headers: Dict[str, str] = {}
+    for line in header_lines:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    return int(status), "".join(reason), headers
+
+
+def _encode_head(
+    method: str,
+    path: str,
+    authority: str,
+    auth: Tuple[str, str],
+    headers: Dict[str, str],
+    data: _Data,
+) -> bytes:
+    credentials = ":".join(auth).encode()
+    authorization = b64encode(credentials).decode()
+    all_headers = {
+        "Accept-Encoding": "gzip, deflate",
+        "Authorization": f"Basic {authorization}",
+        "Connection": "keep-alive",
+        "Host": authority,
+        **headers,
+    }
+    if isinstance(data, bytes):
+        all_headers["Content-Length"] = str(len(data))
+    elif data is not None:
+        all_headers["Transfer-Encoding"] = "chunked"
+    lines = [f"{method} {path or '/'} HTTP/1.1"]
+    lines.extend(f"{name}: {value}" for name, value in all_headers.items())
+    text = "\r\n".join(lines) + "\r\n\r\n"
+    return text.encode("latin-1")
+
+
+async def _read_body(
+    reader: StreamReader, status: int, headers: Dict[str, str]
+) -> Tuple[bytes, bool]:
+    keep_alive = headers.get("connection", "").lower() != "close"
+    if status < 200 or status in _bodyless_statuses:
+        return b"", keep_alive
+    if "chunked" in headers.get("transfer-encoding", ""):
+        chunks: List[bytes] = []
+        while True:
+            size_line = await reader.readuntil(b"\r\n")
+            size = int(size_line.split(b";")[0], 16)
+            if size == 0:
+                break
+            chunk = await reader.readexactly(size + 2)
+            chunks.append(chunk[:-2])
+        while await reader.readuntil(b"\r\n") != b"\r\n":
+            pass
+        body = b"".join(chunks)
+    elif "content-length" in headers:
+        length = int(headers["content-length"])
+        body = await reader.readexactly(length)
+    else:
+        body = await reader.read()
+        keep_alive = False
+    return _decode_body(body, headers), keep_alive
+
+
+def _ssl_context(
+    verify_ssl: bool, certificate: Optional[Tuple[str, str]]
+) -> SSLContext:
+    context = create_default_context()
+    if not verify_ssl:
+        context.check_hostname = False
+        context.verify_mode = CERT_NONE
+    if certificate is not None:
+        certificate_path, private_key_path = certificate
+        context.load_cert_chain(certificate_path, private_key_path)
+    return context
+
+
+async def _write_body(writer: StreamWriter, data: _Data) -> None:
+    if data is None or isinstance(data, bytes):
+        if data is not None:
+            writer.write(data)
+        await writer.drain()
+        return
+
+    async for chunk in data:
+        if chunk:
+            writer.write(b"%x\r\n" % len(chunk))
+            writer.write(chunk)
+            writer.write(b"\r\n")
+            await writer.drain()
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+_bodyless_statuses = {204, 304}
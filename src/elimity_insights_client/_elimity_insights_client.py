@@ -1,17 +1,149 @@
+from asyncio import get_running_loop
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, auto
 from itertools import chain
-from typing import Dict, Iterable, Optional, Tuple, Union
+from json import loads
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from zlib import compressobj
 
 from requests import Response, request
 
+from elimity_insights_client._async_http import ConnectionPool
 from elimity_insights_client._decode_domain_graph_schema import (
     decode_domain_graph_schema,
 )
 from elimity_insights_client._domain_graph_schema import DomainGraphSchema
-from elimity_insights_client._util import encode_datetime, encoder
+from elimity_insights_client._util import encode_datetime, encoder, prefetch
+
+_T = TypeVar("_T")
+
+
+class AsyncClient:
+    """Client for connector interactions with an Elimity Insights server from asyncio code."""
+
+    def __init__(
+        self, config: "Config", batch_size: int = 1000, max_connections: int = 10
+    ) -> None:
+        """
+        Return a new client with the given configuration.
+
+        Domain graphs are encoded and compressed in batches of batch_size entities or relationships, and at most
+        max_connections requests are performed concurrently.
+        """
+        self._batch_size = batch_size
+        self._config = config
+        certificate = _cert(config.certificate)
+        self._pool = ConnectionPool(
+            config.url, max_connections, config.verify_ssl, certificate
+        )
+
+    async def __aenter__(self) -> "AsyncClient":
+        """Return this client."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Close this client."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the idle connections of this client."""
+        await self._pool.close()
+
+    async def create_connector_logs(self, logs: Iterable["ConnectorLog"]) -> None:
+        """Create connector logs."""
+        json = map(_encode_connector_log, logs)
+        json_string = encoder.encode(json)
+        json_bytes = json_string.encode()
+        await self._request("application/json", json_bytes, "POST", "connector-logs")
+
+    async def get_domain_graph_schema(self) -> "DomainGraphSchema":
+        """Retrieve the domain graph schema."""
+        body = await self._request(None, None, "GET", "domain-graph-schema")
+        json = loads(body)
+        return decode_domain_graph_schema(json)
+
+    async def reload_domain_graph(self, graph: "AsyncDomainGraph") -> None:
+        """
+        Reload a domain graph.
+
+        This method streams the given domain graph's entities and relationships to the server while they are
+        being generated, always exhausting its entities before iterating its relationships. Batches are encoded
+        and compressed in the default executor of the event loop, while the next batch is being generated and the
+        previous one is being uploaded.
+        """
+        chunks = self._compress_domain_graph(graph)
+        data = prefetch(chunks, 2)
+        await self._request("application/octet-stream", data, "POST", "snapshots")
+
+    async def _compress_domain_graph(
+        self, graph: "AsyncDomainGraph"
+    ) -> AsyncIterator[bytes]:
+        compress = compressobj()
+        loop = get_running_loop()
+
+        def encode(prefix: str, json: Iterable[object]) -> bytes:
+            strings = map(encoder.encode, json)
+            string = prefix + ", ".join(strings)
+            return compress.compress(string.encode())
+
+        entity_batches = _batches(graph.entities, self._batch_size)
+        pending = '{"entities": ['
+        separator = ""
+        async for entities in prefetch(entity_batches, 2):
+            json = map(_encode_entity, entities)
+            yield await loop.run_in_executor(None, encode, pending + separator, json)
+            pending = ""
+            separator = ", "
+
+        relationship_batches = _batches(graph.relationships, self._batch_size)
+        pending += '], "relationships": ['
+        separator = ""
+        async for relationships in prefetch(relationship_batches, 2):
+            json = map(_encode_relationship, relationships)
+            yield await loop.run_in_executor(None, encode, pending + separator, json)
+            pending = ""
+            separator = ", "
+
+        pending += "]"
+        if graph.timestamp is not None:
+            history_timestamp = _encode_date_time(graph.timestamp)
+            pending += ', "historyTimestamp": ' + encoder.encode(history_timestamp)
+        string = pending + "}"
+        yield compress.compress(string.encode()) + compress.flush()
+
+    async def _request(
+        self,
+        content_type: Optional[str],
+        data: Union[None, bytes, AsyncIterable[bytes]],
+        method: str,
+        path: str,
+    ) -> bytes:
+        config = self._config
+        id_ = config.id
+        auth = str(id_), config.token
+        headers = {} if content_type is None else {"Content-Type": content_type}
+        path = f"/api/sources/{id_}/{path}"
+        return await self._pool.request(method, path, auth, headers, data)
+
+
+@dataclass
+class AsyncDomainGraph:
+    """Snapshot of a complete domain graph at a specific timestamp, generated by async iterables."""
+
+    entities: AsyncIterable["Entity"]
+    relationships: AsyncIterable["Relationship"]
+    timestamp: Optional["DateTime"] = None
 
 
 @dataclass
@@ -214,6 +346,17 @@ Value = Union[
 ]
 
 
+async def _batches(iterable: AsyncIterable[_T], size: int) -> AsyncIterator[List[_T]]:
+    batch: List[_T] = []
+    async for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 def _cert(certificate: Optional[Certificate]) -> Optional[Tuple[str, str]]:
     if certificate is None:
         return None
@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from elimity_insights_client._domain_graph_schema import (
+    AttributeType,
+    DomainGraphSchema,
+)
+
+_cache_size = 16
+
+
+@dataclass(frozen=True)
+class SchemaIndex:
+    """
+    Immutable lookups precomputed from domain graph schemas by source id.
+
+    Entity types are keyed by pairs of a source id and an entity type id, attribute types by triples of a source
+    id, an entity type id and an attribute type id. Columns follow the layout of CSV files: an id and a name column
+    for each entity type, followed by a column for each attribute type, including archived ones.
+    """
+
+    attribute_columns: Mapping[Tuple[int, str, str], int]
+    attribute_types: Mapping[Tuple[int, str], Sequence[AttributeType]]
+    column_count: int
+    entity_columns: Mapping[Tuple[int, str], int]
+    entity_types: Sequence[Tuple[int, str]]
+    schemas: Mapping[int, DomainGraphSchema]
+
+
+def schema_index(schemas: Mapping[int, DomainGraphSchema]) -> SchemaIndex:
+    """
+    Return the index for the given schemas by source id.
+
+    Indexes are cached by the identity of the given schemas, so the index of unchanged schemas is built only once.
+    """
+    key = tuple((source_id, id(schema)) for source_id, schema in schemas.items())
+    with _lock:
+        index = _cache.pop(key, None)
+        if index is not None:
+            _cache[key] = index
+            return index
+
+    index = _build(schemas)
+    with _lock:
+        _cache[key] = index
+        if len(_cache) > _cache_size:
+            oldest = next(iter(_cache))
+            del _cache[oldest]
+    return index
+
+
+def _build(schemas: Mapping[int, DomainGraphSchema]) -> SchemaIndex:
+    attribute_types: Dict[Tuple[int, str], List[AttributeType]] = {}
+    entity_columns: Dict[Tuple[int, str], int] = {}
+    entity_types: List[Tuple[int, str]] = []
+    for source_id, schema in schemas.items():
+        for entity_type in schema.entity_types:
+            key = source_id, entity_type.id
+            entity_columns.setdefault(key, 2 * len(entity_types))
+            entity_types.append(key)
+        for attribute_type in schema.attribute_types:
+            if not attribute_type.archived:
+                key = source_id, attribute_type.entity_type
+                attribute_types.setdefault(key, []).append(attribute_type)
+
+    attribute_columns: Dict[Tuple[int, str, str], int] = {}
+    column_count = 2 * len(entity_types)
+    for source_id, schema in schemas.items():
+        for attribute_type in schema.attribute_types:
+            attribute_key = source_id, attribute_type.entity_type, attribute_type.id
+            attribute_columns.setdefault(attribute_key, column_count)
+            column_count += 1
+
+    schemas_copy = dict(schemas)
+    return SchemaIndex(
+        attribute_columns,
+        attribute_types,
+        column_count,
+        entity_columns,
+        entity_types,
+        schemas_copy,
+    )
+
+
+_cache: Dict[Tuple[Tuple[int, int], ...], SchemaIndex] = {}
+_lock = Lock()
@@ -1,8 +1,12 @@
-from datetime import datetime
-from typing import Callable, List, TypeVar
+from asyncio import Queue, ensure_future
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time, timedelta, timezone
+from typing import AsyncIterable, AsyncIterator, Callable, List, Tuple, TypeVar, cast
 
 from dateutil.tz import tzlocal
 from dateutil.utils import default_tzinfo
+from requests import Session
+from requests.adapters import HTTPAdapter
 from simplejson import JSONEncoder
 
 encoder = JSONEncoder(iterable_as_array=True)
@@ -18,7 +22,71 @@ def encode_datetime(datetime: datetime) -> object:
     return dat.isoformat()
 
 
+def localize_time(time: time) -> time:
+    """Return the given time, with the current UTC offset of the local timezone if it is naive."""
+    if time.tzinfo is not None:
+        return time
+    now = datetime.now(local_timezone)
+    offset = cast(timedelta, now.utcoffset())
+    tzinfo = timezone(offset)
+    return time.replace(tzinfo=tzinfo)
+
+
+def map_concurrently(
+    callable: Callable[[Session, "_T"], "_U"], iterable: List["_T"], max_workers: int
+) -> List["_U"]:
+    """
+    Apply the given function to each item in the given list concurrently, and construct a new list from the results.
+
+    The function is called by at most max_workers threads, together with a session whose connection pool is large
+    enough for all of them.
+    """
+    with Session() as session:
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        def call(item: _T) -> _U:
+            return callable(session, item)
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            iterator = executor.map(call, iterable)
+            return list(iterator)
+
+
 def map_list(callable: Callable[["_T"], "_U"], iterable: List["_T"]) -> List["_U"]:
     """Apply the given function to each item in the given list, and construct a new list from the results."""
     iterator = map(callable, iterable)
     return list(iterator)
+
+
+async def prefetch(iterable: AsyncIterable["_T"], size: int) -> AsyncIterator["_T"]:
+    """
+    Generate the items of the given async iterable, consuming it in a separate task.
+
+    The task runs ahead of the caller by at most size items, so producing and consuming items overlap. Exceptions
+    raised by the iterable are raised to the caller, and closing the generator cancels the task.
+    """
+    queue: "Queue[Tuple[bool, object]]" = Queue(size)
+
+    async def produce() -> None:
+        try:
+            async for item in iterable:
+                await queue.put((False, item))
+        except Exception as error:
+            await queue.put((True, error))
+        else:
+            await queue.put((True, None))
+
+    task = ensure_future(produce())
+    try:
+        while True:
+            done, value = await queue.get()
+            if not done:
+                yield cast(_T, value)
+            elif value is None:
+                return
+            else:
+                raise cast(Exception, value)
+    finally:
+        task.cancel()
@@ -1,4 +1,48 @@
 """Elimity Insights client for API interactions."""
-from elimity_insights_client.api._api import Config, query, sources
+from elimity_insights_client.api._api import (
+    Config,
+    cached_sources,
+    invalidate_sources,
+    query,
+    single_flight_stats,
+    sources,
+    stream_query,
+)
+from elimity_insights_client.api._async_api import AsyncClient
+from elimity_insights_client.api._chunked_query import chunked_query
+from elimity_insights_client.api._columns import (
+    group_by_query_results_columns,
+    group_by_query_results_rows,
+    query_results_columns,
+)
+from elimity_insights_client.api._evaluate import (
+    compile_boolean_expression,
+    evaluate_boolean_expression,
+)
+from elimity_insights_client.api._local_query import LocalQueryEngine
+from elimity_insights_client.api._simplify import (
+    simplify_boolean_expression,
+    simplify_query,
+)
+from elimity_insights_client.api._single_flight import SingleFlightStats
 
-__all__ = ["Config", "query", "sources"]
+__all__ = [
+    "AsyncClient",
+    "Config",
+    "LocalQueryEngine",
+    "SingleFlightStats",
+    "cached_sources",
+    "chunked_query",
+    "compile_boolean_expression",
+    "evaluate_boolean_expression",
+    "group_by_query_results_columns",
+    "group_by_query_results_rows",
+    "invalidate_sources",
+    "query",
+    "query_results_columns",
+    "simplify_boolean_expression",
+    "simplify_query",
+    "single_flight_stats",
+    "sources",
+    "stream_query",
+]
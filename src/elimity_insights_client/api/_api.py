@@ -1,19 +1,28 @@
 """Endpoints for API interactions with an Elimity Insights server."""
 
+from codecs import iterdecode
 from dataclasses import dataclass
-from typing import List, Optional, Type, TypeVar, cast
+from http import HTTPStatus
+from typing import Hashable, Iterator, List, Optional, Tuple, Type, TypeVar, cast
 
-from requests import request
+from requests import Response, Session, request
 
 from elimity_insights_client._util import encoder, map_list
 from elimity_insights_client.api._decode_query_results_page import (
     QueryResultsPageDict,
+    decode_lazy_query_results_page,
     decode_query_results_page,
 )
 from elimity_insights_client.api._decode_source import SourceDict, decode_source
 from elimity_insights_client.api._encode_query import encode_query
+from elimity_insights_client.api._revalidating_cache import RevalidatingCache
+from elimity_insights_client.api._simplify import simplify_query
+from elimity_insights_client.api._single_flight import SingleFlight, SingleFlightStats
+from elimity_insights_client.api._stream_query_results_pages import (
+    stream_query_results_pages,
+)
 from elimity_insights_client.api.query import Query
-from elimity_insights_client.api.query_results_page import QueryResultsPage
+from elimity_insights_client.api.query_results_page import QueryResult, QueryResultsPage
 from elimity_insights_client.api.source import Source
 
 
@@ -29,36 +38,169 @@ class Config:
 
 _T = TypeVar("_T")
 
+_flight: SingleFlight[object] = SingleFlight()
+_sources_cache: RevalidatingCache[List[Source]] = RevalidatingCache()
 
-def query(config: Config, queries: List[Query]) -> List[QueryResultsPage]:
-    """Perform the given queries and return the result pages."""
-    query_iter = map(encode_query, queries)
-    data = encoder.encode(query_iter)
+
+def query(
+    config: Config,
+    queries: List[Query],
+    simplify: bool = False,
+    session: Optional[Session] = None,
+    lazy: bool = False,
+) -> List[QueryResultsPage]:
+    """
+    Perform the given queries and return the result pages.
+
+    If simplify is True, the conditions of the given queries are simplified before encoding them, which shrinks
+    the payloads of machine-generated queries. If a session is given, the request is performed using its pooled
+    connections. If lazy is True, the inclusions and sub-results of each result are only decoded when they are
+    first accessed.
+    """
+    data = encode_queries(queries, simplify)
     page_dicts = _request(
-        config, data, "POST", "/api/agent/query", List[QueryResultsPageDict]
+        config, data, "POST", "/api/agent/query", session, List[QueryResultsPageDict]
     )
-    return map_list(decode_query_results_page, page_dicts)
+    return decode_query_results_pages(page_dicts, lazy)
+
+
+def stream_query(
+    config: Config,
+    queries: List[Query],
+    simplify: bool = False,
+    session: Optional[Session] = None,
+    chunk_size: int = 65536,
+) -> Iterator[Tuple[int, QueryResult]]:
+    """
+    Perform the given queries and generate their results while the response is being received.
+
+    Results are generated as pairs of the index of their query and the decoded result, so memory usage is bounded
+    by the size of the largest result, including its nested link pages, rather than by the size of the response.
+    The response is read in chunks of chunk_size bytes. Unlike query, calls
+    to this function never share in-flight requests, and the counts of the result pages are not available.
+    """
+    data = encode_queries(queries, simplify)
+    with _open(config, data, "POST", "/api/agent/query", session, True) as response:
+        byte_chunks = response.iter_content(chunk_size)
+        chunks = iterdecode(byte_chunks, "utf-8")
+        yield from stream_query_results_pages(chunks)
 
 
 def sources(config: Config) -> List[Source]:
     """List all configured sources."""
-    source_dicts = _request(config, None, "GET", "/api/agent/sources", List[SourceDict])
+    source_dicts = _request(
+        config, None, "GET", "/api/agent/sources", None, List[SourceDict]
+    )
     return map_list(decode_source, source_dicts)
 
 
-def _request(
-    config: Config, data: Optional[str], method: str, path: str, _type: Type[_T]
-) -> _T:
+def decode_query_results_pages(
+    dicts: List[QueryResultsPageDict], lazy: bool
+) -> List[QueryResultsPage]:
+    """Decode the given JSON values to query result pages, lazily if lazy is True."""
+    decode = decode_lazy_query_results_page if lazy else decode_query_results_page
+    return map_list(decode, dicts)
+
+
+def encode_queries(queries: List[Query], simplify: bool) -> str:
+    """Encode the given queries to JSON text, simplifying their conditions first if simplify is True."""
+    if simplify:
+        queries = map_list(simplify_query, queries)
+    query_iter = map(encode_query, queries)
+    return encoder.encode(query_iter)
+
+
+def cached_sources(config: Config, ttl: float = 60) -> List[Source]:
+    """
+    List all configured sources, reusing the result of an earlier call with the same configuration.
+
+    The result is refreshed when it is older than ttl seconds. If the server returned an entity tag for the
+    previous result, the refresh is a conditional request, and the previous result is reused if the server
+    indicates that it has not been modified. The returned list is new, but its sources are shared between calls.
+    """
+
+    def fetch(etag: Optional[str]) -> Optional[Tuple[Optional[str], List[Source]]]:
+        response = _open(config, None, "GET", "/api/agent/sources", None, False, etag)
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return None
+        source_dicts = cast(List[SourceDict], response.json())
+        fetched_etag = response.headers.get("ETag")
+        return fetched_etag, map_list(decode_source, source_dicts)
+
+    key = _key(config)
+    source_list = _sources_cache.get(key, ttl, fetch)
+    return list(source_list)
+
+
+def invalidate_sources(config: Optional[Config] = None) -> None:
+    """Discard the sources cached by cached_sources for the given configuration, or for all configurations."""
+    key = None if config is None else _key(config)
+    _sources_cache.invalidate(key)
+
+
+def single_flight_stats() -> SingleFlightStats:
+    """
+    Return counters for requests performed by query and sources.
+
+    Concurrent calls performing identical requests with the same configuration share a single in-flight HTTP
+    request, the collapsed counter indicates how many calls did not perform a request of their own.
+    """
+    return _flight.stats()
+
+
+def _key(config: Config) -> Hashable:
+    return config.url, config.token_id, config.token_secret
+
+
+def _open(
+    config: Config,
+    data: Optional[str],
+    method: str,
+    path: str,
+    session: Optional[Session],
+    stream: bool,
+    etag: Optional[str] = None,
+) -> Response:
     auth = config.token_id, config.token_secret
     headers = {"Content-Type": "application/json"}
-    response = request(
+    if etag is not None:
+        headers["If-None-Match"] = etag
+    send = request if session is None else session.request
+    response = send(
         method,
         config.url + path,
         auth=auth,
         data=data,
         headers=headers,
+        stream=stream,
         verify=config.verify_ssl,
     )
     response.raise_for_status()
-    json = response.json()
+    return response
+
+
+def _request(
+    config: Config,
+    data: Optional[str],
+    method: str,
+    path: str,
+    session: Optional[Session],
+    _type: Type[_T],
+) -> _T:
+    def func() -> object:
+        return _send(config, data, method, path, session)
+
+    key = _key(config), method, path, data
+    json = _flight.do(key, func)
     return cast(_T, json)
+
+
+def _send(
+    config: Config,
+    data: Optional[str],
+    method: str,
+    path: str,
+    session: Optional[Session],
+) -> object:
+    response = _open(config, data, method, path, session, False)
+    return response.json()
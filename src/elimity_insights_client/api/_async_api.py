@@ -0,0 +1,73 @@
+from json import loads
+from typing import List, Optional, Type, TypeVar, cast
+
+from elimity_insights_client._async_http import ConnectionPool
+from elimity_insights_client._util import map_list
+from elimity_insights_client.api._api import (
+    Config,
+    decode_query_results_pages,
+    encode_queries,
+)
+from elimity_insights_client.api._decode_query_results_page import (
+    QueryResultsPageDict,
+)
+from elimity_insights_client.api._decode_source import SourceDict, decode_source
+from elimity_insights_client.api.query import Query
+from elimity_insights_client.api.query_results_page import QueryResultsPage
+from elimity_insights_client.api.source import Source
+
+_T = TypeVar("_T")
+
+
+class AsyncClient:
+    """Client for API interactions from asyncio code, performing requests on a pool of connections."""
+
+    def __init__(self, config: Config, max_connections: int = 10) -> None:
+        """
+        Return a new client with the given configuration.
+
+        At most max_connections requests are performed concurrently, others wait for a connection to become
+        available. Cancelling a request closes its connection.
+        """
+        self._config = config
+        self._pool = ConnectionPool(config.url, max_connections, config.verify_ssl)
+
+    async def __aenter__(self) -> "AsyncClient":
+        """Return this client."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Close this client."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the idle connections of this client."""
+        await self._pool.close()
+
+    async def query(
+        self, queries: List[Query], simplify: bool = False, lazy: bool = False
+    ) -> List[QueryResultsPage]:
+        """Perform the given queries and return the result pages, like api.query."""
+        data = encode_queries(queries, simplify)
+        page_dicts = await self._request(
+            data, "POST", "/api/agent/query", List[QueryResultsPageDict]
+        )
+        return decode_query_results_pages(page_dicts, lazy)
+
+    async def sources(self) -> List[Source]:
+        """List all configured sources."""
+        source_dicts = await self._request(
+            None, "GET", "/api/agent/sources", List[SourceDict]
+        )
+        return map_list(decode_source, source_dicts)
+
+    async def _request(
+        self, data: Optional[str], method: str, path: str, _type: Type[_T]
+    ) -> _T:
+        config = self._config
+        auth = config.token_id, config.token_secret
+        headers = {"Content-Type": "application/json"}
+        data_bytes = None if data is None else data.encode()
+        body = await self._pool.request(method, path, auth, headers, data_bytes)
+        json = loads(body)
+        return cast(_T, json)
@@ -0,0 +1,108 @@
+from dataclasses import replace
+from typing import List, Optional
+
+from more_itertools import chunked
+from requests import Session
+
+from elimity_insights_client._util import map_concurrently, map_list
+from elimity_insights_client.api._api import Config
+from elimity_insights_client.api._api import query as api_query
+from elimity_insights_client.api._simplify import simplify_boolean_expression
+from elimity_insights_client.api.expression import (
+    AllBooleanExpression,
+    BooleanExpression,
+    IdInBooleanExpression,
+)
+from elimity_insights_client.api.query import Query
+from elimity_insights_client.api.query_results_page import QueryResultsPage
+
+
+def chunked_query(
+    config: Config, query: Query, chunk_size: int = 10000, max_workers: int = 8
+) -> QueryResultsPage:
+    """
+    Perform the given query in chunks of at most chunk_size entity identifiers, and merge the resulting pages.
+
+    A query without orderings is split if its condition, after simplification, is an identifier membership test
+    for the query's alias, or a conjunction containing exactly one such test. Ordered queries are performed as a
+    whole, since their offset and limit apply to the ordering across all chunks. The chunks are performed
+    concurrently by at most max_workers threads sharing a pooled session. The merged page sums the counts of all
+    chunks and concatenates their results in chunk order, applying the query's offset and limit to the merged
+    results.
+    """
+    chunk_queries = plan_chunks(query, chunk_size)
+    if len(chunk_queries) == 1:
+        (page,) = api_query(config, chunk_queries)
+        return page
+
+    def perform(session: Session, chunk_query: Query) -> QueryResultsPage:
+        queries = [chunk_query]
+        (page,) = api_query(config, queries, session=session)
+        return page
+
+    pages = map_concurrently(perform, chunk_queries, max_workers)
+    return merge_pages(pages, query.offset, query.limit)
+
+
+def merge_pages(
+    pages: List[QueryResultsPage], offset: int, limit: int
+) -> QueryResultsPage:
+    """Merge the given pages for disjoint chunks of a query with the given offset and limit."""
+    count = sum(page.count for page in pages)
+    results = [result for page in pages for result in page.results]
+    end = offset + limit
+    return QueryResultsPage(count, results[offset:end])
+
+
+def plan_chunks(query: Query, chunk_size: int) -> List[Query]:
+    """
+    Split the given query in queries for disjoint chunks of at most chunk_size entity identifiers.
+
+    Queries with orderings are never split.
+    """
+    if query.order_by:
+        return [query]
+    condition = simplify_boolean_expression(query.condition)
+    ids_expr = _ids_expression(condition, query.alias)
+    if ids_expr is None or len(ids_expr.ids) <= chunk_size:
+        return [query]
+
+    limit = query.offset + query.limit
+    chunk_queries: List[Query] = []
+    for ids in chunked(ids_expr.ids, chunk_size):
+        chunk_expr = IdInBooleanExpression(ids, ids_expr.reference)
+        chunk_condition = _replace_ids(condition, chunk_expr)
+        chunk_query = replace(query, condition=chunk_condition, limit=limit, offset=0)
+        chunk_queries.append(chunk_query)
+    return chunk_queries
+
+
+def _ids_expression(
+    condition: BooleanExpression, alias: str
+) -> Optional[IdInBooleanExpression]:
+    exprs = (
+        condition.exprs if isinstance(condition, AllBooleanExpression) else [condition]
+    )
+    ids_exprs = [
+        expr
+        for expr in exprs
+        if isinstance(expr, IdInBooleanExpression) and expr.reference == alias
+    ]
+    if len(ids_exprs) == 1:
+        return ids_exprs[0]
+    return None
+
+
+def _replace_ids(
+    condition: BooleanExpression, ids_expr: IdInBooleanExpression
+) -> BooleanExpression:
+    if not isinstance(condition, AllBooleanExpression):
+        return ids_expr
+
+    def replace_expr(expr: BooleanExpression) -> BooleanExpression:
+        if not isinstance(expr, IdInBooleanExpression):
+            return expr
+        return ids_expr if expr.reference == ids_expr.reference else expr
+
+    exprs = map_list(replace_expr, condition.exprs)
+    return AllBooleanExpression(exprs)
@@ -0,0 +1,170 @@
+from importlib import import_module
+from types import ModuleType
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from elimity_insights_client.api._decode_query_results_page import parse_inclusions
+from elimity_insights_client.api.query_results_page import (
+    GroupByQueryResult,
+    GroupByQueryResultsPage,
+    QueryResult,
+    QueryResultsPage,
+)
+
+try:
+    _numpy: Optional[ModuleType] = import_module("numpy")
+except ImportError:
+    _numpy = None
+
+
+def column(values: Sequence[object], dtype: type) -> Sequence[object]:
+    """Convert the given values to a NumPy array of the given type if NumPy is installed, or return them."""
+    if _numpy is None:
+        return values
+    array = _numpy.array(values, dtype=dtype)
+    return cast(Sequence[object], array)
+
+
+def group_by_query_results_columns(
+    page: GroupByQueryResultsPage,
+) -> Dict[str, Sequence[object]]:
+    """
+    Convert the leaf groups of the given group-by page tree to columns.
+
+    The count column holds the count of each leaf group. For each grouping level i, the label_i column holds the
+    plain labels at that level and the label_i_valid column indicates which leaf groups are nested at least that
+    deep. Columns are NumPy arrays if NumPy is installed, otherwise they are lists.
+    """
+    counts: List[int] = []
+    labels = _OptionalColumns("label")
+    for row_labels, count in group_by_query_results_rows(page):
+        counts.append(count)
+        labels.append(row_labels)
+    columns = {"count": column(counts, int)}
+    labels.export(columns)
+    return columns
+
+
+def group_by_query_results_rows(
+    page: GroupByQueryResultsPage,
+) -> Iterator[Tuple[Tuple[object, ...], int]]:
+    """
+    Generate a row for each leaf group of the given group-by page tree, in depth-first order.
+
+    Rows are pairs of the plain labels of the group and its ancestors, starting with the outermost grouping, and
+    the count of the group. A group is a leaf if none of its sub-pages contain results.
+    """
+    results = iter(page.results)
+    stack: List[Tuple[Tuple[object, ...], Iterator[GroupByQueryResult]]] = [
+        ((), results)
+    ]
+    while stack:
+        labels, results = stack[-1]
+        result = next(results, None)
+        if result is None:
+            stack.pop()
+            continue
+
+        result_labels = labels + (result.label.value,)
+        sub_pages = result.sub_pages
+        if any(sub_page.results for sub_page in sub_pages):
+            sub_results = (
+                sub_result for sub_page in sub_pages for sub_result in sub_page.results
+            )
+            stack.append((result_labels, sub_results))
+        else:
+            yield result_labels, result.count
+
+
+def optional_column(values: List[object], valids: List[bool]) -> Sequence[object]:
+    """
+    Convert the given optional values to a NumPy array if NumPy is installed, or return them.
+
+    Invalid values are ignored when choosing the type of the array, and are filled with NaN in number arrays.
+    """
+    if _numpy is None:
+        return values
+    return _array(_numpy, values, valids)
+
+
+def query_results_columns(
+    results: Union[QueryResultsPage, Iterable[QueryResult]]
+) -> Dict[str, Sequence[object]]:
+    """
+    Convert the given page or iterable of query results to columns, reading the results once.
+
+    The active, id and name columns hold the details of each result's entity. For each inclusion position i, the
+    inclusion_i column holds the plain values at that position, for example a datetime instead of a DateTimeValue,
+    and the inclusion_i_valid column indicates which results have a value at that position. If NumPy is
+    installed, columns are NumPy arrays, otherwise they are lists. Inclusions of results returned by a lazy query
+    are converted without decoding them to value wrappers.
+    """
+    if isinstance(results, QueryResultsPage):
+        results = results.results
+    actives: List[bool] = []
+    ids: List[str] = []
+    names: List[str] = []
+    inclusions = _OptionalColumns("inclusion")
+    for result in results:
+        entity = result.entity
+        actives.append(entity.active)
+        ids.append(entity.id)
+        names.append(entity.name)
+        values = parse_inclusions(result)
+        inclusions.append(values)
+    columns = {
+        "active": column(actives, bool),
+        "id": column(ids, object),
+        "name": column(names, object),
+    }
+    inclusions.export(columns)
+    return columns
+
+
+class _OptionalColumns:
+    def __init__(self, prefix: str) -> None:
+        self._columns: List[List[object]] = []
+        self._prefix = prefix
+        self._rows = 0
+        self._valids: List[List[bool]] = []
+
+    def append(self, values: Sequence[object]) -> None:
+        for _ in range(len(self._columns), len(values)):
+            self._columns.append([None] * self._rows)
+            self._valids.append([False] * self._rows)
+        for index, column_values in enumerate(self._columns):
+            valid = index < len(values)
+            column_values.append(values[index] if valid else None)
+            self._valids[index].append(valid)
+        self._rows += 1
+
+    def export(self, columns: Dict[str, Sequence[object]]) -> None:
+        for index, values in enumerate(self._columns):
+            name = f"{self._prefix}_{index}"
+            valids = self._valids[index]
+            columns[name] = optional_column(values, valids)
+            columns[f"{name}_valid"] = column(valids, bool)
+
+
+def _array(
+    numpy: ModuleType, column: List[object], valids: List[bool]
+) -> Sequence[object]:
+    values = [value for value, valid in zip(column, valids) if valid]
+    if all(isinstance(value, bool) for value in values):
+        bools = [value is True for value in column]
+        array = numpy.array(bools, dtype=bool)
+    elif all(isinstance(value, (float, int)) for value in values):
+        floats = [numpy.nan if value is None else value for value in column]
+        array = numpy.array(floats, dtype=float)
+    else:
+        array = numpy.array(column, dtype=object)
+    return cast(Sequence[object], array)
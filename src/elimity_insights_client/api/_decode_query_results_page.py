@@ -1,8 +1,8 @@
-from datetime import date, datetime
-from json import loads
-from typing import List
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
 
-from dateutil.parser import isoparse, isoparser
+from dateutil.parser import isoparser
 from typing_extensions import TypedDict
 
 from elimity_insights_client._util import map_list
@@ -21,6 +21,83 @@ from elimity_insights_client.api.query_results_page import (
     Value,
 )
 
+_cache_size = 4096
+_false = BooleanValue(False)
+_parser = isoparser()
+_true = BooleanValue(True)
+
+
+class LazyQueryResult(QueryResult):
+    """
+    Query result that decodes its inclusions and sub-results on first access.
+
+    Its constructor is the one of QueryResult, so dataclasses.replace and copying work as usual. Lazy instances are
+    created by decode_lazy_query_result, which keeps the JSON value to decode from.
+    """
+
+    _dict: "QueryResultDict"
+    _inclusions: Optional[List[Value]] = None
+    _link_group_by_pages: Optional[List[GroupByQueryResultsPage]] = None
+    _link_pages: Optional[List[QueryResultsPage]] = None
+
+    def __eq__(self, other: object) -> bool:
+        """Compare this query result to the given one, decoding both if needed."""
+        if not isinstance(other, QueryResult):
+            return NotImplemented
+        fields = (
+            self.entity,
+            self.inclusions,
+            self.link_group_by_pages,
+            self.link_pages,
+        )
+        other_fields = (
+            other.entity,
+            other.inclusions,
+            other.link_group_by_pages,
+            other.link_pages,
+        )
+        return fields == other_fields
+
+    @property
+    def inclusions(self) -> List[Value]:
+        """Decode the inclusions of this query result if needed, and return them."""
+        if self._inclusions is None:
+            inclusion_dicts = self._dict["inclusions"]
+            self._inclusions = map_list(decode_value, inclusion_dicts)
+        return self._inclusions
+
+    @inclusions.setter
+    def inclusions(self, inclusions: List[Value]) -> None:
+        self._inclusions = inclusions
+
+    @property
+    def link_group_by_pages(self) -> List[GroupByQueryResultsPage]:
+        """Decode the link group-by pages of this query result if needed, and return them."""
+        if self._link_group_by_pages is None:
+            page_dicts = self._dict["linkGroupByPages"]
+            self._link_group_by_pages = map_list(
+                _decode_group_by_query_results_page, page_dicts
+            )
+        return self._link_group_by_pages
+
+    @link_group_by_pages.setter
+    def link_group_by_pages(
+        self, link_group_by_pages: List[GroupByQueryResultsPage]
+    ) -> None:
+        self._link_group_by_pages = link_group_by_pages
+
+    @property
+    def link_pages(self) -> List[QueryResultsPage]:
+        """Decode the link pages of this query result if needed, and return them."""
+        if self._link_pages is None:
+            page_dicts = self._dict["linkPages"]
+            self._link_pages = map_list(decode_lazy_query_results_page, page_dicts)
+        return self._link_pages
+
+    @link_pages.setter
+    def link_pages(self, link_pages: List[QueryResultsPage]) -> None:
+        self._link_pages = link_pages
+
 
 class EntityDict(TypedDict):
     active: bool
@@ -56,17 +133,74 @@ class ValueDict(TypedDict):
     value: str
 
 
+def decode_lazy_query_result(dict: QueryResultDict) -> QueryResult:
+    result: LazyQueryResult = object.__new__(LazyQueryResult)
+    entity_dict = dict["entity"]
+    result.entity = _decode_entity(entity_dict)
+    result._dict = dict
+    return result
+
+
+def decode_lazy_query_results_page(dict: QueryResultsPageDict) -> QueryResultsPage:
+    count = dict["count"]
+    result_dicts = dict["results"]
+    results = map_list(decode_lazy_query_result, result_dicts)
+    return QueryResultsPage(count, results)
+
+
+def decode_query_result(dict: QueryResultDict) -> QueryResult:
+    entity_dict = dict["entity"]
+    entity = _decode_entity(entity_dict)
+    inclusion_dicts = dict["inclusions"]
+    inclusions = map_list(decode_value, inclusion_dicts)
+    link_group_by_page_dicts = dict["linkGroupByPages"]
+    link_group_by_pages = map_list(
+        _decode_group_by_query_results_page, link_group_by_page_dicts
+    )
+    link_page_dicts = dict["linkPages"]
+    link_pages = map_list(decode_query_results_page, link_page_dicts)
+    return QueryResult(entity, inclusions, link_group_by_pages, link_pages)
+
+
 def decode_query_results_page(dict: QueryResultsPageDict) -> QueryResultsPage:
     count = dict["count"]
     result_dicts = dict["results"]
-    results = map_list(_decode_query_result, result_dicts)
+    results = map_list(decode_query_result, result_dicts)
     return QueryResultsPage(count, results)
 
 
+def decode_value(dict: ValueDict) -> Value:
+    type = dict["type"]
+    value = dict["value"]
+    decode = _value_decoders.get(type, _decode_time)
+    return decode(value)
+
+
+def parse_inclusions(result: QueryResult) -> List[object]:
+    if isinstance(result, LazyQueryResult) and result._inclusions is None:
+        inclusion_dicts = result._dict["inclusions"]
+        return map_list(parse_value, inclusion_dicts)
+    return [inclusion.value for inclusion in result.inclusions]
+
+
+def parse_value(dict: ValueDict) -> object:
+    type = dict["type"]
+    value = dict["value"]
+    parse = _value_parsers.get(type, _parse_time)
+    return parse(value)
+
+
+def _decode_entity(dict: EntityDict) -> Entity:
+    active = dict["active"]
+    id = dict["id"]
+    name = dict["name"]
+    return Entity(active, id, name)
+
+
 def _decode_group_by_query_result(dict: GroupByQueryResultDict) -> GroupByQueryResult:
     count = dict["count"]
     label_dict = dict["label"]
-    label = _decode_value(label_dict)
+    label = decode_value(label_dict)
     sub_page_dicts = dict["subPages"]
     sub_pages = map_list(_decode_group_by_query_results_page, sub_page_dicts)
     return GroupByQueryResult(count, label, sub_pages)
@@ -81,49 +215,39 @@ def _decode_group_by_query_results_page(
     return GroupByQueryResultsPage(group_count, results)
 
 
-def _decode_query_result(dict: QueryResultDict) -> QueryResult:
-    entity_dict = dict["entity"]
-    active = entity_dict["active"]
-    id = entity_dict["id"]
-    name = entity_dict["name"]
-    entity = Entity(active, id, name)
-    inclusion_dicts = dict["inclusions"]
-    inclusions = map_list(_decode_value, inclusion_dicts)
-    link_group_by_page_dicts = dict["linkGroupByPages"]
-    link_group_by_pages = map_list(
-        _decode_group_by_query_results_page, link_group_by_page_dicts
-    )
-    link_page_dicts = dict["linkPages"]
-    link_pages = map_list(decode_query_results_page, link_page_dicts)
-    return QueryResult(entity, inclusions, link_group_by_pages, link_pages)
+def _decode_boolean(value: str) -> Value:
+    return _true if value == "true" else _false
 
 
-def _decode_value(dict: ValueDict) -> Value:
-    type = dict["type"]
-    value = dict["value"]
-    if type == "boolean":
-        return BooleanValue(value == "true")
+def _decode_date(value: str) -> Value:
+    date_value = _parse_date(value)
+    return DateValue(date_value)
+
+
+def _decode_date_time(value: str) -> Value:
+    date_time_value = _parse_datetime(value)
+    return DateTimeValue(date_time_value)
 
-    if type == "date":
-        date_value = _parse_date(value)
-        return DateValue(date_value)
 
-    if type == "dateTime":
-        date_time_value = _parse_datetime(value)
-        return DateTimeValue(date_time_value)
+def _decode_number(value: str) -> Value:
+    number_value = _parse_number(value)
+    return NumberValue(number_value)
 
-    if type == "number":
-        number_value = loads(value)
-        return NumberValue(number_value)
 
-    if type == "string":
-        return StringValue(value)
+def _decode_string(value: str) -> Value:
+    return StringValue(value)
 
-    parser = isoparser()
-    time_value = parser.parse_isotime(value)
+
+def _decode_time(value: str) -> Value:
+    time_value = _parse_time(value)
     return TimeValue(time_value)
 
 
+def _parse_boolean(value: str) -> bool:
+    return value == "true"
+
+
+@lru_cache(maxsize=_cache_size)
 def _parse_date(value: str) -> date:
     try:
         return date.fromisoformat(value)
@@ -131,8 +255,44 @@ def _parse_date(value: str) -> date:
         return date.min
 
 
+@lru_cache(maxsize=_cache_size)
 def _parse_datetime(value: str) -> datetime:
     try:
-        return isoparse(value)
+        return _parser.isoparse(value)
     except ValueError:
         return datetime.min
+
+
+def _parse_number(value: str) -> float:
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _parse_string(value: str) -> str:
+    return value
+
+
+@lru_cache(maxsize=_cache_size)
+def _parse_time(value: str) -> time:
+    return _parser.parse_isotime(value)
+
+
+_value_decoders: Dict[str, Callable[[str], Value]] = {
+    "boolean": _decode_boolean,
+    "date": _decode_date,
+    "dateTime": _decode_date_time,
+    "number": _decode_number,
+    "string": _decode_string,
+    "time": _decode_time,
+}
+
+_value_parsers: Dict[str, Callable[[str], object]] = {
+    "boolean": _parse_boolean,
+    "date": _parse_date,
+    "dateTime": _parse_datetime,
+    "number": _parse_number,
+    "string": _parse_string,
+    "time": _parse_time,
+}
@@ -7,6 +7,7 @@ from elimity_insights_client._decode_domain_graph_schema import (
     DomainGraphSchemaDict,
     decode_domain_graph_schema,
 )
+from elimity_insights_client._domain_graph_schema import DomainGraphSchema
 from elimity_insights_client.api.source import (
     AbsentLastReloadTimestamp,
     LastReloadTimestamp,
@@ -15,6 +16,55 @@ from elimity_insights_client.api.source import (
 )
 
 
+class LazySource(Source):
+    """
+    Source that decodes its domain graph schema on first access.
+
+    Its constructor is the one of Source, so dataclasses.replace and copying work as usual. Lazy instances are created
+    by decode_source, which keeps the JSON value to decode from.
+    """
+
+    _domain_graph_schema: Optional[DomainGraphSchema] = None
+    _domain_graph_schema_dict: DomainGraphSchemaDict
+
+    def __eq__(self, other: object) -> bool:
+        """Compare this source to the given one, decoding both schemas if needed."""
+        if not isinstance(other, Source):
+            return NotImplemented
+        fields = (
+            self.archived,
+            self.domain_graph_schema,
+            self.id,
+            self.last_reload_timestamp,
+            self.name,
+        )
+        other_fields = (
+            other.archived,
+            other.domain_graph_schema,
+            other.id,
+            other.last_reload_timestamp,
+            other.name,
+        )
+        return fields == other_fields
+
+    @property
+    def domain_graph_schema(self) -> DomainGraphSchema:
+        """
+        Decode the domain graph schema of this source if needed, and return it.
+
+        The JSON value is kept after decoding, so threads sharing this source may decode it concurrently.
+        """
+        schema = self._domain_graph_schema
+        if schema is None:
+            schema = decode_domain_graph_schema(self._domain_graph_schema_dict)
+            self._domain_graph_schema = schema
+        return schema
+
+    @domain_graph_schema.setter
+    def domain_graph_schema(self, domain_graph_schema: DomainGraphSchema) -> None:
+        self._domain_graph_schema = domain_graph_schema
+
+
 class SourceDict(TypedDict):
     """JSON value representing a source."""
 
@@ -26,15 +76,15 @@ class SourceDict(TypedDict):
 
 
 def decode_source(dict: SourceDict) -> Source:
-    """Decode the given JSON value to a source."""
-    archived = dict["archived"]
-    domain_graph_schema_dict = dict["domainGraphSchema"]
-    domain_graph_schema = decode_domain_graph_schema(domain_graph_schema_dict)
-    id = dict["id"]
-    last_reload_timestamp_json = dict.get("lastReloadTimestamp")
-    last_reload_timestamp = _decode_last_reload_timestamp(last_reload_timestamp_json)
-    name = dict["name"]
-    return Source(archived, domain_graph_schema, id, last_reload_timestamp, name)
+    """Decode the given JSON value to a source, postponing the decoding of its domain graph schema to first access."""
+    source: LazySource = object.__new__(LazySource)
+    source.archived = dict["archived"]
+    source.id = dict["id"]
+    timestamp_json = dict.get("lastReloadTimestamp")
+    source.last_reload_timestamp = _decode_last_reload_timestamp(timestamp_json)
+    source.name = dict["name"]
+    source._domain_graph_schema_dict = dict["domainGraphSchema"]
+    return source
 
 
 def _decode_last_reload_timestamp(value: Optional[str]) -> LastReloadTimestamp:
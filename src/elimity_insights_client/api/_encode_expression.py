@@ -1,7 +1,16 @@
 from datetime import time
-from typing import Callable, List, TypeVar
+from functools import partial
+from typing import List, Union
 
 from elimity_insights_client._util import encode_datetime, local_timezone
+from elimity_insights_client.api._encoder import (
+    Parts,
+    Rules,
+    encode,
+    join,
+    string,
+    value,
+)
 from elimity_insights_client.api.expression import (
     ActiveBooleanExpression,
     AggregateOperator,
@@ -53,368 +62,364 @@ from elimity_insights_client.api.expression import (
     TimeExpression,
 )
 
-_T = TypeVar("_T")
-_EncodeFunc = Callable[[_T], object]
+_AttributeExpression = Union[
+    AttributeBooleanExpression,
+    AttributeDateExpression,
+    AttributeDateTimeExpression,
+    AttributeNumberExpression,
+    AttributeStringExpression,
+    AttributeTimeExpression,
+]
+_CmpExpression = Union[
+    DateCmpBooleanExpression,
+    DateTimeCmpBooleanExpression,
+    NumberCmpBooleanExpression,
+    TimeCmpBooleanExpression,
+]
+_LinkAttributeExpression = Union[
+    LinkAttributeBooleanExpression,
+    LinkAttributeDateExpression,
+    LinkAttributeDateTimeExpression,
+    LinkAttributeNumberExpression,
+    LinkAttributeStringExpression,
+    LinkAttributeTimeExpression,
+]
+
+_aggregate_operators = {
+    AggregateOperator.AVG: '"avg"',
+    AggregateOperator.COUNT: '"count"',
+    AggregateOperator.MAX: '"max"',
+    AggregateOperator.MIN: '"min"',
+    AggregateOperator.SUM: '"sum"',
+}
+_booleans = {False: "false", True: "true"}
+_cmp_operators = {
+    CmpOperator.EQ: '"eq"',
+    CmpOperator.GT: '"gt"',
+    CmpOperator.GTE: '"gte"',
+    CmpOperator.LT: '"lt"',
+    CmpOperator.LTE: '"lte"',
+    CmpOperator.NEQ: '"neq"',
+}
+_match_modes = {
+    MatchMode.CASE_INSENSITIVE: '"caseInsensitive"',
+    MatchMode.CASE_SENSITIVE: '"caseSensitive"',
+}
+_match_operators = {
+    MatchOperator.CONTAINS: '"contains"',
+    MatchOperator.ENDS_WITH: '"endsWith"',
+    MatchOperator.EQUALS: '"equals"',
+    MatchOperator.STARTS_WITH: '"startsWith"',
+}
+
+expression_rules = Rules()
 
 
 def encode_boolean_expression(expression: BooleanExpression) -> object:
     """Encode the given boolean expression to a JSON value."""
-    if isinstance(expression, ActiveBooleanExpression):
-        return {"reference": expression.reference, "type": "active"}
-
-    if isinstance(expression, AllBooleanExpression):
-        return _encode_composite_boolean_expression(expression.exprs, "all")
-
-    if isinstance(expression, AnyBooleanExpression):
-        return _encode_composite_boolean_expression(expression.exprs, "any")
-
-    if isinstance(expression, AssignedBooleanExpression):
-        return {
-            "attributeType": expression.attribute_type,
-            "reference": expression.reference,
-            "type": "assigned",
-        }
-
-    if isinstance(expression, AttributeBooleanExpression):
-        return _encode_attribute_expression(
-            expression.attribute_type, expression.reference
-        )
-
-    if isinstance(expression, DateCmpBooleanExpression):
-        return _encode_cmp_expression(
-            encode_date_expression,
-            expression.lhs,
-            expression.operator,
-            expression.rhs,
-            "dateCmp",
-        )
-
-    if isinstance(expression, DateTimeCmpBooleanExpression):
-        return _encode_cmp_expression(
-            encode_date_time_expression,
-            expression.lhs,
-            expression.operator,
-            expression.rhs,
-            "dateTimeCmp",
-        )
-
-    if isinstance(expression, DirectlyLinkedToBooleanExpression):
-        condition = encode_boolean_expression(expression.condition)
-        return {
-            "alias": expression.alias,
-            "condition": condition,
-            "entityType": expression.entity_type,
-            "linkAlias": expression.link_alias,
-            "sourceId": expression.source_id,
-            "type": "directlyLinkedTo",
-        }
-
-    if isinstance(expression, IdInBooleanExpression):
-        return {
-            "ids": expression.ids,
-            "reference": expression.reference,
-            "type": "idInBooleanExpression",
-        }
-
-    if isinstance(expression, LinkedToBooleanExpression):
-        condition = encode_boolean_expression(expression.condition)
-        return {
-            "alias": expression.alias,
-            "condition": condition,
-            "entityType": expression.entity_type,
-            "sourceId": expression.source_id,
-            "type": "linkedTo",
-        }
-
-    if isinstance(expression, LinkAssignedBooleanExpression):
-        return {
-            "linkAttributeType": expression.link_attribute_type,
-            "linkReference": expression.link_reference,
-            "type": "linkAssigned",
-        }
-
-    if isinstance(expression, LinkAttributeBooleanExpression):
-        return _encode_link_attribute_expression(
-            expression.link_attribute_type, expression.link_reference
-        )
-
-    if isinstance(expression, LiteralBooleanExpression):
-        return {"boolean": expression.boolean, "type": "literal"}
-
-    if isinstance(expression, MatchBooleanExpression):
-        lhs = encode_string_expression(expression.lhs)
-        mode = _encode_match_mode(expression.mode)
-        operator = _encode_match_operator(expression.operator)
-        rhs = encode_string_expression(expression.rhs)
-        return {
-            "lhs": lhs,
-            "mode": mode,
-            "operator": operator,
-            "rhs": rhs,
-            "type": "match",
-        }
-
-    if isinstance(expression, NotBooleanExpression):
-        expr = encode_boolean_expression(expression.expr)
-        return {"expr": expr, "type": "not"}
-
-    if isinstance(expression, NumberCmpBooleanExpression):
-        return _encode_cmp_expression(
-            encode_number_expression,
-            expression.lhs,
-            expression.operator,
-            expression.rhs,
-            "numberCmp",
-        )
-
-    if isinstance(expression, TimeCmpBooleanExpression):
-        return _encode_cmp_expression(
-            encode_time_expression,
-            expression.lhs,
-            expression.operator,
-            expression.rhs,
-            "timeCmp",
-        )
+    return encode(expression_rules, expression)
 
 
 def encode_date_expression(expression: DateExpression) -> object:
     """Encode the given date expression to a JSON value."""
-    if isinstance(expression, AttributeDateExpression):
-        return _encode_attribute_expression(
-            expression.attribute_type, expression.reference
-        )
-
-    if isinstance(expression, LinkAttributeDateExpression):
-        return _encode_link_attribute_expression(
-            expression.link_attribute_type, expression.link_reference
-        )
-
-    if isinstance(expression, LiteralDateExpression):
-        date = expression.date.isoformat()
-        return {"date": date, "type": "literal"}
-
-    if isinstance(expression, RelativeDateExpression):
-        return {
-            "days": expression.days,
-            "future": expression.future,
-            "months": expression.months,
-            "type": "relativeDate",
-            "years": expression.years,
-        }
+    return encode(expression_rules, expression)
 
 
 def encode_date_time_expression(expression: DateTimeExpression) -> object:
     """Encode the given date-time expression to a JSON value."""
-    if isinstance(expression, AttributeDateTimeExpression):
-        return _encode_attribute_expression(
-            expression.attribute_type, expression.reference
-        )
-
-    if isinstance(expression, LinkAttributeDateTimeExpression):
-        return _encode_link_attribute_expression(
-            expression.link_attribute_type, expression.link_reference
-        )
-
-    if isinstance(expression, LiteralDateTimeExpression):
-        date_time = encode_datetime(expression.date_time)
-        return {"dateTime": date_time, "type": "literal"}
-
-    if isinstance(expression, RelativeDateTimeExpression):
-        return {
-            "days": expression.days,
-            "future": expression.future,
-            "hours": expression.hours,
-            "minutes": expression.minutes,
-            "months": expression.months,
-            "seconds": expression.seconds,
-            "type": "relativeDateTime",
-            "years": expression.years,
-        }
+    return encode(expression_rules, expression)
 
 
 def encode_number_expression(expression: NumberExpression) -> object:
     """Encode the given number expression to a JSON value."""
-    if isinstance(expression, AttributeNumberExpression):
-        return _encode_attribute_expression(
-            expression.attribute_type, expression.reference
-        )
-
-    if isinstance(expression, DirectLinkAggregateNumberExpression):
-        condition = encode_boolean_expression(expression.condition)
-        expr = encode_number_expression(expression.expr)
-        op = _encode_aggregate_operator(expression.op)
-        return {
-            "alias": expression.alias,
-            "condition": condition,
-            "entityType": expression.entity_type,
-            "linkAlias": expression.link_alias,
-            "expr": expr,
-            "op": op,
-            "sourceId": expression.source_id,
-            "type": "directLinkAggregate",
-        }
-
-    if isinstance(expression, LinkAggregateNumberExpression):
-        condition = encode_boolean_expression(expression.condition)
-        expr = encode_number_expression(expression.expr)
-        op = _encode_aggregate_operator(expression.op)
-        return {
-            "alias": expression.alias,
-            "condition": condition,
-            "entityType": expression.entity_type,
-            "expr": expr,
-            "op": op,
-            "sourceId": expression.source_id,
-            "type": "linkAggregate",
-        }
-
-    if isinstance(expression, LinkAttributeNumberExpression):
-        return _encode_link_attribute_expression(
-            expression.link_attribute_type, expression.link_reference
-        )
-
-    if isinstance(expression, LiteralNumberExpression):
-        return {"number": expression.number, "type": "literal"}
+    return encode(expression_rules, expression)
 
 
 def encode_string_expression(expression: StringExpression) -> object:
     """Encode the given string expression to a JSON value."""
-    if isinstance(expression, AttributeStringExpression):
-        return _encode_attribute_expression(
-            expression.attribute_type, expression.reference
-        )
+    return encode(expression_rules, expression)
 
-    if isinstance(expression, IdStringExpression):
-        return {"reference": expression.reference, "type": "id"}
 
-    if isinstance(expression, LinkAttributeStringExpression):
-        return _encode_link_attribute_expression(
-            expression.link_attribute_type, expression.link_reference
-        )
+def encode_time_expression(expression: TimeExpression) -> object:
+    """Encode the given time expression to a JSON value."""
+    return encode(expression_rules, expression)
+
 
-    if isinstance(expression, LiteralStringExpression):
-        return {"string": expression.string, "type": "literal"}
+def _encode_active_expression(expression: ActiveBooleanExpression) -> str:
+    reference = string(expression.reference)
+    return f'{{"reference": {reference}, "type": "active"}}'
 
-    if isinstance(expression, NameStringExpression):
-        return {"reference": expression.reference, "type": "name"}
+
+def _encode_all_expression(expression: AllBooleanExpression) -> Parts:
+    return _encode_composite_expression(expression.exprs, '"all"')
+
+
+def _encode_any_expression(expression: AnyBooleanExpression) -> Parts:
+    return _encode_composite_expression(expression.exprs, '"any"')
+
+
+def _encode_assigned_expression(expression: AssignedBooleanExpression) -> str:
+    attribute_type = string(expression.attribute_type)
+    reference = string(expression.reference)
+    return f'{{"attributeType": {attribute_type}, "reference": {reference}, "type": "assigned"}}'
 
 
-def encode_time_expression(expression: TimeExpression) -> object:
-    """Encode the given time expression to a JSON value."""
-    if isinstance(expression, AttributeTimeExpression):
-        return _encode_attribute_expression(
-            expression.attribute_type, expression.reference
-        )
+def _encode_attribute_expression(expression: _AttributeExpression) -> str:
+    attribute_type = string(expression.attribute_type)
+    reference = string(expression.reference)
+    return f'{{"attributeType": {attribute_type}, "reference": {reference}, "type": "attribute"}}'
+
+
+def _encode_cmp_expression(type: str, expression: _CmpExpression) -> Parts:
+    operator = _cmp_operators[expression.operator]
+    return [
+        '{"lhs": ',
+        expression.lhs,
+        f', "operator": {operator}, "rhs": ',
+        expression.rhs,
+        f', "type": {type}}}',
+    ]
+
+
+def _encode_composite_expression(exprs: List[BooleanExpression], type: str) -> Parts:
+    parts: Parts = ['{"exprs": [']
+    join(parts, exprs)
+    parts.append(f'], "type": {type}}}')
+    return parts
 
-    if isinstance(expression, LinkAttributeTimeExpression):
-        return _encode_link_attribute_expression(
-            expression.link_attribute_type, expression.link_reference
-        )
 
-    if isinstance(expression, LiteralTimeExpression):
-        time = _set_timezone(expression.time).isoformat()
-        return {"time": time, "type": "literal"}
+def _encode_direct_link_aggregate_expression(
+    expression: DirectLinkAggregateNumberExpression,
+) -> Parts:
+    alias = string(expression.alias)
+    entity_type = string(expression.entity_type)
+    link_alias = string(expression.link_alias)
+    op = _aggregate_operators[expression.op]
+    return [
+        f'{{"alias": {alias}, "condition": ',
+        expression.condition,
+        f', "entityType": {entity_type}, "linkAlias": {link_alias}, "expr": ',
+        expression.expr,
+        f', "op": {op}, "sourceId": {expression.source_id}, "type": "directLinkAggregate"}}',
+    ]
 
 
-def _encode_aggregate_operator(operator: AggregateOperator) -> object:
-    if operator is AggregateOperator.AVG:
-        return "avg"
+def _encode_directly_linked_to_expression(
+    expression: DirectlyLinkedToBooleanExpression,
+) -> Parts:
+    alias = string(expression.alias)
+    entity_type = string(expression.entity_type)
+    link_alias = string(expression.link_alias)
+    return [
+        f'{{"alias": {alias}, "condition": ',
+        expression.condition,
+        f', "entityType": {entity_type}, "linkAlias": {link_alias}, "sourceId": {expression.source_id}, '
+        '"type": "directlyLinkedTo"}',
+    ]
 
-    if operator is AggregateOperator.COUNT:
-        return "count"
 
-    if operator is AggregateOperator.MAX:
-        return "max"
+def _encode_id_expression(expression: IdStringExpression) -> str:
+    reference = string(expression.reference)
+    return f'{{"reference": {reference}, "type": "id"}}'
 
-    if operator is AggregateOperator.MIN:
-        return "min"
 
-    if operator is AggregateOperator.SUM:
-        return "sum"
+def _encode_id_in_expression(expression: IdInBooleanExpression) -> str:
+    ids = value(expression.ids)
+    reference = string(expression.reference)
+    return (
+        f'{{"ids": {ids}, "reference": {reference}, "type": "idInBooleanExpression"}}'
+    )
 
 
-def _encode_attribute_expression(attribute_type: str, reference: str) -> object:
-    return {
-        "attributeType": attribute_type,
-        "reference": reference,
-        "type": "attribute",
-    }
+def _encode_link_aggregate_expression(
+    expression: LinkAggregateNumberExpression,
+) -> Parts:
+    alias = string(expression.alias)
+    entity_type = string(expression.entity_type)
+    op = _aggregate_operators[expression.op]
+    return [
+        f'{{"alias": {alias}, "condition": ',
+        expression.condition,
+        f', "entityType": {entity_type}, "expr": ',
+        expression.expr,
+        f', "op": {op}, "sourceId": {expression.source_id}, "type": "linkAggregate"}}',
+    ]
 
 
-def _encode_cmp_operator(operator: CmpOperator) -> object:
-    if operator is CmpOperator.EQ:
-        return "eq"
+def _encode_link_assigned_expression(expression: LinkAssignedBooleanExpression) -> str:
+    link_attribute_type = string(expression.link_attribute_type)
+    link_reference = string(expression.link_reference)
+    return (
+        f'{{"linkAttributeType": {link_attribute_type}, "linkReference": {link_reference}, '
+        '"type": "linkAssigned"}'
+    )
 
-    if operator is CmpOperator.GT:
-        return "gt"
 
-    if operator is CmpOperator.GTE:
-        return "gte"
+def _encode_link_attribute_expression(expression: _LinkAttributeExpression) -> str:
+    link_attribute_type = string(expression.link_attribute_type)
+    link_reference = string(expression.link_reference)
+    return (
+        f'{{"linkAttributeType": {link_attribute_type}, "linkReference": {link_reference}, '
+        '"type": "linkAttribute"}'
+    )
 
-    if operator is CmpOperator.LT:
-        return "lt"
 
-    if operator is CmpOperator.LTE:
-        return "lte"
+def _encode_linked_to_expression(expression: LinkedToBooleanExpression) -> Parts:
+    alias = string(expression.alias)
+    entity_type = string(expression.entity_type)
+    return [
+        f'{{"alias": {alias}, "condition": ',
+        expression.condition,
+        f', "entityType": {entity_type}, "sourceId": {expression.source_id}, "type": "linkedTo"}}',
+    ]
+
+
+def _encode_literal_boolean_expression(expression: LiteralBooleanExpression) -> str:
+    boolean = _booleans[expression.boolean]
+    return f'{{"boolean": {boolean}, "type": "literal"}}'
 
-    if operator is CmpOperator.NEQ:
-        return "neq"
 
+def _encode_literal_date_expression(expression: LiteralDateExpression) -> str:
+    date = expression.date.isoformat()
+    return f'{{"date": "{date}", "type": "literal"}}'
 
-def _encode_composite_boolean_expression(
-    exprs: List[BooleanExpression], type: str
-) -> object:
-    expr_iter = map(encode_boolean_expression, exprs)
-    return {"exprs": expr_iter, "type": type}
 
+def _encode_literal_date_time_expression(expression: LiteralDateTimeExpression) -> str:
+    date_time = encode_datetime(expression.date_time)
+    date_time_text = value(date_time)
+    return f'{{"dateTime": {date_time_text}, "type": "literal"}}'
+
+
+def _encode_literal_number_expression(expression: LiteralNumberExpression) -> str:
+    number = value(expression.number)
+    return f'{{"number": {number}, "type": "literal"}}'
 
-def _encode_cmp_expression(
-    func: _EncodeFunc[_T], lhs: _T, operator: CmpOperator, rhs: _T, type: str
-) -> object:
-    lhs_obj = func(lhs)
-    operator_obj = _encode_cmp_operator(operator)
-    rhs_obj = func(rhs)
-    return {
-        "lhs": lhs_obj,
-        "operator": operator_obj,
-        "rhs": rhs_obj,
-        "type": type,
-    }
 
+def _encode_literal_string_expression(expression: LiteralStringExpression) -> str:
+    string_text = string(expression.string)
+    return f'{{"string": {string_text}, "type": "literal"}}'
 
-def _encode_link_attribute_expression(
-    link_attribute_type: str, link_reference: str
-) -> object:
-    return {
-        "linkAttributeType": link_attribute_type,
-        "linkReference": link_reference,
-        "type": "linkAttribute",
-    }
 
+def _encode_literal_time_expression(expression: LiteralTimeExpression) -> str:
+    time = _set_timezone(expression.time).isoformat()
+    return f'{{"time": "{time}", "type": "literal"}}'
 
-def _encode_match_mode(mode: MatchMode) -> object:
-    if mode is MatchMode.CASE_INSENSITIVE:
-        return "caseInsensitive"
 
-    if mode is MatchMode.CASE_SENSITIVE:
-        return "caseSensitive"
+def _encode_match_expression(expression: MatchBooleanExpression) -> Parts:
+    mode = _match_modes[expression.mode]
+    operator = _match_operators[expression.operator]
+    return [
+        '{"lhs": ',
+        expression.lhs,
+        f', "mode": {mode}, "operator": {operator}, "rhs": ',
+        expression.rhs,
+        ', "type": "match"}',
+    ]
 
 
-def _encode_match_operator(operator: MatchOperator) -> object:
-    if operator is MatchOperator.CONTAINS:
-        return "contains"
+def _encode_name_expression(expression: NameStringExpression) -> str:
+    reference = string(expression.reference)
+    return f'{{"reference": {reference}, "type": "name"}}'
 
-    if operator is MatchOperator.ENDS_WITH:
-        return "endsWith"
 
-    if operator is MatchOperator.EQUALS:
-        return "equals"
+def _encode_not_expression(expression: NotBooleanExpression) -> Parts:
+    return ['{"expr": ', expression.expr, ', "type": "not"}']
 
-    if operator is MatchOperator.STARTS_WITH:
-        return "startsWith"
+
+def _encode_relative_date_expression(expression: RelativeDateExpression) -> str:
+    future = _booleans[expression.future]
+    return (
+        f'{{"days": {expression.days}, "future": {future}, "months": {expression.months}, '
+        f'"type": "relativeDate", "years": {expression.years}}}'
+    )
+
+
+def _encode_relative_date_time_expression(
+    expression: RelativeDateTimeExpression,
+) -> str:
+    future = _booleans[expression.future]
+    return (
+        f'{{"days": {expression.days}, "future": {future}, "hours": {expression.hours}, '
+        f'"minutes": {expression.minutes}, "months": {expression.months}, "seconds": {expression.seconds}, '
+        f'"type": "relativeDateTime", "years": {expression.years}}}'
+    )
 
 
 def _set_timezone(time: time) -> time:
     if time.tzinfo is None:
         return time.replace(tzinfo=local_timezone)
     return time
+
+
+expression_rules.add_leaf(ActiveBooleanExpression, _encode_active_expression)
+expression_rules.add_node(AllBooleanExpression, _encode_all_expression)
+expression_rules.add_node(AnyBooleanExpression, _encode_any_expression)
+expression_rules.add_leaf(AssignedBooleanExpression, _encode_assigned_expression)
+expression_rules.add_leaf(AttributeBooleanExpression, _encode_attribute_expression)
+expression_rules.add_leaf(AttributeDateExpression, _encode_attribute_expression)
+expression_rules.add_leaf(AttributeDateTimeExpression, _encode_attribute_expression)
+expression_rules.add_leaf(AttributeNumberExpression, _encode_attribute_expression)
+expression_rules.add_leaf(AttributeStringExpression, _encode_attribute_expression)
+expression_rules.add_leaf(AttributeTimeExpression, _encode_attribute_expression)
+expression_rules.add_node(
+    DateCmpBooleanExpression, partial(_encode_cmp_expression, '"dateCmp"')
+)
+expression_rules.add_node(
+    DateTimeCmpBooleanExpression, partial(_encode_cmp_expression, '"dateTimeCmp"')
+)
+expression_rules.add_node(
+    DirectLinkAggregateNumberExpression,
+    _encode_direct_link_aggregate_expression,
+)
+expression_rules.add_node(
+    DirectlyLinkedToBooleanExpression,
+    _encode_directly_linked_to_expression,
+)
+expression_rules.add_leaf(IdInBooleanExpression, _encode_id_in_expression)
+expression_rules.add_leaf(IdStringExpression, _encode_id_expression)
+expression_rules.add_node(
+    LinkAggregateNumberExpression, _encode_link_aggregate_expression
+)
+expression_rules.add_leaf(
+    LinkAssignedBooleanExpression, _encode_link_assigned_expression
+)
+expression_rules.add_leaf(
+    LinkAttributeBooleanExpression, _encode_link_attribute_expression
+)
+expression_rules.add_leaf(
+    LinkAttributeDateExpression, _encode_link_attribute_expression
+)
+expression_rules.add_leaf(
+    LinkAttributeDateTimeExpression, _encode_link_attribute_expression
+)
+expression_rules.add_leaf(
+    LinkAttributeNumberExpression, _encode_link_attribute_expression
+)
+expression_rules.add_leaf(
+    LinkAttributeStringExpression, _encode_link_attribute_expression
+)
+expression_rules.add_leaf(
+    LinkAttributeTimeExpression, _encode_link_attribute_expression
+)
+expression_rules.add_node(LinkedToBooleanExpression, _encode_linked_to_expression)
+expression_rules.add_leaf(LiteralBooleanExpression, _encode_literal_boolean_expression)
+expression_rules.add_leaf(LiteralDateExpression, _encode_literal_date_expression)
+expression_rules.add_leaf(
+    LiteralDateTimeExpression, _encode_literal_date_time_expression
+)
+expression_rules.add_leaf(LiteralNumberExpression, _encode_literal_number_expression)
+expression_rules.add_leaf(LiteralStringExpression, _encode_literal_string_expression)
+expression_rules.add_leaf(LiteralTimeExpression, _encode_literal_time_expression)
+expression_rules.add_node(MatchBooleanExpression, _encode_match_expression)
+expression_rules.add_leaf(NameStringExpression, _encode_name_expression)
+expression_rules.add_node(NotBooleanExpression, _encode_not_expression)
+expression_rules.add_node(
+    NumberCmpBooleanExpression, partial(_encode_cmp_expression, '"numberCmp"')
+)
+expression_rules.add_leaf(RelativeDateExpression, _encode_relative_date_expression)
+expression_rules.add_leaf(
+    RelativeDateTimeExpression, _encode_relative_date_time_expression
+)
+expression_rules.add_node(
+    TimeCmpBooleanExpression, partial(_encode_cmp_expression, '"timeCmp"')
+)
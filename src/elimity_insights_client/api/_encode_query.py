@@ -1,11 +1,8 @@
-from elimity_insights_client.api._encode_expression import (
-    encode_boolean_expression,
-    encode_date_expression,
-    encode_date_time_expression,
-    encode_number_expression,
-    encode_string_expression,
-    encode_time_expression,
-)
+from functools import partial
+from typing import Union
+
+from elimity_insights_client.api._encode_expression import expression_rules
+from elimity_insights_client.api._encoder import Parts, encode, join, string
 from elimity_insights_client.api.query import (
     AnyExpression,
     BooleanAnyExpression,
@@ -16,7 +13,6 @@ from elimity_insights_client.api.query import (
     DirectLinkGroupByQuery,
     DirectLinkQuery,
     Grouping,
-    GroupOrdering,
     GroupOrderingType,
     LinkGroupByQuery,
     NumberAnyExpression,
@@ -27,151 +23,105 @@ from elimity_insights_client.api.query import (
     UnspecifiedGroupOrdering,
 )
 
+_ListQuery = Union[DirectLinkQuery, Query]
+
+_directions = {Direction.ASC: '"asc"', Direction.DESC: '"desc"'}
+_group_ordering_types = {
+    GroupOrderingType.COUNT: '"count"',
+    GroupOrderingType.LABEL: '"label"',
+}
+
+_rules = expression_rules.copy()
+
 
 def encode_query(query: Query) -> object:
-    condition = encode_boolean_expression(query.condition)
-    direct_link_group_by_queries = map(
-        _encode_direct_link_group_by_query, query.direct_link_group_by_queries
-    )
-    direct_link_queries = map(_encode_direct_link_query, query.direct_link_queries)
-    include = map(_encode_any_expression, query.include)
-    link_group_by_queries = map(
-        _encode_link_group_by_query, query.link_group_by_queries
-    )
-    link_queries = map(encode_query, query.link_queries)
-    order_by = map(_encode_ordering, query.order_by)
-    return {
-        "alias": query.alias,
-        "condition": condition,
-        "directLinkGroupByQueries": direct_link_group_by_queries,
-        "directLinkQueries": direct_link_queries,
-        "entityType": query.entity_type,
-        "include": include,
-        "limit": query.limit,
-        "linkGroupByQueries": link_group_by_queries,
-        "linkQueries": link_queries,
-        "offset": query.offset,
-        "orderBy": order_by,
-        "sourceId": query.source_id,
-    }
-
-
-def _encode_any_expression(expression: AnyExpression) -> object:
-    if isinstance(expression, BooleanAnyExpression):
-        expr = encode_boolean_expression(expression.expr)
-        return {"expr": expr, "type": "boolean"}
-
-    if isinstance(expression, DateAnyExpression):
-        expr = encode_date_expression(expression.expr)
-        return {"expr": expr, "type": "date"}
-
-    if isinstance(expression, DateTimeAnyExpression):
-        expr = encode_date_time_expression(expression.expr)
-        return {"expr": expr, "type": "dateTime"}
-
-    if isinstance(expression, NumberAnyExpression):
-        expr = encode_number_expression(expression.expr)
-        return {"expr": expr, "type": "number"}
-
-    if isinstance(expression, StringAnyExpression):
-        expr = encode_string_expression(expression.expr)
-        return {"expr": expr, "type": "string"}
-
-    if isinstance(expression, TimeAnyExpression):
-        expr = encode_time_expression(expression.expr)
-        return {"expr": expr, "type": "time"}
-
-
-def _encode_direction(direction: Direction) -> object:
-    if direction is Direction.ASC:
-        return "asc"
-
-    if direction is Direction.DESC:
-        return "desc"
-
-
-def _encode_direct_link_group_by_query(query: DirectLinkGroupByQuery) -> object:
-    condition = encode_boolean_expression(query.condition)
-    group_by = map(_encode_grouping, query.group_by)
-    return {
-        "alias": query.alias,
-        "condition": condition,
-        "entityType": query.entity_type,
-        "groupBy": group_by,
-        "linkAlias": query.link_alias,
-        "sourceId": query.source_id,
-    }
-
-
-def _encode_direct_link_query(query: DirectLinkQuery) -> object:
-    condition = encode_boolean_expression(query.condition)
-    direct_link_group_by_queries = map(
-        _encode_direct_link_group_by_query, query.direct_link_group_by_queries
-    )
-    direct_link_queries = map(_encode_direct_link_query, query.direct_link_queries)
-    include = map(_encode_any_expression, query.include)
-    link_group_by_queries = map(
-        _encode_link_group_by_query, query.link_group_by_queries
-    )
-    link_queries = map(encode_query, query.link_queries)
-    order_by = map(_encode_ordering, query.order_by)
-    return {
-        "alias": query.alias,
-        "condition": condition,
-        "directLinkGroupByQueries": direct_link_group_by_queries,
-        "directLinkQueries": direct_link_queries,
-        "entityType": query.entity_type,
-        "include": include,
-        "limit": query.limit,
-        "linkAlias": query.link_alias,
-        "linkGroupByQueries": link_group_by_queries,
-        "linkQueries": link_queries,
-        "offset": query.offset,
-        "orderBy": order_by,
-        "sourceId": query.source_id,
-    }
-
-
-def _encode_grouping(grouping: Grouping) -> object:
-    key = _encode_any_expression(grouping.key)
-    ordering = _encode_group_ordering(grouping.ordering)
-    return {"key": key, "ordering": ordering}
-
-
-def _encode_group_ordering(ordering: GroupOrdering) -> object:
-    if isinstance(ordering, DirectedGroupOrdering):
-        direction = _encode_direction(ordering.direction)
-        type = _encode_group_ordering_type(ordering.type)
-        return {"direction": direction, "type": type}
-
-    if isinstance(ordering, UnspecifiedGroupOrdering):
-        return {"type": "none"}
-
-
-def _encode_group_ordering_type(type: GroupOrderingType) -> object:
-    if type is GroupOrderingType.COUNT:
-        return "count"
-
-    if type is GroupOrderingType.LABEL:
-        return "label"
-
-
-def _encode_link_group_by_query(query: LinkGroupByQuery) -> object:
-    condition = encode_boolean_expression(query.condition)
-    group_by = map(_encode_grouping, query.group_by)
-    return {
-        "alias": query.alias,
-        "condition": condition,
-        "entityType": query.entity_type,
-        "groupBy": group_by,
-        "sourceId": query.source_id,
-    }
-
-
-def _encode_ordering(ordering: Ordering) -> object:
-    any_expression = _encode_any_expression(ordering.any_expression)
-    direction = _encode_direction(ordering.direction)
-    return {
-        "anyExpression": any_expression,
-        "direction": direction,
-    }
+    """Encode the given query to a JSON value."""
+    return encode(_rules, query)
+
+
+def _encode_any_expression(type: str, expression: AnyExpression) -> Parts:
+    return ['{"expr": ', expression.expr, f', "type": {type}}}']
+
+
+def _encode_directed_group_ordering(ordering: DirectedGroupOrdering) -> str:
+    direction = _directions[ordering.direction]
+    type = _group_ordering_types[ordering.type]
+    return f'{{"direction": {direction}, "type": {type}}}'
+
+
+def _encode_direct_link_group_by_query(query: DirectLinkGroupByQuery) -> Parts:
+    alias = string(query.alias)
+    entity_type = string(query.entity_type)
+    link_alias = string(query.link_alias)
+    parts: Parts = [f'{{"alias": {alias}, "condition": ', query.condition]
+    parts.append(f', "entityType": {entity_type}, "groupBy": [')
+    join(parts, query.group_by)
+    parts.append(f'], "linkAlias": {link_alias}, "sourceId": {query.source_id}}}')
+    return parts
+
+
+def _encode_grouping(grouping: Grouping) -> Parts:
+    return ['{"key": ', grouping.key, ', "ordering": ', grouping.ordering, "}"]
+
+
+def _encode_link_group_by_query(query: LinkGroupByQuery) -> Parts:
+    alias = string(query.alias)
+    entity_type = string(query.entity_type)
+    parts: Parts = [f'{{"alias": {alias}, "condition": ', query.condition]
+    parts.append(f', "entityType": {entity_type}, "groupBy": [')
+    join(parts, query.group_by)
+    parts.append(f'], "sourceId": {query.source_id}}}')
+    return parts
+
+
+def _encode_list_query(query: _ListQuery) -> Parts:
+    alias = string(query.alias)
+    entity_type = string(query.entity_type)
+    parts: Parts = [f'{{"alias": {alias}, "condition": ', query.condition]
+    parts.append(', "directLinkGroupByQueries": [')
+    join(parts, query.direct_link_group_by_queries)
+    parts.append('], "directLinkQueries": [')
+    join(parts, query.direct_link_queries)
+    parts.append(f'], "entityType": {entity_type}, "include": [')
+    join(parts, query.include)
+    parts.append(f'], "limit": {query.limit}, ')
+    if isinstance(query, DirectLinkQuery):
+        link_alias = string(query.link_alias)
+        parts.append(f'"linkAlias": {link_alias}, ')
+    parts.append('"linkGroupByQueries": [')
+    join(parts, query.link_group_by_queries)
+    parts.append('], "linkQueries": [')
+    join(parts, query.link_queries)
+    parts.append(f'], "offset": {query.offset}, "orderBy": [')
+    join(parts, query.order_by)
+    parts.append(f'], "sourceId": {query.source_id}}}')
+    return parts
+
+
+def _encode_ordering(ordering: Ordering) -> Parts:
+    direction = _directions[ordering.direction]
+    return [
+        '{"anyExpression": ',
+        ordering.any_expression,
+        f', "direction": {direction}}}',
+    ]
+
+
+def _encode_unspecified_group_ordering(ordering: UnspecifiedGroupOrdering) -> str:
+    return '{"type": "none"}'
+
+
+_rules.add_node(BooleanAnyExpression, partial(_encode_any_expression, '"boolean"'))
+_rules.add_node(DateAnyExpression, partial(_encode_any_expression, '"date"'))
+_rules.add_node(DateTimeAnyExpression, partial(_encode_any_expression, '"dateTime"'))
+_rules.add_leaf(DirectedGroupOrdering, _encode_directed_group_ordering)
+_rules.add_node(DirectLinkGroupByQuery, _encode_direct_link_group_by_query)
+_rules.add_node(DirectLinkQuery, _encode_list_query)
+_rules.add_node(Grouping, _encode_grouping)
+_rules.add_node(LinkGroupByQuery, _encode_link_group_by_query)
+_rules.add_node(NumberAnyExpression, partial(_encode_any_expression, '"number"'))
+_rules.add_node(Ordering, _encode_ordering)
+_rules.add_node(Query, _encode_list_query)
+_rules.add_node(StringAnyExpression, partial(_encode_any_expression, '"string"'))
+_rules.add_node(TimeAnyExpression, partial(_encode_any_expression, '"time"'))
+_rules.add_leaf(UnspecifiedGroupOrdering, _encode_unspecified_group_ordering)
@@ -0,0 +1,25 @@
+from elimity_insights_client.api._decode_query_results_page import ValueDict
+from elimity_insights_client.api.query_results_page import (
+    BooleanValue,
+    DateTimeValue,
+    DateValue,
+    NumberValue,
+    StringValue,
+    Value,
+)
+
+
+def encode_value(value: Value) -> ValueDict:
+    """Encode the given value to a JSON value, which decode_value decodes to an equal value."""
+    if isinstance(value, BooleanValue):
+        boolean = "true" if value.value else "false"
+        return {"type": "boolean", "value": boolean}
+    if isinstance(value, DateValue):
+        return {"type": "date", "value": value.value.isoformat()}
+    if isinstance(value, DateTimeValue):
+        return {"type": "dateTime", "value": value.value.isoformat()}
+    if isinstance(value, NumberValue):
+        return {"type": "number", "value": repr(value.value)}
+    if isinstance(value, StringValue):
+        return {"type": "string", "value": value.value}
+    return {"type": "time", "value": value.value.isoformat()}
@@ -0,0 +1,110 @@
+from typing import Callable, Dict, Iterable, List, Sequence, Type, TypeVar, cast
+
+from simplejson import RawJSON
+from simplejson.encoder import encode_basestring_ascii
+
+from elimity_insights_client._util import encoder
+
+Parts = List[object]
+
+_T = TypeVar("_T")
+
+string = encode_basestring_ascii
+
+
+class Rules:
+    """
+    Table of encoding rules, indexed by the type of the nodes they apply to.
+
+    Nodes of a type without rules use the rule of their nearest base class, which is then registered for the type.
+    """
+
+    def __init__(self) -> None:
+        """Return a new table without rules."""
+        self.leaves: Dict[type, Callable[[object], str]] = {}
+        self.nodes: Dict[type, Callable[[object], Sequence[object]]] = {}
+
+    def add_leaf(self, type: Type[_T], rule: Callable[[_T], str]) -> None:
+        """Register a rule encoding nodes of the given type, which have no children, to JSON text."""
+        self.leaves[type] = cast(Callable[[object], str], rule)
+
+    def add_node(self, type: Type[_T], rule: Callable[[_T], Sequence[object]]) -> None:
+        """
+        Register a rule encoding nodes of the given type to a sequence of parts.
+
+        Each part is either a string containing JSON text, or a child node that is
+        encoded in its place.
+        """
+        self.nodes[type] = cast(Callable[[object], Sequence[object]], rule)
+
+    def copy(self) -> "Rules":
+        """Return a new table containing the same rules as this table."""
+        rules = Rules()
+        rules.leaves.update(self.leaves)
+        rules.nodes.update(self.nodes)
+        return rules
+
+    def resolve(self, type: type) -> None:
+        """Register the rule of the nearest base class of the given type for the type, or raise a TypeError."""
+        for base in type.__mro__[1:]:
+            leaf = self.leaves.get(base)
+            if leaf is not None:
+                self.leaves[type] = leaf
+                return
+            node = self.nodes.get(base)
+            if node is not None:
+                self.nodes[type] = node
+                return
+        raise TypeError(f"cannot encode {type.__name__}")
+
+
+def encode(rules: Rules, node: object) -> object:
+    """
+    Encode the given node to a JSON value using the given rules.
+
+    The tree is traversed using an explicit stack, so its depth is not limited
+    by the interpreter's recursion limit. The resulting value embeds JSON text
+    that is equal to the text produced by serializing the tree's JSON value.
+    """
+    leaves = rules.leaves
+    nodes = rules.nodes
+    texts: List[str] = []
+    stack: List[object] = [node]
+    pop = stack.pop
+    extend = stack.extend
+    append = texts.append
+    while stack:
+        item = pop()
+        if isinstance(item, str):
+            append(item)
+            continue
+
+        cls = type(item)
+        leaf = leaves.get(cls)
+        if leaf is None and cls not in nodes:
+            rules.resolve(cls)
+            leaf = leaves.get(cls)
+        if leaf is None:
+            parts = nodes[cls](item)
+            extend(reversed(parts))
+        else:
+            text = leaf(item)
+            append(text)
+    text = "".join(texts)
+    return RawJSON(text)
+
+
+def join(parts: Parts, nodes: Iterable[object]) -> None:
+    """Append the given nodes to the given parts, separated by commas."""
+    iterator = iter(nodes)
+    for node in iterator:
+        parts.append(node)
+        break
+    for node in iterator:
+        parts.append(", ")
+        parts.append(node)
+
+
+def value(value: object) -> str:
+    """Encode the given JSON value to JSON text."""
+    return encoder.encode(value)
@@ -0,0 +1,487 @@
+from datetime import date, datetime
+from importlib import import_module
+from itertools import repeat
+from operator import eq, ge, gt, le, lt, ne
+from types import ModuleType
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from dateutil.relativedelta import relativedelta
+from dateutil.utils import default_tzinfo
+
+from elimity_insights_client._util import local_timezone, localize_time, map_list
+from elimity_insights_client.api.expression import (
+    ActiveBooleanExpression,
+    AllBooleanExpression,
+    AnyBooleanExpression,
+    AssignedBooleanExpression,
+    AttributeBooleanExpression,
+    AttributeDateExpression,
+    AttributeDateTimeExpression,
+    AttributeNumberExpression,
+    AttributeStringExpression,
+    AttributeTimeExpression,
+    BooleanExpression,
+    CmpOperator,
+    DateCmpBooleanExpression,
+    DateTimeCmpBooleanExpression,
+    IdInBooleanExpression,
+    IdStringExpression,
+    LiteralBooleanExpression,
+    LiteralDateExpression,
+    LiteralDateTimeExpression,
+    LiteralNumberExpression,
+    LiteralStringExpression,
+    LiteralTimeExpression,
+    MatchBooleanExpression,
+    MatchMode,
+    MatchOperator,
+    NameStringExpression,
+    NotBooleanExpression,
+    NumberCmpBooleanExpression,
+    RelativeDateExpression,
+    RelativeDateTimeExpression,
+    TimeCmpBooleanExpression,
+)
+
+try:
+    _numpy: Optional[ModuleType] = import_module("numpy")
+except ImportError:
+    _numpy = None
+
+_Columns = Mapping[str, Sequence[object]]
+_Mask = Sequence[bool]
+_Condition = Callable[[_Columns], _Mask]
+_Op = Callable[[object, object], object]
+_Operand = Callable[[_Columns], "_Values"]
+_Values = Tuple[object, Optional[_Mask], bool]
+_T = TypeVar("_T")
+
+_Cmp = TypeVar(
+    "_Cmp",
+    DateCmpBooleanExpression,
+    DateTimeCmpBooleanExpression,
+    NumberCmpBooleanExpression,
+    TimeCmpBooleanExpression,
+)
+
+
+def compile_boolean_expression(expression: BooleanExpression) -> _Condition:
+    """
+    Compile the given expression to a function evaluating it over columns of entities.
+
+    The resulting function returns a mask indicating which rows match the expression, for columns as returned by
+    api.entities.entities_columns or with the same names. The id and name columns hold the details of each row,
+    and the attribute_<attribute type id> and attribute_<attribute type id>_valid columns hold the plain values and
+    presence of each attribute type. Missing attribute columns indicate that the attribute type is not assigned for
+    any row. The optional active column indicates which rows are active. Since entities_columns does not include
+    it, no row is active without it. Comparisons and matches with an absent value do not hold, and naive literal
+    times are compared in the local timezone, like naive literal date-times. If NumPy is installed, expressions are
+    evaluated using vectorized operations on NumPy arrays, otherwise they are evaluated row by row. Expression
+    references are ignored, and expressions involving links raise a ValueError.
+    """
+    return _compile(expression)
+
+
+def evaluate_boolean_expression(
+    expression: BooleanExpression, columns: _Columns
+) -> _Mask:
+    """Evaluate the given expression over the given columns, like compile_boolean_expression."""
+    condition = compile_boolean_expression(expression)
+    return condition(columns)
+
+
+def _and(lhs: _Mask, rhs: _Mask) -> _Mask:
+    if _numpy is None:
+        return [left and right for left, right in zip(lhs, rhs)]
+    return cast(_Mask, _numpy.logical_and(lhs, rhs))
+
+
+def _apply(
+    numpy_op: _Op, python_op: _Op, lhs: _Values, rhs: _Values, length: int
+) -> _Mask:
+    lhs_values, lhs_valid, lhs_column = lhs
+    rhs_values, rhs_valid, rhs_column = rhs
+    valid = rhs_valid if lhs_valid is None else lhs_valid
+    if lhs_valid is not None and rhs_valid is not None:
+        valid = _and(lhs_valid, rhs_valid)
+
+    if not lhs_column and not rhs_column:
+        result = bool(python_op(lhs_values, rhs_values))
+        return _full(length, result)
+
+    if _numpy is None:
+        lhs_iter = _iterate(lhs_values, lhs_column)
+        rhs_iter = _iterate(rhs_values, rhs_column)
+        valid_iter = repeat(True) if valid is None else valid
+        items = zip(valid_iter, lhs_iter, rhs_iter)
+        return [
+            is_valid and bool(python_op(left, right)) for is_valid, left, right in items
+        ]
+
+    if valid is None:
+        result_array = numpy_op(lhs_values, rhs_values)
+        return cast(_Mask, _numpy.asarray(result_array, dtype=bool))
+
+    valid_array = _numpy.asarray(valid, dtype=bool)
+    lhs_selected = _numpy.asarray(lhs_values)[valid_array] if lhs_column else lhs_values
+    rhs_selected = _numpy.asarray(rhs_values)[valid_array] if rhs_column else rhs_values
+    mask = _numpy.zeros(length, dtype=bool)
+    mask[valid_array] = numpy_op(lhs_selected, rhs_selected)
+    return cast(_Mask, mask)
+
+
+def _attribute_column(expression: object) -> _Operand:
+    attribute_type = cast(AttributeNumberExpression, expression).attribute_type
+    name = f"attribute_{attribute_type}"
+
+    def operand(columns: _Columns) -> _Values:
+        valid = _valid(columns, name)
+        values = columns.get(name, valid)
+        return values, valid, True
+
+    return operand
+
+
+def _compile(expression: object) -> _Condition:
+    rule = _rules.get(type(expression))
+    if rule is None:
+        raise ValueError(f"unsupported expression: {type(expression).__name__}")
+    return rule(expression)
+
+
+def _compile_active(expression: ActiveBooleanExpression) -> _Condition:
+    def condition(columns: _Columns) -> _Mask:
+        active = columns.get("active")
+        if active is None:
+            return _full(_length(columns), False)
+        return _mask(active)
+
+    return condition
+
+
+def _compile_all(expression: AllBooleanExpression) -> _Condition:
+    conditions = map_list(_compile, expression.exprs)
+
+    def condition(columns: _Columns) -> _Mask:
+        mask = _full(_length(columns), True)
+        for sub_condition in conditions:
+            mask = _and(mask, sub_condition(columns))
+        return mask
+
+    return condition
+
+
+def _compile_any(expression: AnyBooleanExpression) -> _Condition:
+    conditions = map_list(_compile, expression.exprs)
+
+    def condition(columns: _Columns) -> _Mask:
+        mask = _full(_length(columns), False)
+        for sub_condition in conditions:
+            mask = _or(mask, sub_condition(columns))
+        return mask
+
+    return condition
+
+
+def _compile_assigned(expression: AssignedBooleanExpression) -> _Condition:
+    name = f"attribute_{expression.attribute_type}"
+    return lambda columns: _valid(columns, name)
+
+
+def _compile_attribute(expression: AttributeBooleanExpression) -> _Condition:
+    name = f"attribute_{expression.attribute_type}"
+
+    def condition(columns: _Columns) -> _Mask:
+        valid = _valid(columns, name)
+        values = columns.get(name)
+        if values is None:
+            return valid
+        return _and(valid, _mask(values))
+
+    return condition
+
+
+def _compile_cmp(expression: _Cmp) -> _Condition:
+    lhs = _operand(expression.lhs)
+    op = _cmp_operators[expression.operator]
+    rhs = _operand(expression.rhs)
+
+    def condition(columns: _Columns) -> _Mask:
+        length = _length(columns)
+        return _apply(op, op, lhs(columns), rhs(columns), length)
+
+    return condition
+
+
+def _compile_id_in(expression: IdInBooleanExpression) -> _Condition:
+    ids = set(expression.ids)
+    id_list = list(ids)
+
+    def condition(columns: _Columns) -> _Mask:
+        id_column = columns["id"]
+        if _numpy is None:
+            return [id in ids for id in id_column]
+        id_array = _numpy.asarray(id_column, dtype=object)
+        return cast(_Mask, _numpy.isin(id_array, id_list))
+
+    return condition
+
+
+def _compile_literal(expression: LiteralBooleanExpression) -> _Condition:
+    return lambda columns: _full(_length(columns), expression.boolean)
+
+
+def _compile_match(expression: MatchBooleanExpression) -> _Condition:
+    lhs = _operand(expression.lhs)
+    numpy_op, python_op = _match_operators[expression.operator]
+    rhs = _operand(expression.rhs)
+    if expression.mode is MatchMode.CASE_INSENSITIVE:
+        numpy_op = _lower_numpy(numpy_op)
+        python_op = _lower_python(python_op)
+
+    def condition(columns: _Columns) -> _Mask:
+        length = _length(columns)
+        return _apply(numpy_op, python_op, lhs(columns), rhs(columns), length)
+
+    return condition
+
+
+def _compile_not(expression: NotBooleanExpression) -> _Condition:
+    condition = _compile(expression.expr)
+
+    def negation(columns: _Columns) -> _Mask:
+        mask = condition(columns)
+        if _numpy is None:
+            return [not value for value in mask]
+        return cast(_Mask, _numpy.logical_not(mask))
+
+    return negation
+
+
+def _contains(lhs: object, rhs: object) -> bool:
+    return cast(str, rhs) in cast(str, lhs)
+
+
+def _contains_numpy(lhs: object, rhs: object) -> object:
+    numpy = cast(ModuleType, _numpy)
+    return numpy.char.find(_strings(lhs), _strings(rhs)) >= 0
+
+
+def _ends_with(lhs: object, rhs: object) -> bool:
+    return cast(str, lhs).endswith(cast(str, rhs))
+
+
+def _ends_with_numpy(lhs: object, rhs: object) -> object:
+    numpy = cast(ModuleType, _numpy)
+    return numpy.char.endswith(_strings(lhs), _strings(rhs))
+
+
+def _equals_numpy(lhs: object, rhs: object) -> object:
+    return _strings(lhs) == _strings(rhs)
+
+
+def _full(length: int, value: bool) -> _Mask:
+    if _numpy is None:
+        return [value] * length
+    return cast(_Mask, _numpy.full(length, value, dtype=bool))
+
+
+def _id(expression: IdStringExpression) -> _Operand:
+    return lambda columns: (columns["id"], None, True)
+
+
+def _iterate(values: object, column: bool) -> Iterable[object]:
+    if column:
+        return cast(Sequence[object], values)
+    return repeat(values)
+
+
+def _length(columns: _Columns) -> int:
+    for column in columns.values():
+        return len(column)
+    return 0
+
+
+def _literal(value: object) -> _Operand:
+    return lambda columns: (value, None, False)
+
+
+def _literal_date(expression: LiteralDateExpression) -> _Operand:
+    return _literal(expression.date)
+
+
+def _literal_date_time(expression: LiteralDateTimeExpression) -> _Operand:
+    date_time = default_tzinfo(expression.date_time, local_timezone)
+    return _literal(date_time)
+
+
+def _literal_number(expression: LiteralNumberExpression) -> _Operand:
+    return _literal(expression.number)
+
+
+def _literal_string(expression: LiteralStringExpression) -> _Operand:
+    return _literal(expression.string)
+
+
+def _literal_time(expression: LiteralTimeExpression) -> _Operand:
+    time = localize_time(expression.time)
+    return _literal(time)
+
+
+def _lower_numpy(op: _Op) -> _Op:
+    def lower_op(lhs: object, rhs: object) -> object:
+        numpy = cast(ModuleType, _numpy)
+        lhs_lower = numpy.char.lower(_strings(lhs))
+        rhs_lower = numpy.char.lower(_strings(rhs))
+        return op(lhs_lower, rhs_lower)
+
+    return lower_op
+
+
+def _lower_python(op: _Op) -> _Op:
+    return lambda lhs, rhs: op(cast(str, lhs).lower(), cast(str, rhs).lower())
+
+
+def _mask(values: Sequence[object]) -> _Mask:
+    if _numpy is None:
+        return [value is True for value in values]
+    array = _numpy.asarray(values)
+    if array.dtype != bool:
+        bools = [value is True for value in array.tolist()]
+        array = _numpy.array(bools, dtype=bool)
+    return cast(_Mask, array)
+
+
+def _name(expression: NameStringExpression) -> _Operand:
+    return lambda columns: (columns["name"], None, True)
+
+
+def _operand(expression: object) -> _Operand:
+    rule = _operand_rules.get(type(expression))
+    if rule is None:
+        raise ValueError(f"unsupported expression: {type(expression).__name__}")
+    return rule(expression)
+
+
+def _or(lhs: _Mask, rhs: _Mask) -> _Mask:
+    if _numpy is None:
+        return [left or right for left, right in zip(lhs, rhs)]
+    return cast(_Mask, _numpy.logical_or(lhs, rhs))
+
+
+def _relative_date(expression: RelativeDateExpression) -> _Operand:
+    delta = relativedelta(
+        days=expression.days, months=expression.months, years=expression.years
+    )
+
+    def operand(columns: _Columns) -> _Values:
+        today = date.today()
+        value = today + delta if expression.future else today - delta
+        return value, None, False
+
+    return operand
+
+
+def _relative_date_time(expression: RelativeDateTimeExpression) -> _Operand:
+    delta = relativedelta(
+        days=expression.days,
+        hours=expression.hours,
+        minutes=expression.minutes,
+        months=expression.months,
+        seconds=expression.seconds,
+        years=expression.years,
+    )
+
+    def operand(columns: _Columns) -> _Values:
+        now = datetime.now(local_timezone)
+        value = now + delta if expression.future else now - delta
+        return value, None, False
+
+    return operand
+
+
+def _starts_with(lhs: object, rhs: object) -> bool:
+    return cast(str, lhs).startswith(cast(str, rhs))
+
+
+def _starts_with_numpy(lhs: object, rhs: object) -> object:
+    numpy = cast(ModuleType, _numpy)
+    return numpy.char.startswith(_strings(lhs), _strings(rhs))
+
+
+def _strings(values: object) -> object:
+    numpy = cast(ModuleType, _numpy)
+    return numpy.asarray(values).astype(str)
+
+
+def _valid(columns: _Columns, name: str) -> _Mask:
+    valid = columns.get(f"{name}_valid")
+    if valid is None:
+        return _full(_length(columns), False)
+    return _mask(valid)
+
+
+_cmp_operators: Dict[CmpOperator, _Op] = {
+    CmpOperator.EQ: eq,
+    CmpOperator.GT: cast(_Op, gt),
+    CmpOperator.GTE: cast(_Op, ge),
+    CmpOperator.LT: cast(_Op, lt),
+    CmpOperator.LTE: cast(_Op, le),
+    CmpOperator.NEQ: ne,
+}
+_match_operators: Dict[MatchOperator, Tuple[_Op, _Op]] = {
+    MatchOperator.CONTAINS: (_contains_numpy, _contains),
+    MatchOperator.ENDS_WITH: (_ends_with_numpy, _ends_with),
+    MatchOperator.EQUALS: (_equals_numpy, eq),
+    MatchOperator.STARTS_WITH: (_starts_with_numpy, _starts_with),
+}
+_operand_rules: Dict[type, Callable[[object], _Operand]] = {}
+_rules: Dict[type, Callable[[object], _Condition]] = {}
+
+
+def _add_operand_rule(type: Type[_T], rule: Callable[[_T], _Operand]) -> None:
+    _operand_rules[type] = cast(Callable[[object], _Operand], rule)
+
+
+def _add_rule(type: Type[_T], rule: Callable[[_T], _Condition]) -> None:
+    _rules[type] = cast(Callable[[object], _Condition], rule)
+
+
+_add_operand_rule(AttributeDateExpression, _attribute_column)
+_add_operand_rule(AttributeDateTimeExpression, _attribute_column)
+_add_operand_rule(AttributeNumberExpression, _attribute_column)
+_add_operand_rule(AttributeStringExpression, _attribute_column)
+_add_operand_rule(AttributeTimeExpression, _attribute_column)
+_add_operand_rule(IdStringExpression, _id)
+_add_operand_rule(LiteralDateExpression, _literal_date)
+_add_operand_rule(LiteralDateTimeExpression, _literal_date_time)
+_add_operand_rule(LiteralNumberExpression, _literal_number)
+_add_operand_rule(LiteralStringExpression, _literal_string)
+_add_operand_rule(LiteralTimeExpression, _literal_time)
+_add_operand_rule(NameStringExpression, _name)
+_add_operand_rule(RelativeDateExpression, _relative_date)
+_add_operand_rule(RelativeDateTimeExpression, _relative_date_time)
+_add_rule(ActiveBooleanExpression, _compile_active)
+_add_rule(AllBooleanExpression, _compile_all)
+_add_rule(AnyBooleanExpression, _compile_any)
+_add_rule(AssignedBooleanExpression, _compile_assigned)
+_add_rule(AttributeBooleanExpression, _compile_attribute)
+_add_rule(DateCmpBooleanExpression, _compile_cmp)
+_add_rule(DateTimeCmpBooleanExpression, _compile_cmp)
+_add_rule(IdInBooleanExpression, _compile_id_in)
+_add_rule(LiteralBooleanExpression, _compile_literal)
+_add_rule(MatchBooleanExpression, _compile_match)
+_add_rule(NotBooleanExpression, _compile_not)
+_add_rule(NumberCmpBooleanExpression, _compile_cmp)
+_add_rule(TimeCmpBooleanExpression, _compile_cmp)
@@ -0,0 +1,656 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
+
+from dateutil.utils import default_tzinfo
+
+from elimity_insights_client import _elimity_insights_client as connector
+from elimity_insights_client._util import local_timezone, localize_time, map_list
+from elimity_insights_client.api._columns import column
+from elimity_insights_client.api._evaluate import compile_boolean_expression
+from elimity_insights_client.api.entities._columns import entities_columns
+from elimity_insights_client.api.entities._entity import Entity
+from elimity_insights_client.api.expression import (
+    ActiveBooleanExpression,
+    AggregateOperator,
+    AllBooleanExpression,
+    AnyBooleanExpression,
+    AssignedBooleanExpression,
+    AttributeBooleanExpression,
+    AttributeDateExpression,
+    AttributeDateTimeExpression,
+    AttributeNumberExpression,
+    AttributeStringExpression,
+    AttributeTimeExpression,
+    BooleanExpression,
+    CmpOperator,
+    DateCmpBooleanExpression,
+    DateTimeCmpBooleanExpression,
+    IdInBooleanExpression,
+    IdStringExpression,
+    LinkAggregateNumberExpression,
+    LinkedToBooleanExpression,
+    LiteralBooleanExpression,
+    LiteralDateExpression,
+    LiteralDateTimeExpression,
+    LiteralNumberExpression,
+    LiteralStringExpression,
+    LiteralTimeExpression,
+    MatchBooleanExpression,
+    MatchMode,
+    MatchOperator,
+    NameStringExpression,
+    NotBooleanExpression,
+    NumberCmpBooleanExpression,
+    TimeCmpBooleanExpression,
+)
+from elimity_insights_client.api.query import (
+    AnyExpression,
+    BooleanAnyExpression,
+    DirectedGroupOrdering,
+    Direction,
+    GroupOrdering,
+    GroupOrderingType,
+    LinkGroupByQuery,
+    Query,
+)
+from elimity_insights_client.api.query_results_page import (
+    BooleanValue,
+    DateTimeValue,
+    DateValue,
+)
+from elimity_insights_client.api.query_results_page import Entity as ResultEntity
+from elimity_insights_client.api.query_results_page import (
+    GroupByQueryResult,
+    GroupByQueryResultsPage,
+    NumberValue,
+    QueryResult,
+    QueryResultsPage,
+    StringValue,
+    TimeValue,
+    Value,
+)
+
+_Attribute = Union[
+    AttributeDateExpression,
+    AttributeDateTimeExpression,
+    AttributeNumberExpression,
+    AttributeStringExpression,
+    AttributeTimeExpression,
+]
+_Cmp = Union[
+    DateCmpBooleanExpression,
+    DateTimeCmpBooleanExpression,
+    MatchBooleanExpression,
+    NumberCmpBooleanExpression,
+    TimeCmpBooleanExpression,
+]
+_Columns = Dict[str, Sequence[object]]
+_Getter = Callable[[int], Value]
+
+
+class LocalQueryEngine:
+    """
+    In-memory query engine over a snapshot of a domain graph, for checking a domain graph before importing it.
+
+    Queries use the same model as api.query and result in the same pages, without a server. Entity types of other
+    sources than the given one have no entities. Entities are indexed by id, and attribute values are indexed on
+    first use in a sorted index, which serves comparisons between an attribute and a literal. Other conditions are
+    evaluated like compile_boolean_expression, except that conditions on linked entities are supported as well.
+    Links are the relationships of the graph in both directions, relationships of which an entity is absent are
+    listed in the orphans attribute instead. Link attributes and direct links are not supported, and entities are
+    always active. Expressions may only refer to the entity of the innermost query, link query or link condition that
+    contains them, by its alias, and other references raise a ValueError. Link aggregates skip linked entities without
+    a number assigned for the aggregated attribute type, except for counts.
+    """
+
+    def __init__(self, graph: connector.DomainGraph, source_id: int) -> None:
+        """Return a new engine for the given domain graph of the source with the given id, reading it once."""
+        self.orphans: List[connector.Relationship] = []
+        self._source_id = source_id
+        self._tables: Dict[str, _Table] = {}
+        for entity in graph.entities:
+            table = self._tables.setdefault(entity.type, _Table(entity.type))
+            table.add(entity)
+        for relationship in graph.relationships:
+            self._add(relationship)
+        for table in self._tables.values():
+            table.freeze()
+
+    def query(self, queries: List[Query]) -> List[QueryResultsPage]:
+        """Perform the given queries and return the result pages, like api.query."""
+        pages: List[QueryResultsPage] = []
+        for query in queries:
+            plan = self._plan(query)
+            page = self._page(plan, plan.rows)
+            pages.append(page)
+        return pages
+
+    def _add(self, relationship: connector.Relationship) -> None:
+        from_table = self._tables.get(relationship.from_entity_type, _empty_table)
+        to_table = self._tables.get(relationship.to_entity_type, _empty_table)
+        from_row = from_table.indexes.get(relationship.from_entity_id)
+        to_row = to_table.indexes.get(relationship.to_entity_id)
+        if from_row is None or to_row is None:
+            self.orphans.append(relationship)
+            return
+        from_table.links[from_row].setdefault(to_table.entity_type, []).append(to_row)
+        to_table.links[to_row].setdefault(from_table.entity_type, []).append(from_row)
+
+    def _aggregate(
+        self, table: "_Table", expression: LinkAggregateNumberExpression
+    ) -> _Getter:
+        target = self._table(expression.source_id, expression.entity_type)
+        alias = expression.alias
+        selection = self._select(target, expression.condition, alias)
+        getter = self._value(target, expression.expr, alias)
+        assigned = _assigned(target, expression)
+        aggregate = _aggregates[expression.op]
+
+        def get(row: int) -> Value:
+            linked = self._linked(table, row, expression.source_id, target.entity_type)
+            values = [
+                cast(float, getter(link).value)
+                for link in linked
+                if link in selection and assigned(link)
+            ]
+            number = aggregate(values)
+            return NumberValue(number)
+
+        return get
+
+    def _getter(
+        self, table: "_Table", expression: AnyExpression, alias: str
+    ) -> _Getter:
+        if isinstance(expression, BooleanAnyExpression):
+            selection = self._select(table, expression.expr, alias)
+            return lambda row: BooleanValue(row in selection)
+        return self._value(table, expression.expr, alias)
+
+    def _group_by_plan(self, query: LinkGroupByQuery) -> "_GroupByPlan":
+        table = self._table(query.source_id, query.entity_type)
+        selection = self._select(table, query.condition, query.alias)
+        groupings = [
+            (self._getter(table, grouping.key, query.alias), grouping.ordering)
+            for grouping in query.group_by
+        ]
+        return _GroupByPlan(groupings, selection, query.source_id, table)
+
+    def _linked(
+        self, table: "_Table", row: int, source_id: int, entity_type: str
+    ) -> Sequence[int]:
+        if source_id != self._source_id:
+            return []
+        return table.links[row].get(entity_type, [])
+
+    def _page(self, plan: "_QueryPlan", rows: Sequence[int]) -> QueryResultsPage:
+        table = plan.table
+        start = plan.offset
+        end = start + plan.limit
+        results: List[QueryResult] = []
+        for row in rows[start:end]:
+            entity = table.entities[row]
+            result_entity = ResultEntity(True, entity.id, entity.name)
+            inclusions = [getter(row) for getter in plan.getters]
+            link_group_by_pages = [
+                _group_page(
+                    group_by_plan.groupings, self._link_rows(table, row, group_by_plan)
+                )
+                for group_by_plan in plan.group_by_plans
+            ]
+            link_pages = [
+                self._page(link_plan, self._ordered_link_rows(table, row, link_plan))
+                for link_plan in plan.link_plans
+            ]
+            result = QueryResult(
+                result_entity, inclusions, link_group_by_pages, link_pages
+            )
+            results.append(result)
+        return QueryResultsPage(len(rows), results)
+
+    def _link_rows(self, table: "_Table", row: int, plan: "_GroupByPlan") -> List[int]:
+        entity_type = plan.table.entity_type
+        linked = self._linked(table, row, plan.source_id, entity_type)
+        return [link for link in linked if link in plan.selection]
+
+    def _ordered_link_rows(
+        self, table: "_Table", row: int, plan: "_QueryPlan"
+    ) -> List[int]:
+        entity_type = plan.table.entity_type
+        linked = self._linked(table, row, plan.source_id, entity_type)
+        positions = plan.positions
+        rows = [link for link in linked if link in positions]
+        rows.sort(key=positions.__getitem__)
+        return rows
+
+    def _plan(self, query: Query) -> "_QueryPlan":
+        if query.direct_link_group_by_queries or query.direct_link_queries:
+            raise ValueError("unsupported query: direct link queries")
+        table = self._table(query.source_id, query.entity_type)
+        selection = self._select(table, query.condition, query.alias)
+        rows = sorted(selection)
+        for ordering in reversed(query.order_by):
+            getter = self._getter(table, ordering.any_expression, query.alias)
+            reverse = ordering.direction is Direction.DESC
+            rows.sort(key=lambda row: getter(row).value, reverse=reverse)
+        positions = {row: position for position, row in enumerate(rows)}
+        getters = [
+            self._getter(table, expression, query.alias) for expression in query.include
+        ]
+        group_by_plans = map_list(self._group_by_plan, query.link_group_by_queries)
+        link_plans = map_list(self._plan, query.link_queries)
+        return _QueryPlan(
+            getters,
+            group_by_plans,
+            query.limit,
+            link_plans,
+            query.offset,
+            positions,
+            rows,
+            query.source_id,
+            table,
+        )
+
+    def _select(
+        self, table: "_Table", expression: BooleanExpression, alias: str
+    ) -> Set[int]:
+        _check_reference(expression, alias)
+        if isinstance(expression, AllBooleanExpression):
+            selection = set(range(len(table.entities)))
+            for sub_expression in expression.exprs:
+                if not selection:
+                    break
+                selection &= self._select(table, sub_expression, alias)
+            return selection
+
+        elif isinstance(expression, AnyBooleanExpression):
+            selection = set()
+            for sub_expression in expression.exprs:
+                selection |= self._select(table, sub_expression, alias)
+            return selection
+
+        elif isinstance(expression, IdInBooleanExpression):
+            return {table.indexes[id] for id in expression.ids if id in table.indexes}
+
+        elif isinstance(expression, LinkedToBooleanExpression):
+            target = self._table(expression.source_id, expression.entity_type)
+            selection = set()
+            target_condition = expression.condition
+            alias = expression.alias
+            for target_row in self._select(target, target_condition, alias):
+                links = self._linked(
+                    target, target_row, self._source_id, table.entity_type
+                )
+                selection.update(links)
+            return selection
+
+        elif isinstance(expression, LiteralBooleanExpression):
+            return set(range(len(table.entities))) if expression.boolean else set()
+
+        elif isinstance(expression, NotBooleanExpression):
+            selection = self._select(table, expression.expr, alias)
+            return set(range(len(table.entities))) - selection
+
+        elif isinstance(expression, _cmp_types):
+            _check_reference(expression.lhs, alias)
+            _check_reference(expression.rhs, alias)
+            indexed = _indexed(table, expression)
+            if indexed is not None:
+                return indexed
+
+        condition = compile_boolean_expression(expression)
+        mask = condition(table.columns())
+        return {row for row, matches in enumerate(mask) if matches}
+
+    def _table(self, source_id: int, entity_type: str) -> "_Table":
+        table = self._tables.get(entity_type)
+        if source_id != self._source_id or table is None:
+            return _Table(entity_type)
+        return table
+
+    def _value(self, table: "_Table", expression: object, alias: str) -> _Getter:
+        _check_reference(expression, alias)
+        zero = _zero_values.get(type(expression))
+        if zero is not None:
+            attribute_type = cast(_Attribute, expression).attribute_type
+            zero_value = zero
+
+            def get(row: int) -> Value:
+                assignments = table.entities[row].attribute_assignments
+                return assignments.get(attribute_type, zero_value)
+
+            return get
+
+        if isinstance(expression, IdStringExpression):
+            return lambda row: StringValue(table.entities[row].id)
+
+        if isinstance(expression, LinkAggregateNumberExpression):
+            return self._aggregate(table, expression)
+
+        if isinstance(expression, NameStringExpression):
+            return lambda row: StringValue(table.entities[row].name)
+
+        literal = _literal_value(expression)
+        if literal is None:
+            raise ValueError(f"unsupported expression: {type(expression).__name__}")
+        literal_value = literal
+        return lambda row: literal_value
+
+
+@dataclass
+class _AttributeIndex:
+    keys: List[object]
+    mixed: bool
+    positions: Dict[object, List[int]]
+    rows: List[int]
+
+    def select(self, operator: CmpOperator, value: object) -> Set[int]:
+        equal = self.positions.get(value, [])
+        if operator is CmpOperator.EQ:
+            return set(equal)
+        if operator is CmpOperator.NEQ:
+            return set(self.rows).difference(equal)
+
+        keys = cast(List[float], self.keys)
+        literal = cast(float, value)
+        start = 0
+        end = len(keys)
+        if operator is CmpOperator.GT:
+            start = bisect_right(keys, literal)
+        elif operator is CmpOperator.GTE:
+            start = bisect_left(keys, literal)
+        elif operator is CmpOperator.LT:
+            end = bisect_left(keys, literal)
+        else:
+            end = bisect_right(keys, literal)
+        return set(self.rows[start:end])
+
+
+@dataclass
+class _GroupByPlan:
+    groupings: List[Tuple[_Getter, GroupOrdering]]
+    selection: Set[int]
+    source_id: int
+    table: "_Table"
+
+
+@dataclass
+class _QueryPlan:
+    getters: List[_Getter]
+    group_by_plans: List[_GroupByPlan]
+    limit: int
+    link_plans: List["_QueryPlan"]
+    offset: int
+    positions: Dict[int, int]
+    rows: List[int]
+    source_id: int
+    table: "_Table"
+
+
+class _Table:
+    def __init__(self, entity_type: str) -> None:
+        self.entities: List[Entity] = []
+        self.entity_type = entity_type
+        self.indexes: Dict[str, int] = {}
+        self.links: List[Dict[str, List[int]]] = []
+        self._attribute_indexes: Dict[Tuple[str, type], _AttributeIndex] = {}
+        self._columns: Optional[_Columns] = None
+
+    def add(self, entity: connector.Entity) -> None:
+        assignments = dict(map(_assignment, entity.attribute_assignments))
+        api_entity = Entity(assignments, entity.id, {}, entity.name)
+        row = self.indexes.get(entity.id)
+        if row is None:
+            self.indexes[entity.id] = len(self.entities)
+            self.entities.append(api_entity)
+            self.links.append({})
+        else:
+            self.entities[row] = api_entity
+
+    def attribute_index(self, attribute_type: str, value_type: type) -> _AttributeIndex:
+        index_key = attribute_type, value_type
+        index = self._attribute_indexes.get(index_key)
+        if index is None:
+            mixed = False
+            pairs: List[Tuple[object, int]] = []
+            for row, entity in enumerate(self.entities):
+                value = entity.attribute_assignments.get(attribute_type)
+                if value is None:
+                    continue
+                if value.__class__ is value_type:
+                    pairs.append((value.value, row))
+                else:
+                    mixed = True
+            pairs.sort(key=itemgetter(0))
+            positions: Dict[object, List[int]] = {}
+            for key, row in pairs:
+                positions.setdefault(key, []).append(row)
+            keys = [key for key, _ in pairs]
+            rows = [row for _, row in pairs]
+            index = _AttributeIndex(keys, mixed, positions, rows)
+            self._attribute_indexes[index_key] = index
+        return index
+
+    def columns(self) -> _Columns:
+        if self._columns is None:
+            columns = entities_columns(self.entities)
+            actives = [True] * len(self.entities)
+            columns["active"] = column(actives, bool)
+            self._columns = columns
+        return self._columns
+
+    def freeze(self) -> None:
+        for links in self.links:
+            for entity_type, rows in links.items():
+                links[entity_type] = sorted(set(rows))
+
+
+def _assignment(assignment: connector.AttributeAssignment) -> Tuple[str, Value]:
+    value = _convert(assignment.value)
+    return assignment.attribute_type_id, value
+
+
+def _assigned(
+    table: _Table, expression: LinkAggregateNumberExpression
+) -> Callable[[int], bool]:
+    expr = expression.expr
+    if expression.op is AggregateOperator.COUNT or not isinstance(
+        expr, AttributeNumberExpression
+    ):
+        return lambda row: True
+    attribute_type = expr.attribute_type
+
+    def assigned(row: int) -> bool:
+        value = table.entities[row].attribute_assignments.get(attribute_type)
+        return isinstance(value, NumberValue)
+
+    return assigned
+
+
+def _avg(values: List[float]) -> float:
+    return sum(values) / len(values) if values else 0
+
+
+def _check_reference(expression: object, alias: str) -> None:
+    if isinstance(expression, _referring_types) and expression.reference != alias:
+        raise ValueError(f"unsupported reference: {expression.reference}")
+
+
+def _convert(value: connector.Value) -> Value:
+    if isinstance(value, connector.BooleanValue):
+        return BooleanValue(value.value)
+
+    elif isinstance(value, connector.DateValue):
+        dat = date(value.year, value.month, value.day)
+        return DateValue(dat)
+
+    elif isinstance(value, connector.DateTimeValue):
+        val = value.value
+        date_time = datetime(
+            val.year, val.month, val.day, val.hour, val.minute, val.second
+        )
+        return DateTimeValue(date_time.replace(tzinfo=timezone.utc))
+
+    elif isinstance(value, connector.NumberValue):
+        return NumberValue(value.value)
+
+    elif isinstance(value, connector.StringValue):
+        return StringValue(value.value)
+
+    else:
+        tim = time(value.hour, value.minute, value.second, tzinfo=timezone.utc)
+        return TimeValue(tim)
+
+
+def _group_page(
+    groupings: List[Tuple[_Getter, GroupOrdering]], rows: List[int]
+) -> GroupByQueryResultsPage:
+    if not groupings:
+        return GroupByQueryResultsPage(0, [])
+    getter, ordering = groupings[0]
+    groups: Dict[object, Tuple[Value, List[int]]] = {}
+    for row in rows:
+        label = getter(row)
+        _, group_rows = groups.setdefault(label.value, (label, []))
+        group_rows.append(row)
+
+    group_list = list(groups.values())
+    if isinstance(ordering, DirectedGroupOrdering):
+        reverse = ordering.direction is Direction.DESC
+        if ordering.type is GroupOrderingType.COUNT:
+            group_list.sort(key=lambda group: len(group[1]), reverse=reverse)
+        else:
+            group_list.sort(key=lambda group: group[0].value, reverse=reverse)
+
+    results: List[GroupByQueryResult] = []
+    sub_groupings = groupings[1:]
+    for label, group_rows in group_list:
+        sub_pages = [_group_page(sub_groupings, group_rows)] if sub_groupings else []
+        result = GroupByQueryResult(len(group_rows), label, sub_pages)
+        results.append(result)
+    return GroupByQueryResultsPage(len(groups), results)
+
+
+def _indexed(table: _Table, expression: _Cmp) -> Optional[Set[int]]:
+    if isinstance(expression, MatchBooleanExpression):
+        if (
+            expression.operator is not MatchOperator.EQUALS
+            or expression.mode is not MatchMode.CASE_SENSITIVE
+        ):
+            return None
+        operator = CmpOperator.EQ
+    else:
+        operator = expression.operator
+
+    lhs: object = expression.lhs
+    rhs: object = expression.rhs
+    if _literal(lhs) is not None:
+        lhs, rhs = rhs, lhs
+        operator = _flipped_operators[operator]
+    literal = _literal(rhs)
+    if literal is None:
+        return None
+
+    if isinstance(lhs, IdStringExpression) and operator is CmpOperator.EQ:
+        row = table.indexes.get(cast(str, literal))
+        return set() if row is None else {row}
+    if not isinstance(lhs, _attribute_types):
+        return None
+    value_type = type(_zero_values[type(lhs)])
+    index = table.attribute_index(lhs.attribute_type, value_type)
+    if index.mixed and operator in _equality_operators:
+        return None
+    return index.select(operator, literal)
+
+
+def _literal(expression: object) -> Optional[object]:
+    if isinstance(expression, LiteralDateExpression):
+        return expression.date
+    if isinstance(expression, LiteralDateTimeExpression):
+        return default_tzinfo(expression.date_time, local_timezone)
+    if isinstance(expression, LiteralNumberExpression):
+        return expression.number
+    if isinstance(expression, LiteralStringExpression):
+        return expression.string
+    if isinstance(expression, LiteralTimeExpression):
+        return localize_time(expression.time)
+    return None
+
+
+def _literal_value(expression: object) -> Optional[Value]:
+    literal = _literal(expression)
+    if isinstance(expression, LiteralDateExpression):
+        return DateValue(cast(date, literal))
+    if isinstance(expression, LiteralDateTimeExpression):
+        return DateTimeValue(cast(datetime, literal))
+    if isinstance(expression, LiteralNumberExpression):
+        return NumberValue(cast(float, literal))
+    if isinstance(expression, LiteralStringExpression):
+        return StringValue(cast(str, literal))
+    if isinstance(expression, LiteralTimeExpression):
+        return TimeValue(cast(time, literal))
+    return None
+
+
+def _max(values: List[float]) -> float:
+    return max(values, default=0)
+
+
+def _min(values: List[float]) -> float:
+    return min(values, default=0)
+
+
+_aggregates: Dict[AggregateOperator, Callable[[List[float]], float]] = {
+    AggregateOperator.AVG: _avg,
+    AggregateOperator.COUNT: len,
+    AggregateOperator.MAX: _max,
+    AggregateOperator.MIN: _min,
+    AggregateOperator.SUM: sum,
+}
+_attribute_types = (
+    AttributeDateExpression,
+    AttributeDateTimeExpression,
+    AttributeNumberExpression,
+    AttributeStringExpression,
+    AttributeTimeExpression,
+)
+_cmp_types = (
+    DateCmpBooleanExpression,
+    DateTimeCmpBooleanExpression,
+    MatchBooleanExpression,
+    NumberCmpBooleanExpression,
+    TimeCmpBooleanExpression,
+)
+_equality_operators = {CmpOperator.EQ, CmpOperator.NEQ}
+_flipped_operators = {
+    CmpOperator.EQ: CmpOperator.EQ,
+    CmpOperator.GT: CmpOperator.LT,
+    CmpOperator.GTE: CmpOperator.LTE,
+    CmpOperator.LT: CmpOperator.GT,
+    CmpOperator.LTE: CmpOperator.GTE,
+    CmpOperator.NEQ: CmpOperator.NEQ,
+}
+_empty_table = _Table("")
+_min_date_time = datetime.min.replace(tzinfo=timezone.utc)
+_referring_types = (
+    ActiveBooleanExpression,
+    AssignedBooleanExpression,
+    AttributeBooleanExpression,
+    AttributeDateExpression,
+    AttributeDateTimeExpression,
+    AttributeNumberExpression,
+    AttributeStringExpression,
+    AttributeTimeExpression,
+    IdInBooleanExpression,
+    IdStringExpression,
+    NameStringExpression,
+)
+_zero_values: Dict[type, Value] = {
+    AttributeDateExpression: DateValue(date.min),
+    AttributeDateTimeExpression: DateTimeValue(_min_date_time),
+    AttributeNumberExpression: NumberValue(0),
+    AttributeStringExpression: StringValue(""),
+    AttributeTimeExpression: TimeValue(time.min.replace(tzinfo=timezone.utc)),
+}
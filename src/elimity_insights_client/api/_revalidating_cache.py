@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+Fetch = Callable[[Optional[str]], Optional[Tuple[Optional[str], _T]]]
+
+
+class RevalidatingCache(Generic[_T]):
+    """Cache of values that expire after a time to live, and are revalidated using entity tags if possible."""
+
+    def __init__(self) -> None:
+        """Return a new empty cache."""
+        self._entries: Dict[Hashable, _Entry[_T]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Hashable, ttl: float, fetch: Fetch[_T]) -> _T:
+        """
+        Return the cached value for the given key, fetching it if it is absent or older than ttl seconds.
+
+        The given function is called with the entity tag of the expired value, or None, and returns None if the
+        expired value is still valid. Otherwise it returns the fetched value and its entity tag, if any.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        now = monotonic()
+        if entry is not None and now < entry.expiry:
+            return entry.value
+
+        etag = None if entry is None else entry.etag
+        fetched = fetch(etag)
+        expiry = monotonic() + ttl
+        if fetched is None and entry is not None:
+            entry = _Entry(entry.etag, expiry, entry.value)
+        elif fetched is None:
+            raise ValueError("nothing to revalidate")
+        else:
+            fetched_etag, value = fetched
+            entry = _Entry(fetched_etag, expiry, value)
+        with self._lock:
+            self._entries[key] = entry
+        return entry.value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Remove the cached value for the given key, or all cached values if key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+@dataclass
+class _Entry(Generic[_T]):
+    etag: Optional[str]
+    expiry: float
+    value: _T
@@ -0,0 +1,300 @@
+from dataclasses import is_dataclass, replace
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from elimity_insights_client._util import map_list
+from elimity_insights_client.api.expression import (
+    AllBooleanExpression,
+    AnyBooleanExpression,
+    BooleanExpression,
+    DirectLinkAggregateNumberExpression,
+    DirectlyLinkedToBooleanExpression,
+    IdInBooleanExpression,
+    LinkAggregateNumberExpression,
+    LinkedToBooleanExpression,
+    LiteralBooleanExpression,
+    NotBooleanExpression,
+    NumberCmpBooleanExpression,
+    NumberExpression,
+)
+from elimity_insights_client.api.query import (
+    DirectLinkGroupByQuery,
+    DirectLinkQuery,
+    LinkGroupByQuery,
+    Query,
+)
+
+_Values = List[object]
+_Build = Callable[[_Values, "_Keys"], object]
+_Step = Tuple[Sequence[object], _Build]
+
+_Aggregate = Union[DirectLinkAggregateNumberExpression, LinkAggregateNumberExpression]
+_Composite = Union[AllBooleanExpression, AnyBooleanExpression]
+_Linked = Union[DirectlyLinkedToBooleanExpression, LinkedToBooleanExpression]
+_GroupByQuery = TypeVar("_GroupByQuery", DirectLinkGroupByQuery, LinkGroupByQuery)
+_ListQuery = TypeVar("_ListQuery", DirectLinkQuery, Query)
+_T = TypeVar("_T")
+
+
+class _Keys:
+    """
+    Structural keys of the values built while simplifying an expression.
+
+    The key of a value is derived from the keys of its children, which are computed first, so computing a key
+    does not traverse the value. Keyed values are kept alive, so their identities are not reused.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[int, int] = {}
+        self._keys: Dict[object, int] = {}
+        self._values: List[object] = []
+
+    def key(self, value: object) -> int:
+        key = self._ids.get(id(value))
+        if key is None:
+            parts = tuple(map(self._part, vars(value).values()))
+            structure = type(value), parts
+            key = self._keys.setdefault(structure, len(self._keys))
+            self._ids[id(value)] = key
+            self._values.append(value)
+        return key
+
+    def _part(self, value: object) -> object:
+        if isinstance(value, list):
+            return tuple(map(self._part, value))
+        if is_dataclass(value):
+            return self.key(value)
+        return value
+
+
+class _Pending:
+    __slots__ = "build", "count"
+
+    def __init__(self, build: _Build, count: int) -> None:
+        self.build = build
+        self.count = count
+
+
+def simplify_boolean_expression(expression: BooleanExpression) -> BooleanExpression:
+    """
+    Return a simplified expression that is equivalent to the given expression.
+
+    Simplification folds boolean literals, eliminates double negations, flattens
+    nested conjunctions and disjunctions, removes duplicate sub-expressions,
+    unwraps singleton conjunctions and disjunctions, and merges identifier
+    membership tests for the same reference. The given expression is not
+    modified.
+    """
+    keys = _Keys()
+    values: _Values = []
+    stack: List[object] = [expression]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, _Pending):
+            start = len(values) - item.count
+            args = values[start:]
+            del values[start:]
+            value = item.build(args, keys)
+            keys.key(value)
+            values.append(value)
+            continue
+
+        rule = _rules.get(type(item))
+        if rule is None:
+            keys.key(item)
+            values.append(item)
+            continue
+
+        children, build = rule(item)
+        pending = _Pending(build, len(children))
+        stack.append(pending)
+        stack.extend(reversed(children))
+    (value,) = values
+    return cast(BooleanExpression, value)
+
+
+def simplify_query(query: Query) -> Query:
+    """Return a query equivalent to the given query, with all of its conditions simplified."""
+    return _simplify_list_query(query)
+
+
+def _merge_ids(
+    exprs: List[BooleanExpression], intersect: bool
+) -> List[BooleanExpression]:
+    merged: Dict[str, IdInBooleanExpression] = {}
+    result: List[BooleanExpression] = []
+    for expr in exprs:
+        if not isinstance(expr, IdInBooleanExpression):
+            result.append(expr)
+            continue
+
+        reference = expr.reference
+        previous = merged.get(reference)
+        if previous is None:
+            ids = list(dict.fromkeys(expr.ids))
+            merged[reference] = IdInBooleanExpression(ids, reference)
+            result.append(merged[reference])
+        elif intersect:
+            id_set = set(expr.ids)
+            previous.ids = [id for id in previous.ids if id in id_set]
+        else:
+            id_dict = dict.fromkeys(previous.ids)
+            id_dict.update(dict.fromkeys(expr.ids))
+            previous.ids = list(id_dict)
+    return result
+
+
+def _simplify_aggregate(expression: _Aggregate) -> _Step:
+    def build(values: _Values, keys: _Keys) -> object:
+        condition, expr = values
+        condition_ = cast(BooleanExpression, condition)
+        expr_ = cast(NumberExpression, expr)
+        return replace(expression, condition=condition_, expr=expr_)
+
+    return (expression.condition, expression.expr), build
+
+
+def _simplify_composite(expression: _Composite) -> _Step:
+    conjunction = isinstance(expression, AllBooleanExpression)
+    neutral = LiteralBooleanExpression(conjunction)
+    absorbing = LiteralBooleanExpression(not conjunction)
+
+    def build(values: _Values, keys: _Keys) -> object:
+        exprs: List[BooleanExpression] = []
+        seen: Set[int] = set()
+        for value in cast(List[BooleanExpression], values):
+            nested = [value]
+            if isinstance(value, (AllBooleanExpression, AnyBooleanExpression)):
+                if type(value) is type(expression):
+                    nested = value.exprs
+            for expr in nested:
+                if expr == neutral:
+                    continue
+                if expr == absorbing:
+                    return absorbing
+                if isinstance(expr, IdInBooleanExpression) and not expr.ids:
+                    if conjunction:
+                        return absorbing
+                    continue
+                key = keys.key(expr)
+                if key not in seen:
+                    seen.add(key)
+                    exprs.append(expr)
+        merged = _merge_ids(exprs, conjunction)
+        if not merged:
+            return neutral
+        if len(merged) == 1:
+            return merged[0]
+        for expr in merged:
+            if isinstance(expr, IdInBooleanExpression) and not expr.ids:
+                if conjunction:
+                    return absorbing
+        return type(expression)(merged)
+
+    return expression.exprs, build
+
+
+def _simplify_id_in(expression: IdInBooleanExpression) -> _Step:
+    def build(values: _Values, keys: _Keys) -> object:
+        ids = list(dict.fromkeys(expression.ids))
+        return IdInBooleanExpression(ids, expression.reference)
+
+    return (), build
+
+
+def _simplify_linked(expression: _Linked) -> _Step:
+    def build(values: _Values, keys: _Keys) -> object:
+        (condition,) = cast(List[BooleanExpression], values)
+        return replace(expression, condition=condition)
+
+    return (expression.condition,), build
+
+
+def _simplify_not(expression: NotBooleanExpression) -> _Step:
+    return (expression.expr,), _build_not
+
+
+def _simplify_number_cmp(expression: NumberCmpBooleanExpression) -> _Step:
+    def build(values: _Values, keys: _Keys) -> object:
+        lhs, rhs = cast(List[NumberExpression], values)
+        return NumberCmpBooleanExpression(lhs, expression.operator, rhs)
+
+    return (expression.lhs, expression.rhs), build
+
+
+def _build_not(values: _Values, keys: _Keys) -> object:
+    (expr,) = values
+    if isinstance(expr, NotBooleanExpression):
+        return expr.expr
+    if isinstance(expr, LiteralBooleanExpression):
+        return LiteralBooleanExpression(not expr.boolean)
+    return NotBooleanExpression(cast(BooleanExpression, expr))
+
+
+def _simplify_group_by_query(query: _GroupByQuery) -> _GroupByQuery:
+    condition = simplify_boolean_expression(query.condition)
+    return replace(query, condition=condition)
+
+
+def _simplify_list_query(query: _ListQuery) -> _ListQuery:
+    condition = simplify_boolean_expression(query.condition)
+    direct_link_group_by_queries = map_list(
+        _simplify_direct_link_group_by_query, query.direct_link_group_by_queries
+    )
+    direct_link_queries = map_list(
+        _simplify_direct_link_query, query.direct_link_queries
+    )
+    link_group_by_queries = map_list(
+        _simplify_link_group_by_query, query.link_group_by_queries
+    )
+    link_queries = map_list(simplify_query, query.link_queries)
+    return replace(
+        query,
+        condition=condition,
+        direct_link_group_by_queries=direct_link_group_by_queries,
+        direct_link_queries=direct_link_queries,
+        link_group_by_queries=link_group_by_queries,
+        link_queries=link_queries,
+    )
+
+
+def _simplify_direct_link_group_by_query(
+    query: DirectLinkGroupByQuery,
+) -> DirectLinkGroupByQuery:
+    return _simplify_group_by_query(query)
+
+
+def _simplify_direct_link_query(query: DirectLinkQuery) -> DirectLinkQuery:
+    return _simplify_list_query(query)
+
+
+def _simplify_link_group_by_query(query: LinkGroupByQuery) -> LinkGroupByQuery:
+    return _simplify_group_by_query(query)
+
+
+_rules: Dict[type, Callable[[object], _Step]] = {}
+
+
+def _add_rule(type: Type[_T], rule: Callable[[_T], _Step]) -> None:
+    _rules[type] = cast(Callable[[object], _Step], rule)
+
+
+_add_rule(AllBooleanExpression, _simplify_composite)
+_add_rule(AnyBooleanExpression, _simplify_composite)
+_add_rule(DirectLinkAggregateNumberExpression, _simplify_aggregate)
+_add_rule(DirectlyLinkedToBooleanExpression, _simplify_linked)
+_add_rule(IdInBooleanExpression, _simplify_id_in)
+_add_rule(LinkAggregateNumberExpression, _simplify_aggregate)
+_add_rule(LinkedToBooleanExpression, _simplify_linked)
+_add_rule(NotBooleanExpression, _simplify_not)
+_add_rule(NumberCmpBooleanExpression, _simplify_number_cmp)
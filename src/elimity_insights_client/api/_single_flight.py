@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for calls passing through a single-flight group."""
+
+    calls: int
+    collapsed: int
+
+
+class SingleFlight(Generic[_T]):
+    """Group of calls in which concurrent calls with equal keys share a single execution."""
+
+    def __init__(self) -> None:
+        """Return a new single-flight group without in-flight calls."""
+        self._calls: Dict[Hashable, _Call[_T]] = {}
+        self._lock = Lock()
+        self._stats = SingleFlightStats(0, 0)
+
+    def do(self, key: Hashable, func: Callable[[], _T]) -> _T:
+        """
+        Execute the given function, unless a call with the given key is already in flight.
+
+        In the latter case, this method waits for the in-flight call to finish and
+        returns its result, or raises its exception.
+        """
+        with self._lock:
+            self._stats.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self._stats.collapsed += 1
+
+        if not leader:
+            return call.wait()
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> SingleFlightStats:
+        """Return a snapshot of this group's counters."""
+        with self._lock:
+            return SingleFlightStats(self._stats.calls, self._stats.collapsed)
+
+
+class _Call(Generic[_T]):
+    def __init__(self) -> None:
+        self.done = Event()
+        self.error: Optional[BaseException] = None
+        self.result: _T
+
+    def wait(self) -> _T:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
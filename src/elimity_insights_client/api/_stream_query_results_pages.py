@@ -0,0 +1,172 @@
+from json import JSONDecodeError, loads
+from re import compile
+from typing import Iterable, Iterator, List, Tuple, cast
+
+from elimity_insights_client.api._decode_query_results_page import (
+    QueryResultDict,
+    decode_query_result,
+)
+from elimity_insights_client.api.query_results_page import QueryResult
+
+_NON_WHITESPACE = compile(r"\S")
+_SCALAR_END = compile(r"[\s,\]}]")
+_STRING_END = compile(r'["\\]')
+_STRUCTURE = compile(r'["\[\]{}]')
+
+
+def stream_query_results_pages(
+    chunks: Iterable[str],
+) -> Iterator[Tuple[int, QueryResult]]:
+    """
+    Decode the results of a JSON array of query result pages, split in the given chunks of text.
+
+    Results are generated as pairs of the index of their page and the decoded result, as soon as their text has
+    been read. Only the chunks of a single result are kept in memory, and they are joined once the result is
+    complete. A result is decoded as a whole, including its nested link pages, so memory usage is bounded by the
+    size of the largest result rather than by the size of the response.
+    """
+    reader = _Reader(chunks)
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        reader.expect("")
+        return
+
+    index = 0
+    while True:
+        yield from _stream_page(reader, index)
+        if reader.peek() == "]":
+            reader.expect("]")
+            reader.expect("")
+            return
+
+        reader.expect(",")
+        index += 1
+
+
+class _Reader:
+    def __init__(self, chunks: Iterable[str]) -> None:
+        self._buffer = ""
+        self._chunks = iter(chunks)
+        self._pos = 0
+
+    def expect(self, char: str) -> None:
+        next = self.peek()
+        if next != char:
+            raise self._error(f"Expecting {char!r}" if char else "Extra data")
+        self._pos += len(char)
+
+    def peek(self) -> str:
+        while True:
+            match = _NON_WHITESPACE.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return match.group()
+            if not self._next():
+                return ""
+
+    def value(self) -> object:
+        if self.peek() == "":
+            raise self._error("Expecting value")
+        parts = self._value_parts()
+        text = "".join(parts)
+        try:
+            return loads(text)
+        except JSONDecodeError as error:
+            raise JSONDecodeError(error.msg, text, error.pos) from error
+
+    def _error(self, message: str) -> JSONDecodeError:
+        return JSONDecodeError(message, self._buffer, self._pos)
+
+    def _next(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer = chunk
+                self._pos = 0
+                return True
+        self._buffer = ""
+        self._pos = 0
+        return False
+
+    def _value_parts(self) -> List[str]:
+        parts: List[str] = []
+        start = i = self._pos
+        if self._buffer[i] not in '"[{':
+            while True:
+                match = _SCALAR_END.search(self._buffer, i)
+                if match is not None:
+                    end = self._pos = match.start()
+                    parts.append(self._buffer[start:end])
+                    return parts
+                parts.append(self._buffer[start:])
+                if not self._next():
+                    return parts
+                start = i = 0
+
+        depth = 0
+        escape = False
+        in_string = False
+        while True:
+            if escape and i < len(self._buffer):
+                escape = False
+                i += 1
+            pattern = _STRING_END if in_string else _STRUCTURE
+            match = None if escape else pattern.search(self._buffer, i)
+            if match is None:
+                parts.append(self._buffer[start:])
+                if not self._next():
+                    raise self._error("Unterminated value")
+                start = i = 0
+                continue
+
+            i = match.end()
+            char = match.group()
+            if char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = not in_string
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+            if depth == 0 and not in_string:
+                parts.append(self._buffer[start:i])
+                self._pos = i
+                return parts
+
+
+def _stream_page(reader: _Reader, index: int) -> Iterator[Tuple[int, QueryResult]]:
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+        return
+
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == "results":
+            yield from _stream_results(reader, index)
+        else:
+            reader.value()
+        if reader.peek() == "}":
+            reader.expect("}")
+            return
+
+        reader.expect(",")
+
+
+def _stream_results(reader: _Reader, index: int) -> Iterator[Tuple[int, QueryResult]]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        return
+
+    while True:
+        json = reader.value()
+        result_dict = cast(QueryResultDict, json)
+        yield index, decode_query_result(result_dict)
+        if reader.peek() == "]":
+            reader.expect("]")
+            return
+
+        reader.expect(",")
@@ -1,4 +1,17 @@
-from elimity_insights_client.api.entities._entities import entities
+from elimity_insights_client.api.entities._columns import entities_columns
+from elimity_insights_client.api.entities._entities import entities, iter_entities
 from elimity_insights_client.api.entities._entity import Entity, EntityType, Link
+from elimity_insights_client.api.entities._graph import EntityGraph, entity_graph
+from elimity_insights_client.api.entities._store import EntityStore
 
-__all__ = ["Entity", "EntityType", "Link", "entities"]
+__all__ = [
+    "Entity",
+    "EntityGraph",
+    "EntityStore",
+    "EntityType",
+    "Link",
+    "entities",
+    "entities_columns",
+    "entity_graph",
+    "iter_entities",
+]
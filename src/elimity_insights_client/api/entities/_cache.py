@@ -0,0 +1,127 @@
+from contextlib import closing
+from json import dumps, loads
+from sqlite3 import connect
+from typing import Dict, List, Optional, Tuple, cast
+from zlib import compress, decompress
+
+from typing_extensions import TypedDict
+
+from elimity_insights_client.api._decode_query_results_page import (
+    ValueDict,
+    decode_value,
+)
+from elimity_insights_client.api._encode_value import encode_value
+from elimity_insights_client.api.entities._entity import Entity, EntityType, Link
+from elimity_insights_client.api.query_results_page import Value
+
+_create = """
+create table if not exists entities (
+    key text primary key,
+    version text not null,
+    data blob not null
+)
+"""
+_insert = "insert or replace into entities (key, version, data) values (?, ?, ?)"
+_select = "select data from entities where key = ? and version = ?"
+
+
+class _EntityDict(TypedDict):
+    attributeAssignments: Dict[str, ValueDict]
+    id: str
+    links: List["_LinksDict"]
+    name: str
+
+
+class _LinkDict(TypedDict):
+    attributeAssignments: Dict[str, ValueDict]
+    id: str
+    name: str
+
+
+class _LinksDict(TypedDict):
+    entityTypeId: str
+    links: List[_LinkDict]
+    sourceId: int
+
+
+def load(
+    path: str, key: str, version: str, intern_links: bool = False
+) -> Optional[List[Entity]]:
+    with closing(connect(path)) as connection, connection:
+        connection.execute(_create)
+        parameters = key, version
+        row = connection.execute(_select, parameters).fetchone()
+    if row is None:
+        return None
+    (data,) = row
+    json = decompress(data)
+    entity_dicts = cast(List[_EntityDict], loads(json))
+    interned_links: Dict[Tuple[EntityType, str], Link] = {}
+
+    def decode_link(entity_type: EntityType, dict: _LinkDict) -> Link:
+        if not intern_links:
+            return _decode_link(dict)
+        key = entity_type, dict["id"]
+        link = interned_links.get(key)
+        if link is None:
+            link = _decode_link(dict)
+            interned_links[key] = link
+        return link
+
+    def decode_entity(dict: _EntityDict) -> Entity:
+        links: Dict[EntityType, List[Link]] = {}
+        for links_dict in dict["links"]:
+            entity_type = EntityType(links_dict["entityTypeId"], links_dict["sourceId"])
+            links[entity_type] = [
+                decode_link(entity_type, link_dict) for link_dict in links_dict["links"]
+            ]
+        assignments = _decode_assignments(dict["attributeAssignments"])
+        return Entity(assignments, dict["id"], links, dict["name"])
+
+    return [decode_entity(entity_dict) for entity_dict in entity_dicts]
+
+
+def store(path: str, key: str, version: str, entities: List[Entity]) -> None:
+    entity_dicts = [_encode_entity(entity) for entity in entities]
+    json = dumps(entity_dicts)
+    data = compress(json.encode())
+    with closing(connect(path)) as connection, connection:
+        connection.execute(_create)
+        parameters = key, version, data
+        connection.execute(_insert, parameters)
+
+
+def _decode_assignments(dicts: Dict[str, ValueDict]) -> Dict[str, Value]:
+    return {id: decode_value(dict) for id, dict in dicts.items()}
+
+
+def _decode_link(dict: _LinkDict) -> Link:
+    assignments = _decode_assignments(dict["attributeAssignments"])
+    return Link(assignments, dict["id"], dict["name"])
+
+
+def _encode_assignments(assignments: Dict[str, Value]) -> Dict[str, ValueDict]:
+    return {id: encode_value(value) for id, value in assignments.items()}
+
+
+def _encode_entity(entity: Entity) -> _EntityDict:
+    links: List[_LinksDict] = [
+        {
+            "entityTypeId": entity_type.id,
+            "links": [_encode_link(link) for link in links],
+            "sourceId": entity_type.source_id,
+        }
+        for entity_type, links in entity.links.items()
+    ]
+    assignments = _encode_assignments(entity.attribute_assignments)
+    return {
+        "attributeAssignments": assignments,
+        "id": entity.id,
+        "links": links,
+        "name": entity.name,
+    }
+
+
+def _encode_link(link: Link) -> _LinkDict:
+    assignments = _encode_assignments(link.attribute_assignments)
+    return {"attributeAssignments": assignments, "id": link.id, "name": link.name}
@@ -0,0 +1,41 @@
+from typing import Dict, Iterable, List, Sequence
+
+from elimity_insights_client.api._columns import column, optional_column
+from elimity_insights_client.api.entities._entity import Entity
+
+
+def entities_columns(entities: Iterable[Entity]) -> Dict[str, Sequence[object]]:
+    """
+    Convert the given entities to columns, reading them once.
+
+    The id and name columns hold the details of each entity. For each assigned attribute type, the
+    attribute_<attribute type id> column holds the plain assigned values, for example a datetime instead of a
+    DateTimeValue, and the attribute_<attribute type id>_valid column indicates which entities have an assignment.
+    If NumPy is installed, columns are NumPy arrays, otherwise they are lists.
+    """
+    ids: List[str] = []
+    names: List[str] = []
+    values: Dict[str, List[object]] = {}
+    valids: Dict[str, List[bool]] = {}
+    for entity in entities:
+        rows = len(ids)
+        ids.append(entity.id)
+        names.append(entity.name)
+        for attribute_type, value in entity.attribute_assignments.items():
+            if attribute_type not in values:
+                values[attribute_type] = [None] * rows
+                valids[attribute_type] = [False] * rows
+            values[attribute_type].append(value.value)
+            valids[attribute_type].append(True)
+        for attribute_type, attribute_values in values.items():
+            if len(attribute_values) == rows:
+                attribute_values.append(None)
+                valids[attribute_type].append(False)
+
+    columns = {"id": column(ids, object), "name": column(names, object)}
+    for attribute_type, attribute_values in values.items():
+        name = f"attribute_{attribute_type}"
+        attribute_valids = valids[attribute_type]
+        columns[name] = optional_column(attribute_values, attribute_valids)
+        columns[f"{name}_valid"] = column(attribute_valids, bool)
+    return columns
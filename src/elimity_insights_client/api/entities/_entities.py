@@ -1,36 +1,211 @@
-from typing import List, Optional, Set
+from hashlib import sha256
+from json import dumps
+from typing import Iterator, List, Optional, Set
 
-from elimity_insights_client.api._api import Config
+from requests import Session
+
+from elimity_insights_client._schema_index import SchemaIndex, schema_index
+from elimity_insights_client._util import map_concurrently, map_list
+from elimity_insights_client.api._api import Config, cached_sources
 from elimity_insights_client.api._api import query as api_query
-from elimity_insights_client.api._api import sources
+from elimity_insights_client.api._api import sources as api_sources
+from elimity_insights_client.api.entities._cache import load as load_cache
+from elimity_insights_client.api.entities._cache import store as store_cache
 from elimity_insights_client.api.entities._entity import Entity, EntityType
 from elimity_insights_client.api.entities._parse_query_results_page import (
+    merge_link_pages,
     parse_query_results_page,
 )
-from elimity_insights_client.api.entities._query import query
+from elimity_insights_client.api.entities._query import (
+    base_query,
+    link_query,
+    page_query,
+    query,
+)
+from elimity_insights_client.api.entities._schema import (
+    link_entity_types as schema_link_entity_types,
+)
+from elimity_insights_client.api.entities._schema import project
+from elimity_insights_client.api.query import Query
+from elimity_insights_client.api.query_results_page import QueryResultsPage
+from elimity_insights_client.api.source import PresentLastReloadTimestamp, Source
 
 
 def entities(
     config: Config,
     entity_type: EntityType,
     linked_source_ids: Optional[Set[int]] = None,
+    max_workers: Optional[int] = None,
+    attribute_type_ids: Optional[Set[str]] = None,
+    link_entity_types: Optional[Set[EntityType]] = None,
+    cache_path: Optional[str] = None,
+    intern_links: bool = False,
 ) -> List[Entity]:
     """
     List all entities of the given entity type from the given source.
 
     The resulting entities also include all attribute assignments, and links for every other entity type
     of one of the given linked sources. If linked_source_ids is None, then all other existing sources are used.
+    Sources are retrieved using api.cached_sources, call api.invalidate_sources to see changes to them immediately.
+
+    If max_workers is None, a single query nests the links of every linked entity type. Otherwise the entities and
+    the links of each linked entity type are fetched by separate queries, performed concurrently by at most
+    max_workers threads sharing a pooled session, and the links are merged into the entities by id.
+
+    If attribute_type_ids is not None, only assignments for attribute types with one of the given ids are queried,
+    for both the entities and their links. If link_entity_types is not None, only links for the given entity types
+    are queried.
+
+    If cache_path is not None, the resulting entities are cached in an SQLite database at that path, and served
+    from it until one of the used sources is reloaded. Sources are then retrieved without api.cached_sources, so a
+    reload is noticed immediately. Results are never cached if one of the used sources lacks a last reload
+    timestamp.
+
+    If intern_links is True, all links to the same entity share a single Link instance, so the attributes of each
+    linked entity are decoded only once. Modifying such a link affects every entity linking to it.
+    """
+
+    cached = cache_path is None
+    sos = _sources(config, entity_type, linked_source_ids, cached)
+    version = _version(sos)
+    key = _key(
+        config, entity_type, linked_source_ids, attribute_type_ids, link_entity_types
+    )
+    if cache_path is not None and version is not None:
+        cached_entities = load_cache(cache_path, key, version, intern_links)
+        if cached_entities is not None:
+            return cached_entities
+
+    index = _index(entity_type, sos, attribute_type_ids, link_entity_types)
+    if max_workers is None:
+        que = query(entity_type, index)
+        queries = [que]
+        (page,) = api_query(config, queries, lazy=intern_links)
+    else:
+        page = _fan_out(config, entity_type, max_workers, index)
+    ents = parse_query_results_page(entity_type, page, index, intern_links)
+    if cache_path is not None and version is not None:
+        store_cache(cache_path, key, version, ents)
+    return ents
+
+
+def iter_entities(
+    config: Config,
+    entity_type: EntityType,
+    linked_source_ids: Optional[Set[int]] = None,
+    page_size: int = 1000,
+    attribute_type_ids: Optional[Set[str]] = None,
+    link_entity_types: Optional[Set[EntityType]] = None,
+) -> Iterator[Entity]:
+    """
+    Generate all entities of the given entity type from the given source, like entities.
+
+    Entities are queried in pages of page_size entities ordered by identifier, so memory usage is bounded by the
+    size of a page, and entity types with any number of entities are generated completely.
+    Assignments and links are selected by attribute_type_ids and link_entity_types, like entities.
     """
+    sos = _sources(config, entity_type, linked_source_ids, True)
+    index = _index(entity_type, sos, attribute_type_ids, link_entity_types)
+    offset = 0
+    while True:
+        que = page_query(entity_type, index, page_size, offset)
+        queries = [que]
+        (page,) = api_query(config, queries)
+        yield from parse_query_results_page(entity_type, page, index)
+        offset += page_size
+        if len(page.results) < page_size or offset >= page.count:
+            return
+
 
-    sos = sources(config)
-    schemas = {
-        source.id: source.domain_graph_schema
+def _fan_out(
+    config: Config,
+    entity_type: EntityType,
+    max_workers: int,
+    index: SchemaIndex,
+) -> QueryResultsPage:
+    def make_link_query(link_entity_type: EntityType) -> Query:
+        return link_query(entity_type, link_entity_type, index)
+
+    base_que = base_query(entity_type, index)
+    link_entity_types = schema_link_entity_types(entity_type, index)
+    link_queries = map_list(make_link_query, link_entity_types)
+    all_queries = [base_que, *link_queries]
+
+    def perform(session: Session, que: Query) -> QueryResultsPage:
+        queries = [que]
+        (page,) = api_query(config, queries, session=session)
+        return page
+
+    page, *link_pages = map_concurrently(perform, all_queries, max_workers)
+    return merge_link_pages(page, link_pages)
+
+
+def _index(
+    entity_type: EntityType,
+    sources: List[Source],
+    attribute_type_ids: Optional[Set[str]],
+    link_entity_types: Optional[Set[EntityType]],
+) -> SchemaIndex:
+    schemas = {source.id: source.domain_graph_schema for source in sources}
+    projected_schemas = project(
+        entity_type, schemas, attribute_type_ids, link_entity_types
+    )
+    return schema_index(projected_schemas)
+
+
+def _key(
+    config: Config,
+    entity_type: EntityType,
+    linked_source_ids: Optional[Set[int]],
+    attribute_type_ids: Optional[Set[str]],
+    link_entity_types: Optional[Set[EntityType]],
+) -> str:
+    linked_source_id_list = (
+        None if linked_source_ids is None else sorted(linked_source_ids)
+    )
+    attribute_type_id_list = (
+        None if attribute_type_ids is None else sorted(attribute_type_ids)
+    )
+    link_entity_type_list = (
+        None
+        if link_entity_types is None
+        else sorted([type.source_id, type.id] for type in link_entity_types)
+    )
+    token_id_hash = sha256(config.token_id.encode()).hexdigest()
+    key = [
+        config.url,
+        token_id_hash,
+        entity_type.source_id,
+        entity_type.id,
+        linked_source_id_list,
+        attribute_type_id_list,
+        link_entity_type_list,
+    ]
+    return dumps(key)
+
+
+def _sources(
+    config: Config,
+    entity_type: EntityType,
+    linked_source_ids: Optional[Set[int]],
+    cached: bool,
+) -> List[Source]:
+    sos = cached_sources(config) if cached else api_sources(config)
+    return [
+        source
         for source in sos
         if source.id == entity_type.source_id
         or linked_source_ids is None
         or source.id in linked_source_ids
-    }
-    que = query(entity_type, schemas)
-    queries = [que]
-    (page,) = api_query(config, queries)
-    return parse_query_results_page(entity_type, page, schemas)
+    ]
+
+
+def _version(sources: List[Source]) -> Optional[str]:
+    timestamps: List[List[object]] = []
+    for source in sources:
+        timestamp = source.last_reload_timestamp
+        if not isinstance(timestamp, PresentLastReloadTimestamp):
+            return None
+        timestamps.append([source.id, timestamp.value.isoformat()])
+    timestamps.sort()
+    return dumps(timestamps)
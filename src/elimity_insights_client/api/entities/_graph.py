@@ -0,0 +1,207 @@
+from array import array
+from bisect import bisect_right
+from collections import deque
+from importlib import import_module
+from types import ModuleType
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from elimity_insights_client.api.entities._entity import Entity, EntityType
+
+try:
+    _numpy: Optional[ModuleType] = import_module("numpy")
+except ImportError:
+    _numpy = None
+
+
+class EntityGraph:
+    """
+    Directed graph of entities and their links, stored as a compressed sparse row adjacency.
+
+    Nodes are integers numbered consecutively per entity type, so each entity type has an interned table of
+    identifiers. Edges point from entities to the entities they link to.
+    """
+
+    def __init__(
+        self,
+        entity_types: List[EntityType],
+        ids: List[List[str]],
+        offsets: "array[int]",
+        targets: "array[int]",
+    ) -> None:
+        """
+        Return a new graph for the given adjacency.
+
+        The given identifier tables hold the identifiers for each entity type in order, and the edges of node i are
+        the targets between offsets i and i + 1.
+        """
+        self._entity_types = entity_types
+        self._ids = ids
+        self._indexes = [
+            {id: index for index, id in enumerate(type_ids)} for type_ids in ids
+        ]
+        self._offsets = offsets
+        self._starts: List[int] = []
+        self._targets = targets
+        start = 0
+        for type_ids in ids:
+            self._starts.append(start)
+            start += len(type_ids)
+
+    def __len__(self) -> int:
+        """Return the number of nodes in this graph."""
+        return len(self._offsets) - 1
+
+    def bfs(
+        self, node: int, max_depth: Optional[int] = None
+    ) -> Iterator[Tuple[int, int]]:
+        """Generate the nodes reachable from the given node in breadth-first order, with their depths."""
+        depths = {node: 0}
+        queue: Deque[int] = deque([node])
+        offsets = self._offsets
+        targets = self._targets
+        while queue:
+            current = queue.popleft()
+            depth = depths[current]
+            yield current, depth
+            if max_depth is not None and depth == max_depth:
+                continue
+            for index in range(offsets[current], offsets[current + 1]):
+                target = targets[index]
+                if target not in depths:
+                    depths[target] = depth + 1
+                    queue.append(target)
+
+    def degree(self, node: int) -> int:
+        """Return the number of links of the given node."""
+        return self._offsets[node + 1] - self._offsets[node]
+
+    def entity(self, node: int) -> Tuple[EntityType, str]:
+        """Return the entity type and identifier of the given node."""
+        type_index = bisect_right(self._starts, node) - 1
+        local_index = node - self._starts[type_index]
+        return self._entity_types[type_index], self._ids[type_index][local_index]
+
+    def ids(self, entity_type: EntityType) -> Sequence[str]:
+        """Return the identifiers of the nodes of the given entity type, in node order."""
+        type_index = self._entity_types.index(entity_type)
+        return self._ids[type_index]
+
+    def neighbors(self, node: int) -> Sequence[int]:
+        """Return the nodes the given node links to."""
+        start = self._offsets[node]
+        end = self._offsets[node + 1]
+        return self._targets[start:end]
+
+    def node(self, entity_type: EntityType, id: str) -> int:
+        """Return the node of the entity with the given type and identifier, or raise a KeyError if it is absent."""
+        type_index = self._entity_types.index(entity_type)
+        return self._starts[type_index] + self._indexes[type_index][id]
+
+    def reachable(self, node: int, max_depth: Optional[int] = None) -> Set[int]:
+        """
+        Return the nodes reachable from the given node in at most max_depth steps, including the node itself.
+
+        If NumPy is installed, each breadth-first level is expanded using vectorized operations.
+        """
+        if _numpy is None:
+            return {reached for reached, _ in self.bfs(node, max_depth)}
+        return _reachable(_numpy, self._offsets, self._targets, node, max_depth)
+
+
+def entity_graph(entities: Mapping[EntityType, Iterable[Entity]]) -> EntityGraph:
+    """
+    Build a graph from the given entities of each entity type, consuming each iterable once.
+
+    Linked entities that are not given as entities themselves are included as nodes without links.
+    """
+    entity_types: List[EntityType] = []
+    type_indexes: Dict[EntityType, int] = {}
+    tables: List[Dict[str, int]] = []
+
+    def intern(entity_type: EntityType, id: str) -> Tuple[int, int]:
+        type_index = type_indexes.get(entity_type)
+        if type_index is None:
+            type_index = len(entity_types)
+            entity_types.append(entity_type)
+            type_indexes[entity_type] = type_index
+            tables.append({})
+        table = tables[type_index]
+        local_index = table.setdefault(id, len(table))
+        return type_index, local_index
+
+    source_types = array("l")
+    source_indexes = array("q")
+    target_types = array("l")
+    target_indexes = array("q")
+    for entity_type, ents in entities.items():
+        for entity in ents:
+            source_type, source_index = intern(entity_type, entity.id)
+            for link_entity_type, links in entity.links.items():
+                for link in links:
+                    target_type, target_index = intern(link_entity_type, link.id)
+                    source_types.append(source_type)
+                    source_indexes.append(source_index)
+                    target_types.append(target_type)
+                    target_indexes.append(target_index)
+
+    starts: List[int] = []
+    node_count = 0
+    for table in tables:
+        starts.append(node_count)
+        node_count += len(table)
+    offsets = array("q", bytes(8 * (node_count + 1)))
+    for source_type, source_index in zip(source_types, source_indexes):
+        offsets[starts[source_type] + source_index + 1] += 1
+    for node in range(node_count):
+        offsets[node + 1] += offsets[node]
+
+    targets = array("q", bytes(8 * len(target_indexes)))
+    positions = offsets[:-1]
+    edges = zip(source_types, source_indexes, target_types, target_indexes)
+    for source_type, source_index, target_type, target_index in edges:
+        source = starts[source_type] + source_index
+        targets[positions[source]] = starts[target_type] + target_index
+        positions[source] += 1
+
+    ids = [list(table) for table in tables]
+    return EntityGraph(entity_types, ids, offsets, targets)
+
+
+def _reachable(
+    numpy: ModuleType,
+    offsets: "array[int]",
+    targets: "array[int]",
+    node: int,
+    max_depth: Optional[int],
+) -> Set[int]:
+    offset_array = numpy.frombuffer(offsets, dtype=numpy.int64)
+    target_array = numpy.frombuffer(targets, dtype=numpy.int64)
+    visited = numpy.zeros(len(offsets) - 1, dtype=bool)
+    visited[node] = True
+    frontier = numpy.array([node], dtype=numpy.int64)
+    depth = 0
+    while frontier.size and (max_depth is None or depth < max_depth):
+        starts = offset_array[frontier]
+        counts = offset_array[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            break
+        shifts = numpy.repeat(starts - (numpy.cumsum(counts) - counts), counts)
+        indexes = shifts + numpy.arange(total)
+        reached = numpy.unique(target_array[indexes])
+        frontier = reached[~visited[reached]]
+        visited[frontier] = True
+        depth += 1
+    nodes = numpy.flatnonzero(visited).tolist()
+    return set(nodes)
@@ -1,12 +1,12 @@
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, replace
+from typing import Dict, List, Tuple
 
 from more_itertools import chunked
 
 from elimity_insights_client._domain_graph_schema import (
     AttributeType,
-    DomainGraphSchema,
 )
+from elimity_insights_client._schema_index import SchemaIndex
 from elimity_insights_client._util import map_list
 from elimity_insights_client.api.entities._entity import Entity, EntityType, Link
 from elimity_insights_client.api.entities._schema import (
@@ -30,30 +30,53 @@ class _AttributeAssignment:
     value: Value
 
 
-@dataclass
-class _LinkGroup:
-    entity_type: EntityType
-    links: List[Link]
+def merge_link_pages(
+    page: QueryResultsPage, link_pages: List[QueryResultsPage]
+) -> QueryResultsPage:
+    empty_page = QueryResultsPage(0, [])
+    pages_by_id = [
+        {result.entity.id: result.link_pages[0] for result in link_page.results}
+        for link_page in link_pages
+    ]
+
+    def merge_result(result: QueryResult) -> QueryResult:
+        id = result.entity.id
+        result_link_pages = [pages.get(id, empty_page) for pages in pages_by_id]
+        return replace(result, link_pages=result_link_pages)
+
+    results = map_list(merge_result, page.results)
+    return QueryResultsPage(page.count, results)
 
 
 def parse_query_results_page(
     entity_type: EntityType,
     page: QueryResultsPage,
-    schemas: Dict[int, DomainGraphSchema],
+    index: SchemaIndex,
+    intern_links: bool = False,
 ) -> List[Entity]:
-    def make_entity(result: QueryResult) -> Entity:
-        entity = _link(entity_type, result, schemas)
+    interned_links: Dict[Tuple[EntityType, str], Link] = {}
+    link_entity_types = schema_link_entity_types(entity_type, index)
+
+    def make_link(link_entity_type: EntityType, result: QueryResult) -> Link:
+        if not intern_links:
+            return _link(link_entity_type, result, index)
+        key = link_entity_type, result.entity.id
+        link = interned_links.get(key)
+        if link is None:
+            link = _link(link_entity_type, result, index)
+            interned_links[key] = link
+        return link
 
-        def make_group(entity_type: EntityType, page: QueryResultsPage) -> _LinkGroup:
-            def make_link(result: QueryResult) -> Link:
-                return _link(entity_type, result, schemas)
-
-            links = map_list(make_link, page.results)
-            return _LinkGroup(entity_type, links)
-
-        link_entity_types = schema_link_entity_types(entity_type, schemas)
-        group_iter = map(make_group, link_entity_types, result.link_pages)
-        links = {group.entity_type: group.links for group in group_iter}
+    def make_entity(result: QueryResult) -> Entity:
+        entity = _link(entity_type, result, index)
+        link_items = zip(link_entity_types, result.link_pages)
+        links = {
+            link_entity_type: [
+                make_link(link_entity_type, link_result)
+                for link_result in link_page.results
+            ]
+            for link_entity_type, link_page in link_items
+        }
         return Entity(entity.attribute_assignments, entity.id, links, entity.name)
 
     return map_list(make_entity, page.results)
@@ -67,11 +90,9 @@ def _attribute_assignment(
     return _AttributeAssignment(assigned, type.id, value_inclusion)
 
 
-def _link(
-    entity_type: EntityType, result: QueryResult, schemas: Dict[int, DomainGraphSchema]
-) -> Link:
+def _link(entity_type: EntityType, result: QueryResult, index: SchemaIndex) -> Link:
     inclusions_iter = chunked(result.inclusions, 2)
-    attribute_types = schema_attribute_types(entity_type, schemas)
+    attribute_types = schema_attribute_types(entity_type, index)
     assignment_iter = map(_attribute_assignment, inclusions_iter, attribute_types)
     assignments = {
         assignment.attribute_type: assignment.value
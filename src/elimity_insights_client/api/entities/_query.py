@@ -1,12 +1,13 @@
-from typing import Dict, List
+from dataclasses import replace
+from typing import List
 
 from more_itertools import interleave
 
 from elimity_insights_client._domain_graph_schema import (
     AttributeType,
-    DomainGraphSchema,
     Type,
 )
+from elimity_insights_client._schema_index import SchemaIndex
 from elimity_insights_client._util import map_list
 from elimity_insights_client.api.entities._entity import EntityType
 from elimity_insights_client.api.entities._schema import (
@@ -26,6 +27,7 @@ from elimity_insights_client.api.expression import (
     BooleanExpression,
     DateExpression,
     DateTimeExpression,
+    IdStringExpression,
     LiteralBooleanExpression,
     NumberExpression,
     StringExpression,
@@ -36,6 +38,7 @@ from elimity_insights_client.api.query import (
     BooleanAnyExpression,
     DateAnyExpression,
     DateTimeAnyExpression,
+    Direction,
     DirectLinkGroupByQuery,
     DirectLinkQuery,
     LinkGroupByQuery,
@@ -47,17 +50,47 @@ from elimity_insights_client.api.query import (
 )
 
 
+def base_query(entity_type: EntityType, index: SchemaIndex) -> Query:
+    link_queries: List[Query] = []
+    return _query(entity_type, link_queries, index)
+
+
+def link_query(
+    entity_type: EntityType,
+    link_entity_type: EntityType,
+    index: SchemaIndex,
+) -> Query:
+    link_que = base_query(link_entity_type, index)
+    link_queries = [link_que]
+    que = _query(entity_type, link_queries, index)
+    inclusions: List[AnyExpression] = []
+    return replace(que, include=inclusions)
+
+
+def page_query(
+    entity_type: EntityType,
+    index: SchemaIndex,
+    limit: int,
+    offset: int,
+) -> Query:
+    que = query(entity_type, index)
+    expr = IdStringExpression("")
+    any_expr = StringAnyExpression(expr)
+    ordering = Ordering(any_expr, Direction.ASC)
+    orderings = [ordering]
+    return replace(que, limit=limit, offset=offset, order_by=orderings)
+
+
 def query(
     entity_type: EntityType,
-    schemas: Dict[int, DomainGraphSchema],
+    index: SchemaIndex,
 ) -> Query:
     def make_link_query(entity_type: EntityType) -> Query:
-        link_queries: List[Query] = []
-        return _query(entity_type, link_queries, schemas)
+        return base_query(entity_type, index)
 
-    link_entity_types = schema_link_entity_types(entity_type, schemas)
+    link_entity_types = schema_link_entity_types(entity_type, index)
     link_queries = map_list(make_link_query, link_entity_types)
-    return _query(entity_type, link_queries, schemas)
+    return _query(entity_type, link_queries, index)
 
 
 def _assigned_inclusion(type: AttributeType) -> AnyExpression:
@@ -87,10 +120,8 @@ def _attribute_inclusion(type: AttributeType) -> AnyExpression:
     return TimeAnyExpression(time_expr)
 
 
-def _inclusions(
-    entity_type: EntityType, schemas: Dict[int, DomainGraphSchema]
-) -> List[AnyExpression]:
-    attribute_types = schema_attribute_types(entity_type, schemas)
+def _inclusions(entity_type: EntityType, index: SchemaIndex) -> List[AnyExpression]:
+    attribute_types = schema_attribute_types(entity_type, index)
     assigned_iter = map(_assigned_inclusion, attribute_types)
     attribute_iter = map(_attribute_inclusion, attribute_types)
     inclusion_iter = interleave(assigned_iter, attribute_iter)
@@ -100,12 +131,12 @@ def _inclusions(
 def _query(
     entity_type: EntityType,
     link_queries: List[Query],
-    schemas: Dict[int, DomainGraphSchema],
+    index: SchemaIndex,
 ) -> Query:
     condition = LiteralBooleanExpression(True)
     direct_link_group_by_queries: List[DirectLinkGroupByQuery] = []
     direct_link_queries: List[DirectLinkQuery] = []
-    inclusions = _inclusions(entity_type, schemas)
+    inclusions = _inclusions(entity_type, index)
     link_group_by_queries: List[LinkGroupByQuery] = []
     orderings: List[Ordering] = []
     return Query(
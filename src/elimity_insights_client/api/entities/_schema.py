@@ -1,32 +1,59 @@
-from itertools import starmap
-from typing import Dict, Iterable, List
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence, Set
 
 from elimity_insights_client._domain_graph_schema import (
     AttributeType,
     DomainGraphSchema,
 )
+from elimity_insights_client._schema_index import SchemaIndex
 from elimity_insights_client.api.entities._entity import EntityType
 
 
 def attribute_types(
-    entity_type: EntityType, schemas: Dict[int, DomainGraphSchema]
-) -> List[AttributeType]:
-    schema = schemas[entity_type.source_id]
+    entity_type: EntityType, index: SchemaIndex
+) -> Sequence[AttributeType]:
+    key = entity_type.source_id, entity_type.id
+    return index.attribute_types.get(key, ())
+
+
+def link_entity_types(entity_type: EntityType, index: SchemaIndex) -> List[EntityType]:
+    key = entity_type.source_id, entity_type.id
     return [
-        type
-        for type in schema.attribute_types
-        if not type.archived and type.entity_type == entity_type.id
+        EntityType(id, source_id)
+        for source_id, id in index.entity_types
+        if (source_id, id) != key
     ]
 
 
-def link_entity_types(
-    entity_type: EntityType, schemas: Dict[int, DomainGraphSchema]
-) -> List[EntityType]:
-    items = schemas.items()
-    iters = starmap(_entity_types, items)
-    return [typ for iter in iters for typ in iter if typ != entity_type]
+def project(
+    entity_type: EntityType,
+    schemas: Dict[int, DomainGraphSchema],
+    attribute_type_ids: Optional[Set[str]],
+    link_entity_types: Optional[Set[EntityType]],
+) -> Dict[int, DomainGraphSchema]:
+    if attribute_type_ids is None and link_entity_types is None:
+        return schemas
 
+    def project_schema(source_id: int, schema: DomainGraphSchema) -> DomainGraphSchema:
+        projected_attribute_types = [
+            type
+            for type in schema.attribute_types
+            if attribute_type_ids is None or type.id in attribute_type_ids
+        ]
+        projected_entity_types = [
+            type
+            for type in schema.entity_types
+            if link_entity_types is None
+            or EntityType(type.id, source_id) == entity_type
+            or EntityType(type.id, source_id) in link_entity_types
+        ]
+        return replace(
+            schema,
+            attribute_types=projected_attribute_types,
+            entity_types=projected_entity_types,
+        )
 
-def _entity_types(source_id: int, schema: DomainGraphSchema) -> Iterable[EntityType]:
-    for type in schema.entity_types:
-        yield EntityType(type.id, source_id)
+    return {
+        source_id: project_schema(source_id, schema)
+        for source_id, schema in schemas.items()
+    }
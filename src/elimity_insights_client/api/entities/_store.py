@@ -0,0 +1,188 @@
+from json import dumps, loads
+from sqlite3 import connect
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, cast
+
+from more_itertools import chunked, peekable
+
+from elimity_insights_client.api._decode_query_results_page import (
+    ValueDict,
+    decode_value,
+)
+from elimity_insights_client.api._encode_value import encode_value
+from elimity_insights_client.api.entities._entity import Entity, EntityType, Link
+from elimity_insights_client.api.query_results_page import Value
+
+_batch_size = 1000
+_create = """
+create table if not exists entities (
+    id text primary key,
+    name text not null,
+    assignments text not null
+);
+create table if not exists links (
+    entity_id text not null,
+    source_id integer not null,
+    entity_type text not null,
+    id text not null,
+    name text not null,
+    assignments text not null
+);
+create index if not exists links_entity_id on links (entity_id);
+create index if not exists links_target on links (source_id, entity_type, id);
+create table if not exists link_entity_types (
+    source_id integer not null,
+    entity_type text not null,
+    primary key (source_id, entity_type)
+);
+"""
+_LinkRow = Tuple[str, int, str, str, str, str]
+
+
+class EntityStore:
+    """
+    Store of entities in an SQLite database, for result sets that do not fit in memory.
+
+    Entities are typically added from iter_entities, and read back one at a time by iterating over the store or by
+    looking them up, so memory usage does not depend on the number of stored entities.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open the store in the SQLite database at the given path, creating it if needed."""
+        self._connection = connect(path)
+        self._connection.executescript(_create)
+        self._link_entity_types = self._read_link_entity_types()
+
+    def __enter__(self) -> "EntityStore":
+        """Return this store."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close this store."""
+        self.close()
+
+    def __iter__(self) -> Iterator[Entity]:
+        """Generate all entities in this store, ordered by id."""
+        entity_cursor = self._connection.execute(
+            "select id, name, assignments from entities order by id"
+        )
+        link_cursor = self._connection.execute(
+            "select * from links order by entity_id, rowid"
+        )
+        link_rows = peekable(cast(Iterator[_LinkRow], link_cursor))
+        for id, name, assignments in entity_cursor:
+            rows: List[_LinkRow] = []
+            while link_rows and link_rows.peek()[0] < id:
+                next(link_rows)
+            while link_rows and link_rows.peek()[0] == id:
+                rows.append(next(link_rows))
+            yield self._entity(id, name, assignments, rows)
+
+    def __len__(self) -> int:
+        """Return the number of entities in this store."""
+        (count,) = self._connection.execute("select count(*) from entities").fetchone()
+        return cast(int, count)
+
+    def add(self, entities: Iterable[Entity]) -> None:
+        """
+        Add the given entities to this store, replacing stored entities with the same id.
+
+        Entities are written in batches, so the given iterable is consumed incrementally.
+        """
+        for batch in chunked(entities, _batch_size):
+            with self._connection:
+                for entity in batch:
+                    self._add(entity)
+
+    def close(self) -> None:
+        """Close the database connection of this store."""
+        self._connection.close()
+
+    def get(self, id: str) -> Optional[Entity]:
+        """Return the entity with the given id, or None if it is absent."""
+        parameters = (id,)
+        row = self._connection.execute(
+            "select name, assignments from entities where id = ?", parameters
+        ).fetchone()
+        if row is None:
+            return None
+        name, assignments = row
+        link_cursor = self._connection.execute(
+            "select * from links where entity_id = ? order by rowid", parameters
+        )
+        rows = cast(List[_LinkRow], link_cursor.fetchall())
+        return self._entity(id, name, assignments, rows)
+
+    def linking(self, entity_type: EntityType, id: str) -> Iterator[Entity]:
+        """Generate the entities in this store that link to the entity with the given type and id, ordered by id."""
+        parameters = entity_type.source_id, entity_type.id, id
+        cursor = self._connection.execute(
+            "select distinct entity_id from links "
+            "where source_id = ? and entity_type = ? and id = ? order by entity_id",
+            parameters,
+        )
+        entity_ids = [entity_id for (entity_id,) in cursor]
+        for entity_id in entity_ids:
+            entity = self.get(entity_id)
+            if entity is not None:
+                yield entity
+
+    def _add(self, entity: Entity) -> None:
+        connection = self._connection
+        assignments = _encode_assignments(entity.attribute_assignments)
+        entity_parameters = entity.id, entity.name, assignments
+        connection.execute(
+            "insert or replace into entities values (?, ?, ?)", entity_parameters
+        )
+        id_parameters = (entity.id,)
+        connection.execute("delete from links where entity_id = ?", id_parameters)
+        link_rows: List[_LinkRow] = []
+        for entity_type, links in entity.links.items():
+            if entity_type not in self._link_entity_types:
+                self._link_entity_types.append(entity_type)
+                type_parameters = entity_type.source_id, entity_type.id
+                connection.execute(
+                    "insert or ignore into link_entity_types values (?, ?)",
+                    type_parameters,
+                )
+            for link in links:
+                link_assignments = _encode_assignments(link.attribute_assignments)
+                link_row = (
+                    entity.id,
+                    entity_type.source_id,
+                    entity_type.id,
+                    link.id,
+                    link.name,
+                    link_assignments,
+                )
+                link_rows.append(link_row)
+        connection.executemany("insert into links values (?, ?, ?, ?, ?, ?)", link_rows)
+
+    def _entity(
+        self, id: str, name: str, assignments: str, rows: List[_LinkRow]
+    ) -> Entity:
+        links: Dict[EntityType, List[Link]] = {
+            entity_type: [] for entity_type in self._link_entity_types
+        }
+        for _, source_id, entity_type_id, link_id, link_name, link_assignments in rows:
+            entity_type = EntityType(entity_type_id, source_id)
+            link_values = _decode_assignments(link_assignments)
+            link = Link(link_values, link_id, link_name)
+            links.setdefault(entity_type, []).append(link)
+        values = _decode_assignments(assignments)
+        return Entity(values, id, links, name)
+
+    def _read_link_entity_types(self) -> List[EntityType]:
+        cursor = self._connection.execute(
+            "select source_id, entity_type from link_entity_types order by rowid"
+        )
+        return [EntityType(entity_type, source_id) for source_id, entity_type in cursor]
+
+
+def _decode_assignments(json: str) -> Dict[str, Value]:
+    dicts = cast(Dict[str, ValueDict], loads(json))
+    return {id: decode_value(dict) for id, dict in dicts.items()}
+
+
+def _encode_assignments(assignments: Dict[str, Value]) -> str:
+    dicts = {id: encode_value(value) for id, value in assignments.items()}
+    return dumps(dicts)
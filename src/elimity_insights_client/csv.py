@@ -1,8 +1,14 @@
 """Utilities for writing domain graph schemas to CSV files."""
 
-from collections.abc import Iterable
-from csv import writer
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from gzip import compress as gzip_compress
+from itertools import chain
 from json import dumps, loads
+from os.path import join, split
+from re import compile
+from typing import BinaryIO, Deque, Dict, Iterable, List, Optional, Tuple, Union
 
 from elimity_insights_client._decode_domain_graph_schema import (
     decode_domain_graph_schema,
@@ -19,24 +25,185 @@ from elimity_insights_client._elimity_insights_client import (
     StringValue,
     Value,
 )
+from elimity_insights_client._schema_index import SchemaIndex, schema_index
 
+_Layout = Tuple[Optional[int], Dict[str, int]]
+_Key = Tuple[str, int]
+_Row = Union[Entity, Relationship]
+_batch_size = 10000
+_cache_size = 16
 
-def write_domain_graph(filename: str, graph: DomainGraph, schema_json: str) -> None:
-    """Serialize the given domain graph to an importable CSV file at the given path."""
+
+def write_domain_graph(
+    filename: str,
+    graph: DomainGraph,
+    schema_json: str,
+    compress: bool = False,
+    max_workers: Optional[int] = None,
+    shard_by_entity_type: bool = False,
+    shard_size: Optional[int] = None,
+) -> List[str]:
+    """Serialize the given domain graph to importable CSV files, like write_domain_graph_with_schema."""
+    schema = _decode(schema_json)
+    return write_domain_graph_with_schema(
+        filename,
+        graph,
+        schema,
+        compress,
+        max_workers,
+        shard_by_entity_type,
+        shard_size,
+    )
+
+
+def write_domain_graph_with_schema(
+    filename: str,
+    graph: DomainGraph,
+    schema: DomainGraphSchema,
+    compress: bool = False,
+    max_workers: Optional[int] = None,
+    shard_by_entity_type: bool = False,
+    shard_size: Optional[int] = None,
+) -> List[str]:
+    """
+    Serialize the given domain graph to importable CSV files, for a decoded schema, and return their paths.
+
+    The column layout of each entity type is computed once per schema, so only the populated cells of each row are
+    visited. By default, a single file is written to the given path. If shard_by_entity_type is True, entities are
+    written to a file per entity type, and relationships to the file of their from entity type. If shard_size is
+    given, each file holds at most shard_size rows besides the header. Shards are named by inserting the entity
+    type and the shard number before the extensions of the given path, for example graph-user-0.csv, and each
+    starts with the header. If compress is True, files are gzip-compressed. Rows are encoded and compressed in
+    batches, by max_workers threads while the graph is being read if max_workers is given, otherwise by the calling
+    thread.
+    """
+    index = schema_index({_source_id: schema})
+    layouts = _layouts(index)
+    width = index.column_count
+    headers = _headers(schema)
+    header = _line(dict(enumerate(headers)), width)
+    header_data = _compress(header, compress)
+    shards = _Shards(filename, header_data, shard_by_entity_type, shard_size)
+    if not shard_by_entity_type and shard_size is None:
+        shards.open(_single_key)
+
+    batches: Dict[_Key, List[_Row]] = {}
+    counts: Dict[str, int] = {}
+    executor = None if max_workers is None else ThreadPoolExecutor(max_workers)
+    max_pending = 0 if max_workers is None else 2 * max_workers
+    pending: Deque[Tuple[_Key, "Future[bytes]", bool]] = deque()
+
+    def flush(key: _Key, last: bool) -> None:
+        batch = batches.pop(key)
+        if executor is None:
+            data = _encode(batch, layouts, width, compress)
+            shards.write(key, data, last)
+            return
+        future = executor.submit(_encode, batch, layouts, width, compress)
+        pending.append((key, future, last))
+        while len(pending) > max_pending:
+            shards.write(*_result(pending.popleft()))
+
+    with shards:
+        try:
+            rows: Iterable[_Row] = chain(graph.entities, graph.relationships)
+            for row in rows:
+                type = _type(row) if shard_by_entity_type else ""
+                count = counts.get(type, 0) + 1
+                counts[type] = count
+                number = 0 if shard_size is None else (count - 1) // shard_size
+                key = type, number
+                batch = batches.setdefault(key, [])
+                batch.append(row)
+                last = shard_size is not None and count % shard_size == 0
+                if last or len(batch) == _batch_size:
+                    flush(key, last)
+            for key in list(batches):
+                flush(key, True)
+            while pending:
+                shards.write(*_result(pending.popleft()))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+    return shards.filenames
+
+
+class _Shards:
+    def __init__(
+        self,
+        filename: str,
+        header: bytes,
+        shard_by_entity_type: bool,
+        shard_size: Optional[int],
+    ) -> None:
+        self.filenames: List[str] = []
+        self._filename = filename
+        self._files: Dict[_Key, BinaryIO] = {}
+        self._header = header
+        self._shard_by_entity_type = shard_by_entity_type
+        self._shard_size = shard_size
+
+    def __enter__(self) -> "_Shards":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        for file in self._files.values():
+            file.close()
+
+    def open(self, key: _Key) -> BinaryIO:
+        file = self._files.get(key)
+        if file is None:
+            filename = self._shard_filename(key)
+            file = open(filename, "wb")
+            file.write(self._header)
+            self._files[key] = file
+            self.filenames.append(filename)
+        return file
+
+    def write(self, key: _Key, data: bytes, last: bool) -> None:
+        file = self.open(key)
+        file.write(data)
+        if last:
+            del self._files[key]
+            file.close()
+
+    def _shard_filename(self, key: _Key) -> str:
+        if not self._shard_by_entity_type and self._shard_size is None:
+            return self._filename
+        directory, base = split(self._filename)
+        stem, dot, extensions = base.partition(".")
+        type, number = key
+        parts = [stem]
+        if self._shard_by_entity_type:
+            parts.append(type)
+        if self._shard_size is not None:
+            parts.append(str(number))
+        shard_base = "-".join(parts) + dot + extensions
+        return join(directory, shard_base)
+
+
+def _compress(text: str, compress: bool) -> bytes:
+    data = text.encode(_encoding)
+    return gzip_compress(data, _compress_level) if compress else data
+
+
+@lru_cache(maxsize=_cache_size)
+def _decode(schema_json: str) -> DomainGraphSchema:
     schema_dict = loads(schema_json)
-    schema = decode_domain_graph_schema(schema_dict)
-    with open(filename, "w", newline="") as file:
-        wri = writer(file)
-        rows = _rows(graph, schema)
-        wri.writerows(rows)
+    return decode_domain_graph_schema(schema_dict)
 
 
-def _rows(graph: DomainGraph, schema: DomainGraphSchema) -> Iterable[Iterable[str]]:
-    yield _headers(schema)
-    for entity in graph.entities:
-        yield _entity_cells(entity, schema)
-    for relationship in graph.relationships:
-        yield _relationship_cells(relationship, schema)
+def _entity_line(entity: Entity, layouts: Dict[str, _Layout], width: int) -> str:
+    entity_column, attribute_columns = layouts.get(entity.type, _empty_layout)
+    cells: Dict[int, str] = {}
+    if entity_column is not None:
+        cells[entity_column] = entity.id
+        cells[entity_column + 1] = entity.name
+    for assignment in entity.attribute_assignments:
+        attribute_column = attribute_columns.get(assignment.attribute_type_id)
+        if attribute_column is not None:
+            cells[attribute_column] = _cell(assignment.value)
+    return _line(cells, width)
 
 
 def _headers(schema: DomainGraphSchema) -> Iterable[str]:
@@ -47,32 +214,70 @@ def _headers(schema: DomainGraphSchema) -> Iterable[str]:
         yield f"{attribute_type.entity_type}: {attribute_type.id}"
 
 
-def _entity_cells(entity: Entity, schema: DomainGraphSchema) -> Iterable[str]:
-    type = entity.type
-    for entity_type in schema.entity_types:
-        yield from [entity.id, entity.name] if entity_type.id == type else ["", ""]
-    values = {
-        assignment.attribute_type_id: assignment.value
-        for assignment in entity.attribute_assignments
-    }
-    for attribute_type in schema.attribute_types:
-        value = values.get(attribute_type.id)
-        yield "" if attribute_type.entity_type != type or value is None else _cell(
-            value
-        )
+def _layouts(index: SchemaIndex) -> Dict[str, _Layout]:
+    layouts: Dict[str, _Layout] = {}
+    for (_, entity_type), column in index.entity_columns.items():
+        layouts[entity_type] = column, {}
+    for (_, entity_type, attribute_type), column in index.attribute_columns.items():
+        _, attribute_columns = layouts.setdefault(entity_type, (None, {}))
+        attribute_columns[attribute_type] = column
+    return layouts
+
+
+def _line(cells: Dict[int, str], width: int) -> str:
+    parts: List[str] = []
+    previous = 0
+    for column in sorted(cells):
+        parts.append("," * (column - previous))
+        parts.append(_quote(cells[column]))
+        previous = column
+    parts.append("," * (width - 1 - previous))
+    parts.append(_line_terminator)
+    return "".join(parts)
+
+
+def _encode(
+    rows: List[_Row], layouts: Dict[str, _Layout], width: int, compress: bool
+) -> bytes:
+    lines = [
+        _entity_line(row, layouts, width)
+        if isinstance(row, Entity)
+        else _relationship_line(row, layouts, width)
+        for row in rows
+    ]
+    text = "".join(lines)
+    return _compress(text, compress)
 
 
-def _relationship_cells(
-    relationship: Relationship, schema: DomainGraphSchema
-) -> Iterable[str]:
-    for type in schema.entity_types:
-        dict = {
-            relationship.from_entity_type: relationship.from_entity_id,
-            relationship.to_entity_type: relationship.to_entity_id,
-        }
-        yield dict.get(type.id, "")
-        yield ""
-    yield from [""] * len(schema.attribute_types)
+def _quote(cell: str) -> str:
+    if _special.search(cell) is None:
+        return cell
+    escaped = cell.replace('"', '""')
+    return f'"{escaped}"'
+
+
+def _relationship_line(
+    relationship: Relationship, layouts: Dict[str, _Layout], width: int
+) -> str:
+    ends = [
+        (relationship.from_entity_type, relationship.from_entity_id),
+        (relationship.to_entity_type, relationship.to_entity_id),
+    ]
+    cells: Dict[int, str] = {}
+    for type, id in ends:
+        column, _ = layouts.get(type, _empty_layout)
+        if column is not None:
+            cells[column] = id
+    return _line(cells, width)
+
+
+def _result(item: Tuple[_Key, "Future[bytes]", bool]) -> Tuple[_Key, bytes, bool]:
+    key, future, last = item
+    return key, future.result(), last
+
+
+def _type(row: _Row) -> str:
+    return row.type if isinstance(row, Entity) else row.from_entity_type
 
 
 def _cell(value: Value) -> str:
@@ -94,3 +299,12 @@ def _cell(value: Value) -> str:
 
     else:
         return f"{value.hour:02}:{value.minute:02}:{value.second:02}.0"
+
+
+_compress_level = 6
+_empty_layout: _Layout = None, {}
+_encoding = "utf-8"
+_line_terminator = "\r\n"
+_single_key: _Key = "", 0
+_source_id = 0
+_special = compile('[,"\r\n]')
@@ -5,6 +5,7 @@ from elimity_insights_client._decode_domain_graph_schema import (
     decode_domain_graph_schema,
 )
 from elimity_insights_client._domain_graph_schema import DomainGraphSchema
+from elimity_insights_client._schema_index import schema_index
 from elimity_insights_client.api.entities._entity import EntityType
 from tests.elimity_insights_client.api._json import decode_file as json_decode_file
 
@@ -31,5 +32,6 @@ def _item(dict: _SourceDict) -> Tuple[int, DomainGraphSchema]:
 _json = json_decode_file_local("sources.json", List[_SourceDict])
 _items = map(_item, _json)
 schemas = dict(_items)
+index = schema_index(schemas)
 
 type = EntityType("foo", 42)
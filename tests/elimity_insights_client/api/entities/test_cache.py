@@ -0,0 +1,65 @@
+from datetime import date, datetime, time, timezone
+from tempfile import TemporaryDirectory
+from typing import Dict, List
+
+from elimity_insights_client.api.entities._cache import load, store
+from elimity_insights_client.api.entities._entity import Entity, EntityType, Link
+from elimity_insights_client.api.query_results_page import (
+    BooleanValue,
+    DateTimeValue,
+    DateValue,
+    NumberValue,
+    StringValue,
+    TimeValue,
+    Value,
+)
+
+
+def test_cache() -> None:
+    value: Value = NumberValue(24)
+    link_assignments = {"ipsum": value}
+    link = Link(link_assignments, "baz", "lorem")
+    entity_assignments: Dict[str, Value] = {}
+    link_type = EntityType("bar", 42)
+    entity_links = {link_type: [link]}
+    entity = Entity(entity_assignments, "foo", entity_links, "bar")
+    entities = [entity]
+    with TemporaryDirectory() as dir:
+        path = dir + "/entities.sqlite"
+        assert load(path, "key", "1") is None
+        store(path, "key", "1", entities)
+        assert entities == load(path, "key", "1")
+        assert load(path, "key", "2") is None
+        assert load(path, "other", "1") is None
+        other_entities: List[Entity] = []
+        store(path, "key", "2", other_entities)
+        assert other_entities == load(path, "key", "2")
+        assert load(path, "key", "1") is None
+
+
+def test_cache_values() -> None:
+    dat = datetime(2006, 5, 4, 3, 2, 1, tzinfo=timezone.utc)
+    tim = time(10, 11, 12, 13)
+    assignments: Dict[str, Value] = {
+        "boolean": BooleanValue(False),
+        "date": DateValue(date(2006, 5, 4)),
+        "dateTime": DateTimeValue(dat),
+        "number": NumberValue(2.5),
+        "string": StringValue('"foo"'),
+        "time": TimeValue(tim),
+    }
+    link = Link(assignments, "baz", "lorem")
+    link_type = EntityType("bar", 42)
+    empty_assignments: Dict[str, Value] = {}
+    entities = [
+        Entity(assignments, "foo", {link_type: [link]}, "bar"),
+        Entity(empty_assignments, "qux", {link_type: [link]}, "quux"),
+    ]
+    with TemporaryDirectory() as dir:
+        path = dir + "/entities.sqlite"
+        store(path, "key", "1", entities)
+        assert entities == load(path, "key", "1")
+        interned_entities = load(path, "key", "1", True)
+        assert interned_entities is not None
+        foo, qux = interned_entities
+        assert foo.links[link_type][0] is qux.links[link_type][0]
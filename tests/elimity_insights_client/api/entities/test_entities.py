@@ -0,0 +1,46 @@
+from typing import List
+
+from pytest import MonkeyPatch, mark
+
+from elimity_insights_client.api._api import Config
+from elimity_insights_client.api.entities import _entities
+from elimity_insights_client.api.entities._entities import iter_entities
+from elimity_insights_client.api.query import Query
+from elimity_insights_client.api.query_results_page import Entity as ResultEntity
+from elimity_insights_client.api.query_results_page import QueryResult, QueryResultsPage
+from elimity_insights_client.api.source import AbsentLastReloadTimestamp, Source
+from tests.elimity_insights_client.api.entities._entities import schemas, type
+
+
+@mark.parametrize(
+    "count,sizes,offsets",
+    [(10, [2, 1], [0, 2]), (4, [2, 2], [0, 2]), (5, [2, 2, 1], [0, 2, 4])],
+)
+def test_iter_entities(
+    monkeypatch: MonkeyPatch, count: int, sizes: List[int], offsets: List[int]
+) -> None:
+    sources = [
+        Source(False, schema, id, AbsentLastReloadTimestamp(), "")
+        for id, schema in schemas.items()
+    ]
+    requested_offsets: List[int] = []
+
+    def api_query(config: Config, queries: List[Query]) -> List[QueryResultsPage]:
+        (que,) = queries
+        assert 2 == que.limit
+        requested_offsets.append(que.offset)
+        size = sizes[len(requested_offsets) - 1]
+        results = [
+            QueryResult(ResultEntity(True, str(que.offset + i), ""), [], [], [])
+            for i in range(size)
+        ]
+        page = QueryResultsPage(count, results)
+        return [page]
+
+    monkeypatch.setattr(_entities, "api_query", api_query)
+    monkeypatch.setattr(_entities, "cached_sources", lambda config: sources)
+    config = Config("", "", "", True)
+    entities = iter_entities(config, type, page_size=2)
+    ids = [entity.id for entity in entities]
+    assert [str(i) for i in range(sum(sizes))] == ids
+    assert offsets == requested_offsets
@@ -0,0 +1,61 @@
+from typing import Dict, List
+
+from pytest import MonkeyPatch
+
+from elimity_insights_client.api.entities import _graph
+from elimity_insights_client.api.entities._entity import Entity, EntityType, Link
+from elimity_insights_client.api.entities._graph import EntityGraph, entity_graph
+from elimity_insights_client.api.query_results_page import Value
+
+_group_type = EntityType("group", 42)
+_role_type = EntityType("role", 24)
+_user_type = EntityType("user", 42)
+
+
+def test_entity_graph() -> None:
+    graph = _graph_fixture()
+    assert 5 == len(graph)
+    assert ["foo", "bar"] == list(graph.ids(_user_type))
+    foo = graph.node(_user_type, "foo")
+    bar = graph.node(_user_type, "bar")
+    baz = graph.node(_group_type, "baz")
+    qux = graph.node(_group_type, "qux")
+    admin = graph.node(_role_type, "admin")
+    assert (_group_type, "qux") == graph.entity(qux)
+    assert 1 == graph.degree(foo)
+    assert 2 == graph.degree(bar)
+    assert 0 == graph.degree(admin)
+    assert [baz, qux] == list(graph.neighbors(bar))
+    assert [(bar, 0), (baz, 1), (qux, 1), (admin, 2)] == list(graph.bfs(bar))
+    assert [(bar, 0), (baz, 1), (qux, 1)] == list(graph.bfs(bar, 1))
+
+
+def test_entity_graph_reachable(monkeypatch: MonkeyPatch) -> None:
+    graph = _graph_fixture()
+    foo = graph.node(_user_type, "foo")
+    baz = graph.node(_group_type, "baz")
+    admin = graph.node(_role_type, "admin")
+    expected = {foo, baz, admin}
+    assert expected == graph.reachable(foo)
+    assert {foo, baz} == graph.reachable(foo, 1)
+    monkeypatch.setattr(_graph, "_numpy", None)
+    assert expected == graph.reachable(foo)
+    assert {foo, baz} == graph.reachable(foo, 1)
+
+
+def _entity(id: str, links: Dict[EntityType, List[Link]]) -> Entity:
+    assignments: Dict[str, Value] = {}
+    return Entity(assignments, id, links, id)
+
+
+def _graph_fixture() -> EntityGraph:
+    admin_link = Link({}, "admin", "admin")
+    baz_link = Link({}, "baz", "baz")
+    qux_link = Link({}, "qux", "qux")
+    users = [
+        _entity("foo", {_group_type: [baz_link]}),
+        _entity("bar", {_group_type: [baz_link, qux_link]}),
+    ]
+    groups = [_entity("baz", {_role_type: [admin_link]})]
+    entities = {_user_type: users, _group_type: groups}
+    return entity_graph(entities)
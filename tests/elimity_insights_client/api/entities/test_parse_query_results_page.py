@@ -1,3 +1,4 @@
+from dataclasses import replace
 from typing import Dict, List
 
 from elimity_insights_client.api._decode_query_results_page import (
@@ -6,16 +7,44 @@ from elimity_insights_client.api._decode_query_results_page import (
 )
 from elimity_insights_client.api.entities._entity import Entity, EntityType, Link
 from elimity_insights_client.api.entities._parse_query_results_page import (
+    merge_link_pages,
     parse_query_results_page,
 )
-from elimity_insights_client.api.query_results_page import NumberValue, Value
+from elimity_insights_client.api.query_results_page import (
+    NumberValue,
+    QueryResultsPage,
+    Value,
+)
 from tests.elimity_insights_client.api.entities._entities import (
+    index,
     json_decode_file_local,
-    schemas,
     type,
 )
 
 
+def test_merge_link_pages() -> None:
+    json = json_decode_file_local("query-results-page.json", QueryResultsPageDict)
+    page = decode_query_results_page(json)
+    base_results = [replace(result, link_pages=[]) for result in page.results]
+    base_page = QueryResultsPage(page.count, base_results)
+    link_pages = [
+        QueryResultsPage(
+            page.count,
+            [replace(result, link_pages=[result.link_pages[index]])],
+        )
+        for result in page.results
+        for index in range(len(result.link_pages))
+    ]
+    missing_page = QueryResultsPage(0, [])
+    link_pages.append(missing_page)
+    merged_page = merge_link_pages(base_page, link_pages)
+    (result,) = page.results
+    empty_page = QueryResultsPage(0, [])
+    result_link_pages = [*result.link_pages, empty_page]
+    merged_result = replace(result, link_pages=result_link_pages)
+    assert QueryResultsPage(page.count, [merged_result]) == merged_page
+
+
 def test_parse_query_results_page() -> None:
     json = json_decode_file_local("query-results-page.json", QueryResultsPageDict)
     page = decode_query_results_page(json)
@@ -30,4 +59,20 @@ def test_parse_query_results_page() -> None:
     lorem_links: List[Link] = []
     entity_links = {bar_type1: bar_links, bar_type2: bar_links, lorem_type: lorem_links}
     entity = Entity(entity_assignments, "foo", entity_links, "bar")
-    assert [entity] == parse_query_results_page(type, page, schemas)
+    assert [entity] == parse_query_results_page(type, page, index)
+
+
+def test_parse_query_results_page_intern_links() -> None:
+    json = json_decode_file_local("query-results-page.json", QueryResultsPageDict)
+    page = decode_query_results_page(json)
+    (result,) = page.results
+    other_entity = replace(result.entity, id="qux")
+    other_result = replace(result, entity=other_entity)
+    results = [result, other_result]
+    double_page = QueryResultsPage(2, results)
+    entity, other = parse_query_results_page(type, double_page, index, True)
+    assert parse_query_results_page(type, double_page, index) == [entity, other]
+    bar_type = EntityType("bar", 42)
+    (link,) = entity.links[bar_type]
+    (other_link,) = other.links[bar_type]
+    assert link is other_link
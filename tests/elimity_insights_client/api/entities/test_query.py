@@ -1,8 +1,26 @@
-from elimity_insights_client.api.entities._query import query
+from dataclasses import replace
+
+from elimity_insights_client._schema_index import schema_index
+from elimity_insights_client.api.entities._entity import EntityType
+from elimity_insights_client.api.entities._query import page_query, query
+from elimity_insights_client.api.entities._schema import project
+from elimity_insights_client.api.expression import (
+    AssignedBooleanExpression,
+    AttributeNumberExpression,
+    IdStringExpression,
+)
+from elimity_insights_client.api.query import (
+    BooleanAnyExpression,
+    Direction,
+    NumberAnyExpression,
+    Ordering,
+    StringAnyExpression,
+)
 from tests.elimity_insights_client.api._json import (
     encode_query_list as json_encode_query_list,
 )
 from tests.elimity_insights_client.api.entities._entities import (
+    index,
     json_decode_file_local,
     schemas,
     type,
@@ -10,5 +28,32 @@ from tests.elimity_insights_client.api.entities._entities import (
 
 
 def test_query() -> None:
-    que = query(type, schemas)
+    que = query(type, index)
     assert json_decode_file_local("query.json", object) == json_encode_query_list(que)
+
+
+def test_page_query() -> None:
+    que = page_query(type, index, 100, 200)
+    expr = IdStringExpression("")
+    any_expr = StringAnyExpression(expr)
+    ordering = Ordering(any_expr, Direction.ASC)
+    expected = replace(query(type, index), limit=100, offset=200, order_by=[ordering])
+    assert que == expected
+
+
+def test_project() -> None:
+    link_type = EntityType("bar", 24)
+    link_types = {link_type}
+    projected_schemas = project(type, schemas, {"ipsum"}, link_types)
+    projected_index = schema_index(projected_schemas)
+    que = query(type, projected_index)
+    assert que.include == []
+    (link_query,) = que.link_queries
+    assigned_expr = AssignedBooleanExpression("ipsum", "")
+    attribute_expr = AttributeNumberExpression("ipsum", "")
+    inclusions = [
+        BooleanAnyExpression(assigned_expr),
+        NumberAnyExpression(attribute_expr),
+    ]
+    assert (link_query.entity_type, link_query.source_id) == ("bar", 24)
+    assert link_query.include == inclusions
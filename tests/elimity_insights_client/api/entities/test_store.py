@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+from tempfile import TemporaryDirectory
+from typing import Dict, List
+
+from elimity_insights_client.api.entities._entity import Entity, EntityType, Link
+from elimity_insights_client.api.entities._store import EntityStore
+from elimity_insights_client.api.query_results_page import (
+    DateTimeValue,
+    NumberValue,
+    Value,
+)
+
+
+def test_store() -> None:
+    value: Value = NumberValue(24)
+    dat = datetime(2006, 5, 4, 3, 2, 1, tzinfo=timezone.utc)
+    date_time_value: Value = DateTimeValue(dat)
+    assignments = {"ipsum": value, "dolor": date_time_value}
+    bar_type = EntityType("bar", 42)
+    lorem_type = EntityType("lorem", 24)
+    baz_link = Link(assignments, "baz", "lorem")
+    qux_link = Link({}, "qux", "dolor")
+    empty_links: List[Link] = []
+    foo_links = {bar_type: [baz_link, qux_link], lorem_type: empty_links}
+    foo = Entity(assignments, "foo", foo_links, "bar")
+    empty_assignments: Dict[str, Value] = {}
+    old_links = {bar_type: [qux_link], lorem_type: empty_links}
+    old = Entity(empty_assignments, "amet", old_links, "old")
+    amet_links = {bar_type: [baz_link], lorem_type: empty_links}
+    amet = Entity(empty_assignments, "amet", amet_links, "sit")
+    with TemporaryDirectory() as dir:
+        path = dir + "/entities.sqlite"
+        with EntityStore(path) as store:
+            store.add([foo, old])
+            store.add(iter([amet]))
+            assert 2 == len(store)
+            assert [amet, foo] == list(store)
+            assert foo == store.get("foo")
+            assert store.get("bar") is None
+            assert [amet, foo] == list(store.linking(bar_type, "baz"))
+            assert [foo] == list(store.linking(bar_type, "qux"))
+
+        with EntityStore(path) as store:
+            assert [amet, foo] == list(store)
@@ -0,0 +1,57 @@
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from importlib.resources import read_binary
+from threading import Thread
+from typing import List, Optional
+
+from elimity_insights_client.api import Config, cached_sources, invalidate_sources
+
+_etag = '"foo"'
+_source = read_binary(__package__, "source.json")
+
+
+def test_cached_sources() -> None:
+    etags: List[Optional[str]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            etag = self.headers["If-None-Match"]
+            etags.append(etag)
+            if etag == _etag:
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.end_headers()
+                return
+
+            body = b"[%s]" % _source
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", _etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: object, *args: object) -> None:
+            pass
+
+    server_address = "", 0
+    server = HTTPServer(server_address, Handler)
+    thread = Thread(target=server.serve_forever)
+    thread.start()
+    url = f"http://localhost:{server.server_port}"
+    config = Config("foo", "bar", url, True)
+    try:
+        [source] = cached_sources(config, 0)
+        assert 42 == source.id
+        [revalidated_source] = cached_sources(config)
+        assert revalidated_source is source
+        [cached_source] = cached_sources(config)
+        assert cached_source is source
+        invalidate_sources(config)
+        [fetched_source] = cached_sources(config)
+        assert fetched_source is not source
+        assert fetched_source == source
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+        invalidate_sources(config)
+    assert [None, _etag, None] == etags
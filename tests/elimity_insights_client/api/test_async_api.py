@@ -0,0 +1,114 @@
+from asyncio import (
+    Event,
+    IncompleteReadError,
+    StreamReader,
+    StreamWriter,
+    TimeoutError,
+    gather,
+    run,
+    start_server,
+    wait_for,
+)
+from asyncio.base_events import Server
+from importlib.resources import read_text
+from json import loads
+from typing import List
+
+from pytest import raises
+
+from elimity_insights_client.api._api import Config
+from elimity_insights_client.api._async_api import AsyncClient
+from elimity_insights_client.api._decode_query_results_page import (
+    decode_query_results_page,
+)
+from elimity_insights_client.api.expression import ActiveBooleanExpression
+from elimity_insights_client.api.query import (
+    AnyExpression,
+    DirectLinkGroupByQuery,
+    DirectLinkQuery,
+    LinkGroupByQuery,
+    Ordering,
+    Query,
+)
+from elimity_insights_client.api.query_results_page import QueryResultsPage
+
+
+def test_async_client() -> None:
+    page_text = read_text(__package__, "query-results-page.json")
+    page_json = loads(page_text)
+    page = decode_query_results_page(page_json)
+    connections: List[None] = []
+
+    async def handle(reader: StreamReader, writer: StreamWriter) -> None:
+        connections.append(None)
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except IncompleteReadError:
+                break
+            _, length = head.split(b"Content-Length: ")
+            await reader.readexactly(int(length.split(b"\r\n")[0]))
+            body = f"[{page_text}]".encode()
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n" % len(body))
+            writer.write(body)
+            await writer.drain()
+        writer.close()
+
+    async def main() -> List[List[QueryResultsPage]]:
+        server = await start_server(handle, "127.0.0.1", 0)
+        async with server, AsyncClient(_config(server), 10) as client:
+            queries = [_query()]
+            coroutines = [client.query(queries) for _ in range(300)]
+            return await gather(*coroutines)
+
+    assert [[page]] * 300 == run(main())
+    assert len(connections) <= 10
+
+
+def test_async_client_cancel() -> None:
+    async def main() -> None:
+        closed = Event()
+
+        async def handle(reader: StreamReader, writer: StreamWriter) -> None:
+            await reader.readuntil(b"\r\n\r\n")
+            await reader.read()
+            closed.set()
+            writer.close()
+
+        server = await start_server(handle, "127.0.0.1", 0)
+        async with server, AsyncClient(_config(server)) as client:
+            with raises(TimeoutError):
+                await wait_for(client.sources(), 0.1)
+            await wait_for(closed.wait(), 1)
+
+    run(main())
+
+
+def _config(server: Server) -> Config:
+    (socket,) = server.sockets
+    _, port = socket.getsockname()
+    return Config("foo", "bar", f"http://127.0.0.1:{port}", True)
+
+
+def _query() -> Query:
+    condition = ActiveBooleanExpression("foo")
+    direct_link_group_by_queries: List[DirectLinkGroupByQuery] = []
+    direct_link_queries: List[DirectLinkQuery] = []
+    include: List[AnyExpression] = []
+    link_group_by_queries: List[LinkGroupByQuery] = []
+    link_queries: List[Query] = []
+    orderings: List[Ordering] = []
+    return Query(
+        "foo",
+        condition,
+        direct_link_group_by_queries,
+        direct_link_queries,
+        "bar",
+        include,
+        10,
+        link_group_by_queries,
+        link_queries,
+        0,
+        orderings,
+        42,
+    )
@@ -0,0 +1,93 @@
+from dataclasses import replace
+from typing import List
+
+from elimity_insights_client.api._chunked_query import merge_pages, plan_chunks
+from elimity_insights_client.api.expression import (
+    ActiveBooleanExpression,
+    AllBooleanExpression,
+    AttributeStringExpression,
+    BooleanExpression,
+    IdInBooleanExpression,
+)
+from elimity_insights_client.api.query import (
+    AnyExpression,
+    Direction,
+    DirectLinkGroupByQuery,
+    DirectLinkQuery,
+    LinkGroupByQuery,
+    Ordering,
+    Query,
+    StringAnyExpression,
+)
+from elimity_insights_client.api.query_results_page import (
+    Entity,
+    GroupByQueryResultsPage,
+    QueryResult,
+    QueryResultsPage,
+    Value,
+)
+
+
+def test_plan_chunks() -> None:
+    active: BooleanExpression = ActiveBooleanExpression("foo")
+    ids: BooleanExpression = IdInBooleanExpression(["a", "b", "c", "b", "d"], "foo")
+    exprs = [active, ids]
+    query = _query(AllBooleanExpression(exprs), 10, 5)
+    ids1: BooleanExpression = IdInBooleanExpression(["a", "b", "c"], "foo")
+    exprs1 = [active, ids1]
+    query1 = _query(AllBooleanExpression(exprs1), 15, 0)
+    ids2: BooleanExpression = IdInBooleanExpression(["d"], "foo")
+    exprs2 = [active, ids2]
+    query2 = _query(AllBooleanExpression(exprs2), 15, 0)
+    assert [query1, query2] == plan_chunks(query, 3)
+    assert [query] == plan_chunks(query, 4)
+
+
+def test_plan_chunks_ordered() -> None:
+    ids = IdInBooleanExpression(["a", "b", "c", "d"], "foo")
+    query = _query(ids, 10, 5)
+    name = AttributeStringExpression("name", "foo")
+    ordering = Ordering(StringAnyExpression(name), Direction.ASC)
+    orderings = [ordering]
+    ordered_query = replace(query, order_by=orderings)
+    assert [ordered_query] == plan_chunks(ordered_query, 2)
+
+
+def test_merge_pages() -> None:
+    results = [_result(id) for id in "abcde"]
+    page1 = QueryResultsPage(3, results[:3])
+    page2 = QueryResultsPage(2, results[3:])
+    pages = [page1, page2]
+    expected = QueryResultsPage(5, results[1:4])
+    assert expected == merge_pages(pages, 1, 3)
+
+
+def _query(condition: BooleanExpression, limit: int, offset: int) -> Query:
+    direct_link_group_by_queries: List[DirectLinkGroupByQuery] = []
+    direct_link_queries: List[DirectLinkQuery] = []
+    include: List[AnyExpression] = []
+    link_group_by_queries: List[LinkGroupByQuery] = []
+    link_queries: List[Query] = []
+    orderings: List[Ordering] = []
+    return Query(
+        "foo",
+        condition,
+        direct_link_group_by_queries,
+        direct_link_queries,
+        "bar",
+        include,
+        limit,
+        link_group_by_queries,
+        link_queries,
+        offset,
+        orderings,
+        42,
+    )
+
+
+def _result(id: str) -> QueryResult:
+    entity = Entity(True, id, id)
+    inclusions: List[Value] = []
+    link_group_by_pages: List[GroupByQueryResultsPage] = []
+    link_pages: List[QueryResultsPage] = []
+    return QueryResult(entity, inclusions, link_group_by_pages, link_pages)
@@ -0,0 +1,83 @@
+from typing import List
+
+from elimity_insights_client.api._columns import (
+    group_by_query_results_columns,
+    group_by_query_results_rows,
+    query_results_columns,
+)
+from elimity_insights_client.api._decode_query_results_page import (
+    QueryResultDict,
+    decode_lazy_query_result,
+)
+from elimity_insights_client.api.query_results_page import (
+    BooleanValue,
+    Entity,
+    GroupByQueryResult,
+    GroupByQueryResultsPage,
+    QueryResult,
+    QueryResultsPage,
+    StringValue,
+    Value,
+)
+
+
+def test_group_by_query_results_columns() -> None:
+    page = _group_by_page()
+    columns = group_by_query_results_columns(page)
+    assert [2, 3, 4] == list(columns["count"])
+    assert ["foo", "foo", "bar"] == list(columns["label_0"])
+    assert [True, True, True] == list(columns["label_0_valid"])
+    assert [True, False] == list(columns["label_1"])[:2]
+    assert [True, True, False] == list(columns["label_1_valid"])
+
+
+def test_group_by_query_results_rows() -> None:
+    page = _group_by_page()
+    rows = [(("foo", True), 2), (("foo", False), 3), (("bar",), 4)]
+    assert rows == list(group_by_query_results_rows(page))
+
+
+def test_query_results_columns() -> None:
+    entity = Entity(True, "foo", "bar")
+    inclusions: List[Value] = [StringValue("baz")]
+    link_group_by_pages: List[GroupByQueryResultsPage] = []
+    link_pages: List[QueryResultsPage] = []
+    result1 = QueryResult(entity, inclusions, link_group_by_pages, link_pages)
+    result_dict: QueryResultDict = {
+        "entity": {"active": False, "id": "qux", "name": "quux"},
+        "inclusions": [
+            {"type": "string", "value": "corge"},
+            {"type": "number", "value": "42"},
+        ],
+        "linkGroupByPages": [],
+        "linkPages": [],
+    }
+    result2 = decode_lazy_query_result(result_dict)
+    results = [result1, result2]
+    page = QueryResultsPage(2, results)
+    columns = query_results_columns(page)
+    assert [True, False] == list(columns["active"])
+    assert ["foo", "qux"] == list(columns["id"])
+    assert ["bar", "quux"] == list(columns["name"])
+    assert ["baz", "corge"] == list(columns["inclusion_0"])
+    assert [True, True] == list(columns["inclusion_0_valid"])
+    assert 42 == columns["inclusion_1"][1]
+    assert [False, True] == list(columns["inclusion_1_valid"])
+
+
+def _group(
+    count: int, label: Value, sub_results: List[GroupByQueryResult]
+) -> GroupByQueryResult:
+    sub_page = GroupByQueryResultsPage(len(sub_results), sub_results)
+    sub_pages = [sub_page]
+    return GroupByQueryResult(count, label, sub_pages)
+
+
+def _group_by_page() -> GroupByQueryResultsPage:
+    no_results: List[GroupByQueryResult] = []
+    true = _group(2, BooleanValue(True), no_results)
+    false = _group(3, BooleanValue(False), no_results)
+    foo = _group(5, StringValue("foo"), [true, false])
+    bar = _group(4, StringValue("bar"), no_results)
+    results = [foo, bar]
+    return GroupByQueryResultsPage(2, results)
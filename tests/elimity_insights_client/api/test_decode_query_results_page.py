@@ -1,20 +1,26 @@
-from datetime import datetime, time, timezone
+from dataclasses import replace
+from datetime import date, datetime, time, timezone
 from importlib.resources import open_binary
 from json import load
 from typing import List
 
 from elimity_insights_client.api._decode_query_results_page import (
+    ValueDict,
+    decode_lazy_query_results_page,
     decode_query_results_page,
+    decode_value,
 )
 from elimity_insights_client.api.query_results_page import (
     BooleanValue,
     DateTimeValue,
+    DateValue,
     Entity,
     GroupByQueryResult,
     GroupByQueryResultsPage,
     NumberValue,
     QueryResult,
     QueryResultsPage,
+    StringValue,
     TimeValue,
     Value,
 )
@@ -42,3 +48,31 @@ def test_decode_query_results_page() -> None:
     page_file = open_binary(__package__, "query-results-page.json")
     page_json = load(page_file)
     assert QueryResultsPage(1, results) == decode_query_results_page(page_json)
+
+
+def test_decode_lazy_query_results_page() -> None:
+    page_file = open_binary(__package__, "query-results-page.json")
+    page_json = load(page_file)
+    lazy_page = decode_lazy_query_results_page(page_json)
+    (lazy_result,) = lazy_page.results
+    assert lazy_result.link_pages is lazy_result.link_pages
+    assert decode_query_results_page(page_json) == lazy_page
+    inclusions: List[Value] = []
+    replaced_result = replace(lazy_result, inclusions=inclusions)
+    assert replaced_result.inclusions == []
+    assert replaced_result.link_pages == lazy_result.link_pages
+    assert replace(lazy_result) == lazy_result
+
+
+def test_decode_value() -> None:
+    date_dict: ValueDict = {"type": "date", "value": "2006-05-04"}
+    date_value: Value = DateValue(date(2006, 5, 4))
+    assert date_value == decode_value(date_dict)
+    number_dict: ValueDict = {"type": "number", "value": "4.5e1"}
+    number_value: Value = NumberValue(45)
+    assert number_value == decode_value(number_dict)
+    string_dict: ValueDict = {"type": "string", "value": "foo"}
+    string_value: Value = StringValue("foo")
+    assert string_value == decode_value(string_dict)
+    boolean_dict: ValueDict = {"type": "boolean", "value": "true"}
+    assert decode_value(boolean_dict) is decode_value(boolean_dict)
@@ -1,8 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime
-from typing import List
+from typing import List, cast
 
 from dateutil.tz import tzoffset
+from pytest import raises
 
+from elimity_insights_client._decode_domain_graph_schema import DomainGraphSchemaDict
 from elimity_insights_client._domain_graph_schema import (
     AttributeType,
     DomainGraphSchema,
@@ -31,3 +35,32 @@ def test_decode_source() -> None:
     timestamp = PresentLastReloadTimestamp(dat)
     json = json_decode_file_local("source.json", SourceDict)
     assert Source(True, schema, 42, timestamp, "foo") == decode_source(json)
+
+
+def test_decode_source_concurrent() -> None:
+    json = json_decode_file_local("source.json", SourceDict)
+    expected = decode_source(json).domain_graph_schema
+    for _ in range(100):
+        source = decode_source(json)
+
+        def decode(_: int) -> DomainGraphSchema:
+            return source.domain_graph_schema
+
+        with ThreadPoolExecutor(4) as executor:
+            schemas = list(executor.map(decode, range(4)))
+        assert [expected] * 4 == schemas
+
+
+def test_decode_source_lazy() -> None:
+    json = json_decode_file_local("source.json", SourceDict)
+    json["domainGraphSchema"] = cast(DomainGraphSchemaDict, {})
+    source = decode_source(json)
+    assert 42 == source.id
+    with raises(KeyError):
+        source.domain_graph_schema
+    schema = DomainGraphSchema([], [], [])
+    source.domain_graph_schema = schema
+    renamed = replace(source, name="bar")
+    assert "bar" == renamed.name
+    assert schema == renamed.domain_graph_schema
+    assert 42 == renamed.id
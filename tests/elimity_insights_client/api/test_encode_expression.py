@@ -0,0 +1,21 @@
+from simplejson import dumps
+
+from elimity_insights_client.api._encode_expression import encode_boolean_expression
+from elimity_insights_client.api.expression import (
+    AllBooleanExpression,
+    BooleanExpression,
+    LiteralBooleanExpression,
+    NotBooleanExpression,
+)
+
+
+def test_encode_boolean_expression_deep() -> None:
+    expr: BooleanExpression = LiteralBooleanExpression(True)
+    for _ in range(50000):
+        exprs = [expr]
+        expr = NotBooleanExpression(AllBooleanExpression(exprs))
+    json = encode_boolean_expression(expr)
+    string = dumps(json)
+    prefix = '{"expr": {"exprs": [' * 50000
+    suffix = '], "type": "all"}, "type": "not"}' * 50000
+    assert f'{prefix}{{"boolean": true, "type": "literal"}}{suffix}' == string
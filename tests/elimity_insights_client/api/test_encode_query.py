@@ -1,9 +1,28 @@
-from typing import Dict
+from dataclasses import is_dataclass
+from datetime import date, datetime, time, timedelta
+from enum import EnumMeta
+from functools import lru_cache
+from random import Random
+from typing import Dict, FrozenSet, Hashable, List, Union, cast
 
 from hypothesis import HealthCheck, given, settings
 from jsonschema import validate
+from simplejson import dumps
+from typing_extensions import Protocol, get_args, get_origin, get_type_hints
 
-from elimity_insights_client.api.query import Query
+from elimity_insights_client.api._encode_query import encode_query
+from elimity_insights_client.api.expression import (
+    AllBooleanExpression,
+    BooleanExpression,
+    CmpOperator,
+    LiteralBooleanExpression,
+    LiteralNumberExpression,
+    NumberCmpBooleanExpression,
+)
+from elimity_insights_client.api.query import AnyExpression, NumberAnyExpression, Query
+from tests.elimity_insights_client.api._baseline_encode import (
+    encode_query as baseline_encode_query,
+)
 from tests.elimity_insights_client.api._json import (
     decode_file_local as json_decode_file_local,
 )
@@ -20,3 +39,102 @@ def test_encode_query(query: Query) -> None:
     query_json = json_encode_query_list(query)
     schema_json = json_decode_file_local("schema.json", Dict[str, object])
     validate(query_json, schema_json)
+
+
+def test_baseline_encoding() -> None:
+    random = Random(0)
+    for _ in range(400):
+        query = cast(Query, _generate(random, Query, 0))
+        expected = dumps(baseline_encode_query(query), iterable_as_array=True)
+        actual = dumps(encode_query(query))
+        assert expected == actual
+
+
+def test_subclass_encoding() -> None:
+    class SubclassedLiteral(LiteralBooleanExpression):
+        pass
+
+    class SubclassedCmp(NumberCmpBooleanExpression):
+        pass
+
+    class SubclassedAny(NumberAnyExpression):
+        pass
+
+    random = Random(0)
+    query = cast(Query, _generate(random, Query, 0))
+    literal = SubclassedLiteral(True)
+    number = LiteralNumberExpression(42)
+    cmp = SubclassedCmp(number, CmpOperator.LTE, number)
+    exprs: List[BooleanExpression] = [literal, cmp]
+    query.condition = AllBooleanExpression(exprs)
+    include: AnyExpression = SubclassedAny(number)
+    query.include = [include]
+    expected = dumps(baseline_encode_query(query), iterable_as_array=True)
+    actual = dumps(encode_query(query))
+    assert expected == actual
+
+
+class _Constructor(Protocol):
+    def __call__(self, *args: object) -> object:
+        ...
+
+
+def _generate(random: Random, type: Hashable, depth: int) -> object:
+    if type is bool:
+        return random.random() < 0.5
+    if type is date:
+        return date(2000, 1, 1) + timedelta(days=random.randrange(10000))
+    if type is datetime:
+        seconds = random.randrange(10**9)
+        return datetime(2000, 1, 1) + timedelta(seconds=seconds)
+    if type is float:
+        return random.choice([0, -1.5, 42, 1e20, 0.1])
+    if type is int:
+        return random.randrange(100)
+    if type is str:
+        return random.choice(["", "a", 'q"uote', "ünïcode", "new\nline"])
+    if type is time:
+        return time(random.randrange(24), random.randrange(60), random.randrange(60))
+    if isinstance(type, EnumMeta):
+        return random.choice(list(type))
+
+    origin = get_origin(type)
+    args = get_args(type)
+    if origin is list:
+        length = 0 if depth >= _max_depth else random.randrange(3)
+        return [_generate(random, args[0], depth + 1) for _ in range(length)]
+    if origin is Union:
+        members = args
+        if depth >= _max_depth:
+            members = tuple(member for member in args if _is_finite(member))
+        member = random.choice(members)
+        return _generate(random, member, depth)
+
+    hints = _type_hints(type)
+    values = [_generate(random, hint, depth + 1) for hint in hints.values()]
+    cls = cast(_Constructor, type)
+    return cls(*values)
+
+
+@lru_cache(maxsize=None)
+def _is_finite(type: Hashable, seen: FrozenSet[object] = frozenset()) -> bool:
+    origin = get_origin(type)
+    if origin is list:
+        return True
+    if origin is Union:
+        return any(_is_finite(member, seen) for member in get_args(type))
+    if not is_dataclass(type):
+        return True
+    if type in seen:
+        return False
+    hints = _type_hints(cast(Hashable, type))
+    return all(_is_finite(hint, seen | {type}) for hint in hints.values())
+
+
+@lru_cache(maxsize=None)
+def _type_hints(type: Hashable) -> Dict[str, Hashable]:
+    cls = cast(_Constructor, type)
+    return get_type_hints(cls)
+
+
+_max_depth = 4
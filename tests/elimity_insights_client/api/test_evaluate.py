@@ -0,0 +1,193 @@
+from datetime import date, time, timedelta, timezone
+from typing import Dict, List, Sequence, Tuple
+
+from pytest import MonkeyPatch, mark, raises
+
+from elimity_insights_client import _util
+from elimity_insights_client.api import _columns, _evaluate
+from elimity_insights_client.api._evaluate import (
+    compile_boolean_expression,
+    evaluate_boolean_expression,
+)
+from elimity_insights_client.api.entities._columns import entities_columns
+from elimity_insights_client.api.entities._entity import Entity
+from elimity_insights_client.api.expression import (
+    ActiveBooleanExpression,
+    AllBooleanExpression,
+    AnyBooleanExpression,
+    AssignedBooleanExpression,
+    AttributeBooleanExpression,
+    AttributeDateExpression,
+    AttributeNumberExpression,
+    AttributeStringExpression,
+    AttributeTimeExpression,
+    BooleanExpression,
+    CmpOperator,
+    DateCmpBooleanExpression,
+    IdInBooleanExpression,
+    IdStringExpression,
+    LinkAssignedBooleanExpression,
+    LiteralBooleanExpression,
+    LiteralDateExpression,
+    LiteralNumberExpression,
+    LiteralStringExpression,
+    LiteralTimeExpression,
+    MatchBooleanExpression,
+    MatchMode,
+    MatchOperator,
+    NameStringExpression,
+    NotBooleanExpression,
+    NumberCmpBooleanExpression,
+    TimeCmpBooleanExpression,
+)
+from elimity_insights_client.api.query_results_page import (
+    BooleanValue,
+    DateValue,
+    NumberValue,
+    StringValue,
+    TimeValue,
+    Value,
+)
+
+_age = AttributeNumberExpression("age", "")
+_admin = AttributeBooleanExpression("admin", "")
+_email = AttributeStringExpression("email", "")
+_expiry = AttributeDateExpression("expiry", "")
+
+
+@mark.parametrize("numpy", [False, True])
+def test_evaluate_boolean_expression(monkeypatch: MonkeyPatch, numpy: bool) -> None:
+    if not numpy:
+        monkeypatch.setattr(_columns, "_numpy", None)
+        monkeypatch.setattr(_evaluate, "_numpy", None)
+    columns = entities_columns(_entities())
+    forty = LiteralNumberExpression(40)
+    old = NumberCmpBooleanExpression(_age, CmpOperator.GTE, forty)
+    domain = LiteralStringExpression("@EXAMPLE.COM")
+    example = MatchBooleanExpression(
+        _email, MatchMode.CASE_INSENSITIVE, MatchOperator.ENDS_WITH, domain
+    )
+    name_prefix = LiteralStringExpression("B")
+    name = NameStringExpression("")
+    starts_with_b = MatchBooleanExpression(
+        name, MatchMode.CASE_SENSITIVE, MatchOperator.STARTS_WITH, name_prefix
+    )
+    new_year = LiteralDateExpression(date(2024, 1, 1))
+    expired = DateCmpBooleanExpression(_expiry, CmpOperator.LT, new_year)
+    foo_id = LiteralStringExpression("foo")
+    id = IdStringExpression("")
+    foo = MatchBooleanExpression(
+        id, MatchMode.CASE_SENSITIVE, MatchOperator.EQUALS, foo_id
+    )
+    assigned = AssignedBooleanExpression("age", "")
+    cases: List[Tuple[str, BooleanExpression]] = [
+        ("ttt", LiteralBooleanExpression(True)),
+        ("fft", _admin),
+        ("ttf", assigned),
+        ("tff", old),
+        ("ftt", NotBooleanExpression(old)),
+        ("ttf", example),
+        ("ftt", starts_with_b),
+        ("fft", expired),
+        ("tff", foo),
+        ("fft", IdInBooleanExpression(["baz", "qux"], "")),
+        ("tff", AllBooleanExpression([assigned, old, example])),
+        ("ttt", AnyBooleanExpression([foo, starts_with_b, _admin])),
+    ]
+    for expected, expression in cases:
+        mask = evaluate_boolean_expression(expression, columns)
+        assert _mask(expected) == list(mask), expression
+
+
+@mark.parametrize("numpy", [False, True])
+def test_evaluate_boolean_expression_missing(
+    monkeypatch: MonkeyPatch, numpy: bool
+) -> None:
+    if not numpy:
+        monkeypatch.setattr(_columns, "_numpy", None)
+        monkeypatch.setattr(_evaluate, "_numpy", None)
+    columns = entities_columns(_entities())
+    forty = LiteralNumberExpression(40)
+    missing = AttributeNumberExpression("missing", "")
+    old = NumberCmpBooleanExpression(missing, CmpOperator.GTE, forty)
+    cases: List[Tuple[str, BooleanExpression]] = [
+        ("fff", AssignedBooleanExpression("missing", "")),
+        ("fff", AttributeBooleanExpression("missing", "")),
+        ("fff", old),
+        ("ttt", NotBooleanExpression(old)),
+    ]
+    for expected, expression in cases:
+        mask = evaluate_boolean_expression(expression, columns)
+        assert _mask(expected) == list(mask), expression
+
+    empty_entities: List[Entity] = []
+    empty_columns = entities_columns(empty_entities)
+    young = NumberCmpBooleanExpression(_age, CmpOperator.LT, forty)
+    assert [] == list(evaluate_boolean_expression(young, empty_columns))
+
+
+@mark.parametrize("numpy", [False, True])
+def test_evaluate_boolean_expression_time(
+    monkeypatch: MonkeyPatch, numpy: bool
+) -> None:
+    if not numpy:
+        monkeypatch.setattr(_columns, "_numpy", None)
+        monkeypatch.setattr(_evaluate, "_numpy", None)
+    tzinfo = timezone(timedelta(hours=2))
+    monkeypatch.setattr(_util, "local_timezone", tzinfo)
+    noon = time(12, tzinfo=timezone.utc)
+    assignments: Dict[str, Value] = {"start": TimeValue(noon)}
+    entity = Entity(assignments, "foo", {}, "Foo")
+    entities = [entity]
+    columns = entities_columns(entities)
+    start = AttributeTimeExpression("start", "")
+    cases: List[Tuple[str, BooleanExpression]] = [
+        (
+            "t",
+            TimeCmpBooleanExpression(
+                start, CmpOperator.EQ, LiteralTimeExpression(time(14))
+            ),
+        ),
+        (
+            "t",
+            TimeCmpBooleanExpression(
+                start, CmpOperator.GT, LiteralTimeExpression(time(13))
+            ),
+        ),
+        ("f", ActiveBooleanExpression("")),
+    ]
+    for expected, expression in cases:
+        mask = evaluate_boolean_expression(expression, columns)
+        assert _mask(expected) == list(mask), expression
+
+
+def test_evaluate_boolean_expression_unsupported() -> None:
+    expression = LinkAssignedBooleanExpression("foo", "bar")
+    with raises(ValueError):
+        compile_boolean_expression(expression)
+
+
+def _entities() -> List[Entity]:
+    foo_assignments: Dict[str, Value] = {
+        "admin": BooleanValue(False),
+        "age": NumberValue(42),
+        "email": StringValue("foo@example.com"),
+        "expiry": DateValue(date(2024, 6, 1)),
+    }
+    bar_assignments: Dict[str, Value] = {
+        "age": NumberValue(24),
+        "email": StringValue("bar@Example.com"),
+    }
+    baz_assignments: Dict[str, Value] = {
+        "admin": BooleanValue(True),
+        "expiry": DateValue(date(2023, 6, 1)),
+    }
+    return [
+        Entity(foo_assignments, "foo", {}, "Foo"),
+        Entity(bar_assignments, "bar", {}, "Bar"),
+        Entity(baz_assignments, "baz", {}, "Baz"),
+    ]
+
+
+def _mask(text: str) -> Sequence[bool]:
+    return [char == "t" for char in text]
@@ -0,0 +1,225 @@
+from typing import List
+
+from pytest import raises
+
+from elimity_insights_client._elimity_insights_client import (
+    AttributeAssignment,
+    DomainGraph,
+    Entity,
+    NumberValue,
+    Relationship,
+    StringValue,
+)
+from elimity_insights_client.api import LocalQueryEngine
+from elimity_insights_client.api.expression import (
+    AggregateOperator,
+    AttributeNumberExpression,
+    AttributeStringExpression,
+    BooleanExpression,
+    CmpOperator,
+    IdInBooleanExpression,
+    LinkAggregateNumberExpression,
+    LinkedToBooleanExpression,
+    LiteralBooleanExpression,
+    LiteralNumberExpression,
+    LiteralStringExpression,
+    MatchBooleanExpression,
+    MatchMode,
+    MatchOperator,
+    NumberCmpBooleanExpression,
+)
+from elimity_insights_client.api.query import (
+    AnyExpression,
+    DirectedGroupOrdering,
+    Direction,
+    Grouping,
+    GroupOrderingType,
+    LinkGroupByQuery,
+    NumberAnyExpression,
+    Ordering,
+    Query,
+    StringAnyExpression,
+)
+from elimity_insights_client.api.query_results_page import (
+    GroupByQueryResult,
+    GroupByQueryResultsPage,
+)
+from elimity_insights_client.api.query_results_page import NumberValue as Number
+from elimity_insights_client.api.query_results_page import QueryResultsPage
+from elimity_insights_client.api.query_results_page import StringValue as String
+
+_age = AttributeNumberExpression("age", "")
+_department = AttributeStringExpression("department", "")
+_true = LiteralBooleanExpression(True)
+
+
+def test_local_query_engine() -> None:
+    engine = LocalQueryEngine(_graph(), 42)
+    forty = LiteralNumberExpression(40)
+    old = NumberCmpBooleanExpression(forty, CmpOperator.LTE, _age)
+    name = LiteralStringExpression("bar")
+    admins = MatchBooleanExpression(
+        AttributeStringExpression("name", ""),
+        MatchMode.CASE_INSENSITIVE,
+        MatchOperator.CONTAINS,
+        name,
+    )
+    in_admins = LinkedToBooleanExpression("", admins, "group", 42)
+    age_order = Ordering(NumberAnyExpression(_age), Direction.DESC)
+    group_count = LinkAggregateNumberExpression(
+        "", _true, "group", _age, AggregateOperator.COUNT, 42
+    )
+    count_ordering = DirectedGroupOrdering(Direction.DESC, GroupOrderingType.COUNT)
+    grouping = Grouping(StringAnyExpression(_department), count_ordering)
+    group_by = LinkGroupByQuery("", _true, "user", [grouping], 42)
+    link_query = _query("user", old, [], [], [], [])
+    queries = [
+        _query("user", old, [age_order], [], [], []),
+        _query("user", in_admins, [], [NumberAnyExpression(group_count)], [], []),
+        _query("group", _true, [], [], [link_query], [group_by]),
+        _query("user", _true, [], [], [], [], source_id=1),
+    ]
+    pages = engine.query(queries)
+    assert [result.entity.id for result in pages[0].results] == ["3", "2"]
+    assert [result.entity.id for result in pages[1].results] == ["1", "2"]
+    assert [result.inclusions for result in pages[1].results] == [
+        [Number(2)],
+        [Number(2)],
+    ]
+    admins_result, readers_result = pages[2].results
+    link_ids = [result.entity.id for result in admins_result.link_pages[0].results]
+    assert link_ids == ["2"]
+    assert readers_result.link_group_by_pages == [
+        GroupByQueryResultsPage(
+            2,
+            [
+                GroupByQueryResult(2, String("it"), []),
+                GroupByQueryResult(1, String("hr"), []),
+            ],
+        )
+    ]
+    assert pages[3] == QueryResultsPage(0, [])
+    assert [relationship.to_entity_id for relationship in engine.orphans] == ["x"]
+
+
+def test_local_query_engine_paging() -> None:
+    engine = LocalQueryEngine(_graph(), 42)
+    ordering = Ordering(StringAnyExpression(_department), Direction.ASC)
+    query = _query("user", _true, [ordering], [], [], [], limit=1, offset=1)
+    [page] = engine.query([query])
+    assert page.count == 3
+    assert [result.entity.id for result in page.results] == ["2"]
+
+
+def test_local_query_engine_mixed_values() -> None:
+    graph = _graph()
+    unknown = AttributeAssignment("age", StringValue("unknown"))
+    entity = Entity([unknown], "4", "user 4", "user")
+    entities = [*graph.entities, entity]
+    mixed_graph = DomainGraph(entities, graph.relationships)
+    engine = LocalQueryEngine(mixed_graph, 42)
+    forty = LiteralNumberExpression(40)
+    conditions = [
+        NumberCmpBooleanExpression(_age, CmpOperator.GTE, forty),
+        NumberCmpBooleanExpression(_age, CmpOperator.EQ, forty),
+        NumberCmpBooleanExpression(forty, CmpOperator.NEQ, _age),
+    ]
+    queries = [_query("user", condition, [], [], [], []) for condition in conditions]
+    pages = engine.query(queries)
+    ids = [[result.entity.id for result in page.results] for page in pages]
+    assert ids == [["2", "3"], ["2"], ["1", "3", "4"]]
+
+
+def test_local_query_engine_unassigned_aggregates() -> None:
+    graph = _graph()
+    entity = Entity([], "4", "user 4", "user")
+    entities = [*graph.entities, entity]
+    relationships = [*graph.relationships, _relationship("4", "r")]
+    unassigned_graph = DomainGraph(entities, relationships)
+    engine = LocalQueryEngine(unassigned_graph, 42)
+    operators = [AggregateOperator.COUNT, AggregateOperator.MIN, AggregateOperator.SUM]
+    include: List[AnyExpression] = [
+        NumberAnyExpression(
+            LinkAggregateNumberExpression("", _true, "user", _age, operator, 42)
+        )
+        for operator in operators
+    ]
+    readers = IdInBooleanExpression(["r"], "")
+    query = _query("group", readers, [], include, [], [])
+    [page] = engine.query([query])
+    [result] = page.results
+    assert result.inclusions == [Number(4), Number(25), Number(125)]
+
+
+def test_local_query_engine_references() -> None:
+    engine = LocalQueryEngine(_graph(), 42)
+    outer_age = AttributeNumberExpression("age", "outer")
+    forty = LiteralNumberExpression(40)
+    old = NumberCmpBooleanExpression(outer_age, CmpOperator.GTE, forty)
+    link_query = _query("user", old, [], [], [], [])
+    queries = [
+        _query("user", old, [], [], [], []),
+        _query("user", _true, [], [NumberAnyExpression(outer_age)], [], []),
+        _query("group", _true, [], [], [link_query], []),
+    ]
+    for query in queries:
+        with raises(ValueError):
+            engine.query([query])
+
+
+def _graph() -> DomainGraph:
+    users = [
+        _entity("1", "user", 25, "hr"),
+        _entity("2", "user", 40, "it"),
+        _entity("3", "user", 60, "it"),
+    ]
+    admins = Entity([AttributeAssignment("name", StringValue("Bar"))], "a", "", "group")
+    readers = Entity([], "r", "", "group")
+    relationships = [
+        _relationship("1", "a"),
+        _relationship("2", "a"),
+        _relationship("2", "r"),
+        _relationship("1", "r"),
+        _relationship("3", "r"),
+        _relationship("3", "x"),
+    ]
+    return DomainGraph([*users, admins, readers], relationships)
+
+
+def _entity(id: str, type: str, age: float, department: str) -> Entity:
+    assignments = [
+        AttributeAssignment("age", NumberValue(age)),
+        AttributeAssignment("department", StringValue(department)),
+    ]
+    return Entity(assignments, id, f"user {id}", type)
+
+
+def _query(
+    entity_type: str,
+    condition: BooleanExpression,
+    order_by: List[Ordering],
+    include: List[AnyExpression],
+    link_queries: List[Query],
+    link_group_by_queries: List[LinkGroupByQuery],
+    limit: int = 10,
+    offset: int = 0,
+    source_id: int = 42,
+) -> Query:
+    return Query(
+        "",
+        condition,
+        [],
+        [],
+        entity_type,
+        include,
+        limit,
+        link_group_by_queries,
+        link_queries,
+        offset,
+        order_by,
+        source_id,
+    )
+
+
+def _relationship(user: str, group: str) -> Relationship:
+    return Relationship([], user, "user", group, "group")
@@ -0,0 +1,20 @@
+from typing import List, Optional, Tuple
+
+from elimity_insights_client.api._revalidating_cache import RevalidatingCache
+
+
+def test_revalidating_cache() -> None:
+    cache: RevalidatingCache[int] = RevalidatingCache()
+    etags: List[Optional[str]] = []
+
+    def fetch(etag: Optional[str]) -> Optional[Tuple[Optional[str], int]]:
+        etags.append(etag)
+        return None if etag == "foo" else ("foo", len(etags))
+
+    assert 1 == cache.get("bar", 0, fetch)
+    assert 1 == cache.get("bar", 60, fetch)
+    assert 1 == cache.get("bar", 60, fetch)
+    assert [None, "foo"] == etags
+    cache.invalidate("bar")
+    assert 3 == cache.get("bar", 60, fetch)
+    assert [None, "foo", None] == etags
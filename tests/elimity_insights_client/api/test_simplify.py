@@ -0,0 +1,72 @@
+from typing import List
+
+from simplejson import dumps
+
+from elimity_insights_client.api._encode_expression import encode_boolean_expression
+from elimity_insights_client.api._simplify import simplify_boolean_expression
+from elimity_insights_client.api.expression import (
+    ActiveBooleanExpression,
+    AllBooleanExpression,
+    AnyBooleanExpression,
+    BooleanExpression,
+    IdInBooleanExpression,
+    LinkedToBooleanExpression,
+    LiteralBooleanExpression,
+    NotBooleanExpression,
+)
+
+
+def test_simplify_boolean_expression() -> None:
+    active: BooleanExpression = ActiveBooleanExpression("foo")
+    ids1: BooleanExpression = IdInBooleanExpression(["a", "b"], "foo")
+    ids2: BooleanExpression = IdInBooleanExpression(["b", "c", "b"], "foo")
+    ids3: BooleanExpression = IdInBooleanExpression(["d"], "bar")
+    true: BooleanExpression = LiteralBooleanExpression(True)
+    double_not: BooleanExpression = NotBooleanExpression(NotBooleanExpression(active))
+    singleton: BooleanExpression = AnyBooleanExpression([ids1])
+    nested_exprs = [ids2, active, ids3]
+    nested: BooleanExpression = AllBooleanExpression(nested_exprs)
+    exprs = [true, double_not, singleton, nested]
+    expr = AllBooleanExpression(exprs)
+    expected_ids = IdInBooleanExpression(["b"], "foo")
+    expected_exprs: List[BooleanExpression] = [active, expected_ids, ids3]
+    expected = AllBooleanExpression(expected_exprs)
+    assert expected == simplify_boolean_expression(expr)
+
+
+def test_simplify_boolean_expression_any() -> None:
+    ids1: BooleanExpression = IdInBooleanExpression(["a", "b"], "foo")
+    ids2: BooleanExpression = IdInBooleanExpression(["b", "c"], "foo")
+    false: BooleanExpression = LiteralBooleanExpression(False)
+    exprs = [ids1, false, ids2]
+    condition = AnyBooleanExpression(exprs)
+    expr = LinkedToBooleanExpression("bar", condition, "baz", 42)
+    expected_condition = IdInBooleanExpression(["a", "b", "c"], "foo")
+    expected = LinkedToBooleanExpression("bar", expected_condition, "baz", 42)
+    assert expected == simplify_boolean_expression(expr)
+
+
+def test_simplify_boolean_expression_constant() -> None:
+    active: BooleanExpression = ActiveBooleanExpression("foo")
+    false: BooleanExpression = LiteralBooleanExpression(False)
+    not_false: BooleanExpression = NotBooleanExpression(false)
+    exprs = [active, not_false]
+    expr = AnyBooleanExpression(exprs)
+    assert LiteralBooleanExpression(True) == simplify_boolean_expression(expr)
+
+
+def test_simplify_boolean_expression_deep() -> None:
+    expr: BooleanExpression = ActiveBooleanExpression("")
+    expected: BooleanExpression = ActiveBooleanExpression("")
+    for level in range(10000):
+        active: BooleanExpression = ActiveBooleanExpression(str(level))
+        any_exprs = [active, expr]
+        any_expected_exprs = [active, expected]
+        all_exprs = [AnyBooleanExpression(any_exprs), active, active]
+        all_expected_exprs = [AnyBooleanExpression(any_expected_exprs), active]
+        expr = AllBooleanExpression(all_exprs)
+        expected = AllBooleanExpression(all_expected_exprs)
+    simplified = simplify_boolean_expression(expr)
+    simplified_json = encode_boolean_expression(simplified)
+    expected_json = encode_boolean_expression(expected)
+    assert dumps(expected_json) == dumps(simplified_json)
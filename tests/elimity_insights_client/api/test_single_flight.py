@@ -0,0 +1,48 @@
+from threading import Event, Thread
+from typing import List
+
+from elimity_insights_client.api._single_flight import SingleFlight, SingleFlightStats
+
+
+def test_single_flight() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+    release = Event()
+    executions: List[int] = []
+    results: List[int] = []
+
+    def func() -> int:
+        release.wait()
+        executions.append(0)
+        return 42
+
+    def target() -> None:
+        result = flight.do("foo", func)
+        results.append(result)
+
+    threads = [Thread(target=target) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    while flight.stats().calls < 10:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert [0] == executions
+    assert [42] * 10 == results
+    assert SingleFlightStats(10, 9) == flight.stats()
+    assert 42 == flight.do("foo", func)
+    assert SingleFlightStats(11, 9) == flight.stats()
+
+
+def test_single_flight_error() -> None:
+    flight: SingleFlight[int] = SingleFlight()
+
+    def func() -> int:
+        raise ValueError("foo")
+
+    try:
+        flight.do("foo", func)
+    except ValueError as error:
+        assert ("foo",) == error.args
+    else:
+        assert False
@@ -0,0 +1,48 @@
+from importlib.resources import read_text
+from json import JSONDecodeError, dumps, loads
+from typing import List
+
+from pytest import raises
+
+from elimity_insights_client.api._decode_query_results_page import (
+    decode_query_results_page,
+)
+from elimity_insights_client.api._stream_query_results_pages import (
+    stream_query_results_pages,
+)
+
+
+def test_stream_query_results_pages() -> None:
+    page_text = read_text(__package__, "query-results-page.json")
+    page_json = loads(page_text)
+    page_json["results"].append(page_json["results"][0])
+    empty_page_json = {"results": [], "count": 0}
+    text = dumps([page_json, empty_page_json, page_json], indent=2)
+    chunks = list(text)
+    page = decode_query_results_page(page_json)
+    expected = [(0, result) for result in page.results]
+    expected += [(2, result) for result in page.results]
+    assert expected == list(stream_query_results_pages(chunks))
+
+
+def test_stream_query_results_pages_large() -> None:
+    page_text = read_text(__package__, "query-results-page.json")
+    page_json = loads(page_text)
+    (result_json,) = page_json["results"]
+    link_result_json = dict(result_json)
+    link_result_json["entity"] = {"active": True, "id": 'a "quoted" \\ id', "name": ""}
+    link_results_json = [link_result_json] * 10000
+    result_json["linkPages"] = [{"count": 10000, "results": link_results_json}]
+    text = dumps([page_json])
+    starts = range(0, len(text), 65536)
+    ends = [*starts[1:], len(text)]
+    chunks = [text[start:end] for start, end in zip(starts, ends)]
+    page = decode_query_results_page(page_json)
+    expected = [(0, result) for result in page.results]
+    assert expected == list(stream_query_results_pages(chunks))
+
+
+def test_stream_query_results_pages_invalid() -> None:
+    chunks: List[str] = ['[{"count": 0, "results": [', '{"entity"']
+    with raises(JSONDecodeError):
+        list(stream_query_results_pages(chunks))
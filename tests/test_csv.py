@@ -1,8 +1,17 @@
+from gzip import open as gzip_open
 from importlib.resources import read_binary, read_text
+from json import loads as json_loads
 from pickle import loads
 from tempfile import TemporaryDirectory
+from typing import List
 
-from elimity_insights_client.csv import write_domain_graph
+from elimity_insights_client._decode_domain_graph_schema import (
+    decode_domain_graph_schema,
+)
+from elimity_insights_client.csv import (
+    write_domain_graph,
+    write_domain_graph_with_schema,
+)
 
 
 def test_csv() -> None:
@@ -18,5 +27,62 @@ def test_csv() -> None:
     assert expected == actual
 
 
+def test_csv_with_schema() -> None:
+    expected = _read_text("graph.csv")
+    graph_file = read_binary(__package__, "graph.pickle")
+    graph = loads(graph_file)
+    schema_file = _read_text("schema.json")
+    schema_dict = json_loads(schema_file)
+    schema = decode_domain_graph_schema(schema_dict)
+    with TemporaryDirectory() as dir:
+        filename = dir + "/graph.csv"
+        write_domain_graph_with_schema(filename, graph, schema)
+        with open(filename) as file:
+            actual = file.read()
+    assert expected == actual
+
+
+def test_csv_sharded() -> None:
+    header, *rows = _read_text("graph.csv").splitlines()
+    graph_file = read_binary(__package__, "graph.pickle")
+    graph = loads(graph_file)
+    schema_file = _read_text("schema.json")
+    with TemporaryDirectory() as dir:
+        filename = dir + "/graph.csv.gz"
+        filenames = write_domain_graph(
+            filename, graph, schema_file, True, 2, shard_size=4
+        )
+        shards = [_read_gzip(filename) for filename in filenames]
+    assert filenames[0] == dir + "/graph-0.csv.gz"
+    assert len(filenames) == (len(rows) + 3) // 4
+    assert [shard[0] for shard in shards] == [header] * len(shards)
+    assert [row for shard in shards for row in shard[1:]] == rows
+
+
+def test_csv_sharded_by_entity_type() -> None:
+    header, *rows = _read_text("graph.csv").splitlines()
+    graph_file = read_binary(__package__, "graph.pickle")
+    graph = loads(graph_file)
+    schema_file = _read_text("schema.json")
+    with TemporaryDirectory() as dir:
+        filename = dir + "/graph.csv"
+        filenames = write_domain_graph(
+            filename, graph, schema_file, shard_by_entity_type=True
+        )
+        shards = []
+        for filename in filenames:
+            with open(filename) as file:
+                shards.append(file.read().splitlines())
+    types = {entity.type for entity in graph.entities}
+    assert sorted(filenames) == sorted(f"{dir}/graph-{type}.csv" for type in types)
+    assert [shard[0] for shard in shards] == [header] * len(shards)
+    assert sorted(row for shard in shards for row in shard[1:]) == sorted(rows)
+
+
+def _read_gzip(filename: str) -> List[str]:
+    with gzip_open(filename, "rt", newline="") as file:
+        return file.read().split("\r\n")[:-1]
+
+
 def _read_text(filename: str) -> str:
     return read_text(__package__, filename)
@@ -1,15 +1,19 @@
+from asyncio import run
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from json import loads
 from threading import Thread
-from typing import Iterator, List
+from typing import AsyncIterator, Iterable, Iterator, List
 from typing import Type as TypingType
+from typing import TypeVar
 from unittest import TestCase
 from zlib import decompress
 
 from elimity_insights_client import (
+    AsyncClient,
+    AsyncDomainGraph,
     AttributeAssignment,
     AttributeType,
     BooleanValue,
@@ -32,6 +36,8 @@ from elimity_insights_client import (
     Type,
 )
 
+_T = TypeVar("_T")
+
 
 class TestClient(TestCase):
     def test_authentication(self) -> None:
@@ -80,6 +86,83 @@ class TestClient(TestCase):
             actual = client.get_domain_graph_schema()
         self.assertEqual(expected, actual)
 
+    def test_async_get_domain_graph_schema(self) -> None:
+        async def main(client: AsyncClient) -> DomainGraphSchema:
+            async with client:
+                return await client.get_domain_graph_schema()
+
+        with _create_client(_GetDomainGraphSchemaHandler) as client:
+            expected = client.get_domain_graph_schema()
+            async_client = AsyncClient(client._config)
+            actual = run(main(async_client))
+        self.assertEqual(expected, actual)
+
+    def test_async_reload_domain_graph(self) -> None:
+        graph = DomainGraph(
+            entities=[
+                Entity(
+                    attribute_assignments=[
+                        AttributeAssignment(
+                            attribute_type_id="foo", value=BooleanValue(True)
+                        ),
+                        AttributeAssignment(
+                            attribute_type_id="bar",
+                            value=DateValue(2006, 1, 2),
+                        ),
+                        AttributeAssignment(
+                            attribute_type_id="baq",
+                            value=DateTimeValue(DateTime(2006, 1, 2, 12, 4, 5)),
+                        ),
+                        AttributeAssignment(
+                            attribute_type_id="baw", value=NumberValue(99)
+                        ),
+                        AttributeAssignment(
+                            attribute_type_id="bae", value=StringValue("bae string")
+                        ),
+                    ],
+                    id="foo",
+                    name="bar",
+                    type="baz",
+                ),
+                Entity(
+                    attribute_assignments=[
+                        AttributeAssignment(
+                            attribute_type_id="baz",
+                            value=TimeValue(15, 4, 5),
+                        )
+                    ],
+                    id="bar",
+                    name="baz",
+                    type="foo",
+                ),
+            ],
+            relationships=[
+                Relationship(
+                    attribute_assignments=[
+                        AttributeAssignment(
+                            attribute_type_id="foo", value=StringValue("bar")
+                        ),
+                    ],
+                    from_entity_id="foo",
+                    from_entity_type="baz",
+                    to_entity_id="bar",
+                    to_entity_type="foo",
+                )
+            ],
+            timestamp=DateTime(2001, 2, 3, 4, 5, 6),
+        )
+
+        async def main(client: AsyncClient) -> None:
+            entities = _async_iter(graph.entities)
+            relationships = _async_iter(graph.relationships)
+            async_graph = AsyncDomainGraph(entities, relationships, graph.timestamp)
+            async with client:
+                await client.reload_domain_graph(async_graph)
+
+        with _create_client(_ReloadDomainGraphHandler) as client:
+            async_client = AsyncClient(client._config, batch_size=1)
+            run(main(async_client))
+
     def test_reload_domain_graph(self) -> None:
         graph = DomainGraph(
             entities=[
@@ -138,6 +221,11 @@ class TestClient(TestCase):
             client.reload_domain_graph(graph)
 
 
+async def _async_iter(iterable: Iterable[_T]) -> AsyncIterator[_T]:
+    for item in iterable:
+        yield item
+
+
 @contextmanager
 def _create_client(
     handler_class: TypingType[BaseHTTPRequestHandler],
@@ -363,6 +451,16 @@ class _ReloadDomainGraphHandler(BaseHTTPRequestHandler):
 
 
 def _read(handler: BaseHTTPRequestHandler) -> bytes:
+    if handler.headers["Transfer-Encoding"] == "chunked":
+        chunks: List[bytes] = []
+        while True:
+            size_line = handler.rfile.readline()
+            size = int(size_line, 16)
+            chunk = handler.rfile.read(size + 2)
+            if size == 0:
+                return b"".join(chunks)
+            chunks.append(chunk[:-2])
+
     content_length_string = handler.headers["Content-Length"]
     content_length = int(content_length_string)
     return handler.rfile.read(content_length)
@@ -0,0 +1,26 @@
+from elimity_insights_client._domain_graph_schema import (
+    AttributeType,
+    DomainGraphSchema,
+    EntityType,
+    Type,
+)
+from elimity_insights_client._schema_index import schema_index
+
+
+def test_schema_index() -> None:
+    archived_type = AttributeType(True, "", "foo", "bar", "", Type.STRING)
+    attribute_type = AttributeType(False, "", "foo", "baz", "", Type.NUMBER)
+    attribute_types = [archived_type, attribute_type]
+    foo_type = EntityType(False, "", "foo", "", "")
+    bar_type = EntityType(False, "", "bar", "", "")
+    entity_types = [foo_type, bar_type]
+    schema = DomainGraphSchema(attribute_types, entity_types, [])
+    other_schema = DomainGraphSchema([], [foo_type], [])
+    schemas = {24: other_schema, 42: schema}
+    index = schema_index(schemas)
+    assert {(42, "foo", "bar"): 6, (42, "foo", "baz"): 7} == index.attribute_columns
+    assert {(42, "foo"): [attribute_type]} == index.attribute_types
+    assert 8 == index.column_count
+    assert {(24, "foo"): 0, (42, "foo"): 2, (42, "bar"): 4} == index.entity_columns
+    assert [(24, "foo"), (42, "foo"), (42, "bar")] == index.entity_types
+    assert index is schema_index(dict(schemas))